@@ -0,0 +1,97 @@
+"""Bulk status updates for Construction Reporting category sheets.
+
+A bulk update is a frame of ``Tag`` / ``Column`` / ``Value`` rows, from a
+multi-select on the page or an uploaded CSV. It is checked against the cached
+category frame column-wise (tag membership, header lookup, duplicate cells) and
+turned into the ``{tag: {column: value}}`` mapping that
+``GoogleSheetsManager.update_rows_by_key`` writes in one values:batchUpdate.
+"""
+from typing import Dict, IO, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from app.construction.registry import CATEGORIES, resolve
+
+BULK_COLUMNS = ["Tag", "Column", "Value"]
+
+
+def _clean(values: pd.Series) -> pd.Series:
+    text = values.astype(object).where(values.notna(), "").astype(str).str.strip()
+    return text.mask(text.str.lower().isin({"nan", "none"}), "")
+
+
+def read_bulk_csv(source: Union[str, IO]) -> pd.DataFrame:
+    """Read a tag/column/value CSV (headers matched case-insensitively) as text.
+
+    Raises ``ValueError`` when one of the three columns is missing.
+    """
+    raw = pd.read_csv(source, dtype=str, keep_default_na=False)
+    by_name = {str(col).strip().lower(): col for col in raw.columns}
+    missing = [name for name in BULK_COLUMNS if name.lower() not in by_name]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}. Expected Tag, Column, Value.")
+    return raw[[by_name[name.lower()] for name in BULK_COLUMNS]].set_axis(BULK_COLUMNS, axis=1)
+
+
+def updates_for_tags(tags: List[str], column: str, value: object) -> pd.DataFrame:
+    """The same ``column`` = ``value`` change for every tag in ``tags``."""
+    return pd.DataFrame({"Tag": list(tags), "Column": column, "Value": "" if value is None else str(value)}, columns=BULK_COLUMNS)
+
+
+def validate_bulk_updates(sheet_df: pd.DataFrame, updates: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split ``updates`` into rows that can be written and rows with a ``Problem``.
+
+    Tags must exist in the first column of ``sheet_df``; columns are matched to
+    its headers ignoring case and surrounding spaces, and the tag column itself
+    cannot be edited. When a tag/column pair appears more than once the last
+    row wins and the earlier ones are reported.
+    """
+    if sheet_df.empty or updates.empty:
+        empty = pd.DataFrame(columns=BULK_COLUMNS)
+        return empty, pd.DataFrame(columns=BULK_COLUMNS + ["Problem"])
+
+    headers = [str(col).strip() for col in sheet_df.columns]
+    tag_column = headers[0]
+    tags = pd.Index(_clean(sheet_df.iloc[:, 0]))
+    header_lookup = pd.Series(headers, index=[name.lower() for name in headers])
+    header_lookup = header_lookup[~header_lookup.index.duplicated()]
+
+    frame = pd.DataFrame({name: _clean(updates[name]) for name in BULK_COLUMNS})
+    frame["Column"] = frame["Column"].str.lower().map(header_lookup).fillna(frame["Column"])
+
+    problem = pd.Series("", index=frame.index)
+    problem = problem.mask(frame["Tag"].eq(""), "Missing tag")
+    problem = problem.mask(problem.eq("") & ~frame["Tag"].isin(tags), "Tag not found in sheet")
+    problem = problem.mask(problem.eq("") & ~frame["Column"].isin(headers), "Column not found in sheet")
+    problem = problem.mask(problem.eq("") & frame["Column"].eq(tag_column), "Tag column cannot be updated")
+    superseded = problem.eq("") & frame.duplicated(subset=["Tag", "Column"], keep="last")
+    problem = problem.mask(superseded, "Superseded by a later row")
+
+    ok = problem.eq("")
+    problems = frame[~ok].assign(Problem=problem[~ok])
+    return frame[ok].reset_index(drop=True), problems.reset_index(drop=True)
+
+
+def bulk_payload(
+    valid: pd.DataFrame,
+    headers: List[str],
+    category: str,
+    user: Optional[str] = None,
+) -> Dict[str, Dict[str, str]]:
+    """``{tag: {column: value}}`` for ``update_rows_by_key``, with sign-offs filled in.
+
+    Writing a date column stamps ``user`` into its sign-off column and clearing
+    it clears the sign-off, as the single-tag forms do; a sign-off shared by
+    several date columns is stamped when any of the written dates is set.
+    """
+    signoffs = resolve(category, headers).signoffs if category in CATEGORIES else ()
+    payload: Dict[str, Dict[str, str]] = {}
+    for tag, group in valid.groupby("Tag", sort=False):
+        changes = dict(zip(group["Column"], group["Value"]))
+        if user is not None:
+            for signoff, dates in signoffs:
+                written = [changes[column] for column in dates if column in changes]
+                if written and signoff not in changes:
+                    changes[signoff] = user if any(written) else ""
+        payload[str(tag)] = changes
+    return payload
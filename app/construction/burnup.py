@@ -0,0 +1,125 @@
+"""Cumulative completion (burn-up) curves for the Construction Reporting categories.
+
+A row is complete on the latest of its category's progress dates, once every
+one of them is filled in. Rows are grouped by that day and by the sheet's area
+column (the first header mentioning "area"; "All" when the sheet has none and
+"Unassigned" for blank areas), and the daily counts are summed cumulatively
+per area. Each category's series is cached per sheet generation, so a report
+over all ten sheets only recomputes the ones whose content changed.
+"""
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from app.construction.progress import parse_days
+from app.construction.registry import CATEGORIES
+
+ALL_AREAS = "All"
+UNASSIGNED = "Unassigned"
+SERIES_COLUMNS = ["Category", "Area", "Date", "Completed", "Cumulative"]
+
+
+@dataclass
+class CategorySeries:
+    generation: str
+    total: int  # rows with a tag, complete or not
+    series: pd.DataFrame  # SERIES_COLUMNS, one row per area and completion day
+
+
+_series: Dict[str, CategorySeries] = {}
+
+
+def area_column(headers: Sequence[str]) -> Optional[str]:
+    """The first header mentioning "area" (case-insensitive), ignoring the tag column."""
+    for header in list(headers)[1:]:
+        if "area" in str(header).lower():
+            return header
+    return None
+
+
+def completion_days(df: pd.DataFrame, category: str) -> pd.Series:
+    """Day each row was completed (NaT while any of its progress dates is missing)."""
+    schema = CATEGORIES.get(category)
+    positions = [idx for idx in (schema.progress if schema else ()) if idx < df.shape[1]]
+    if not positions:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    parsed = pd.concat([parse_days(df.iloc[:, position]) for position in positions], axis=1)
+    return parsed.max(axis=1, skipna=False)
+
+
+def _text(values: pd.Series) -> pd.Series:
+    return values.astype(object).where(values.notna(), "").astype(str).str.strip()
+
+
+def build_category_series(df: pd.DataFrame, category: str, generation: str = "") -> CategorySeries:
+    headers = [str(col).strip() for col in df.columns]
+    tagged = _text(df.iloc[:, 0]).ne("") if headers else pd.Series(False, index=df.index)
+    area = area_column(headers)
+    if area is None:
+        areas = pd.Series(ALL_AREAS, index=df.index)
+    else:
+        areas = _text(df.iloc[:, headers.index(area)])
+        areas = areas.mask(areas.eq(""), UNASSIGNED)
+    frame = pd.DataFrame({"Area": areas, "Date": completion_days(df, category)})[tagged]
+    daily = frame.dropna(subset=["Date"]).groupby(["Area", "Date"], sort=True).size().rename("Completed").reset_index()
+    daily["Cumulative"] = daily.groupby("Area")["Completed"].cumsum()
+    daily.insert(0, "Category", category)
+    return CategorySeries(generation, int(tagged.sum()), daily[SERIES_COLUMNS])
+
+
+def category_series(df: pd.DataFrame, category: str, generation: str) -> CategorySeries:
+    """Cached ``CategorySeries`` for ``category``, rebuilt when ``generation`` changes (never cached for "")."""
+    cached = _series.get(category)
+    if generation and cached is not None and cached.generation == generation:
+        return cached
+    built = build_category_series(df, category, generation)
+    if generation:
+        _series[category] = built
+    return built
+
+
+@dataclass
+class BurnupReport:
+    series: pd.DataFrame  # SERIES_COLUMNS for every category
+    summary: pd.DataFrame  # Date plus the cumulative completions of each category
+    totals: Dict[str, int]  # tagged rows per category
+
+
+def burnup_report(frames: Mapping[str, Tuple[pd.DataFrame, str]]) -> BurnupReport:
+    """Burn-up report for ``{category: (sheet frame, generation)}``.
+
+    The summary has one row per calendar day between the first and last
+    completion, with each category's cumulative count carried forward over
+    days without progress.
+    """
+    built = {category: category_series(df, category, generation) for category, (df, generation) in frames.items()}
+    totals = {category: entry.total for category, entry in built.items()}
+    parts = [entry.series for entry in built.values() if not entry.series.empty]
+    if not parts:
+        return BurnupReport(pd.DataFrame(columns=SERIES_COLUMNS), pd.DataFrame(columns=["Date", *built]), totals)
+    series = pd.concat(parts, ignore_index=True)
+    daily = series.pivot_table(index="Date", columns="Category", values="Completed", aggfunc="sum", fill_value=0)
+    days = pd.date_range(daily.index.min(), daily.index.max(), freq="D", name="Date")
+    summary = daily.reindex(days, fill_value=0).reindex(columns=list(built), fill_value=0).cumsum()
+    summary.columns.name = None
+    return BurnupReport(series, summary.reset_index(), totals)
+
+
+def burnup_workbook(report: BurnupReport) -> bytes:
+    """The report's summary, per-area series and category totals as one workbook."""
+    def dated(frame: pd.DataFrame) -> pd.DataFrame:
+        out = frame.copy()
+        out["Date"] = pd.to_datetime(out["Date"]).dt.date
+        return out
+
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        dated(report.summary).to_excel(writer, sheet_name="Burn-up", index=False)
+        dated(report.series).to_excel(writer, sheet_name="By Area", index=False)
+        totals = pd.DataFrame({"Category": list(report.totals), "Rows": list(report.totals.values())})
+        totals["Completed"] = [int(report.summary[name].iloc[-1]) if len(report.summary) else 0 for name in report.totals]
+        totals.to_excel(writer, sheet_name="Totals", index=False)
+    buffer.seek(0)
+    return buffer.getvalue()
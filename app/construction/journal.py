@@ -0,0 +1,285 @@
+"""Local journal of Construction Reporting status updates.
+
+Saving a status form records the change in a SQLite journal and returns; a
+background worker then writes journaled changes to Google Sheets in batches
+(one ``write_rows_by_key`` call per sheet), retrying with backoff when Sheets
+is slow, rate limited or unreachable. Until a change is written, the page
+shows it by overlaying pending entries on the sheet frame it read, so a poor
+site connection never loses or blocks an update.
+
+An entry is ``pending`` until written (then deleted) or ``failed`` once it
+runs out of attempts or names a tag, column or sheet that does not exist.
+Failed entries stay in the journal until they are retried or discarded.
+
+Entries for a tag are written strictly in the order they were recorded: while
+an earlier entry is backing off, later ones for the same tag wait behind it,
+so a retry can never overwrite a newer value. Once a newer value is written,
+older failed entries drop the columns it covered (they are superseded).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from app.integrations.google_sheets import GENERATION_ATTR, frame_generation, get_sheets_manager
+
+APP_DATA_DIR = Path(
+    os.getenv("TIMESHEET_DATA_DIR", "")
+    or Path(os.getenv("LOCALAPPDATA", "") or Path.home() / ".local" / "share") / "timesheet"
+)
+JOURNAL_PATH = Path(os.getenv("CONSTRUCTION_JOURNAL_PATH", "") or APP_DATA_DIR / "construction-journal.sqlite3")
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 8
+RETRY_BASE_SECONDS = 2.0
+RETRY_MAX_SECONDS = 300.0
+POLL_SECONDS = 5.0
+
+PENDING = "pending"
+FAILED = "failed"
+
+# (sheet, key column, {tag: {column: value}}, spreadsheet id); raises when the write fails
+Writer = Callable[[str, str, Dict[str, Dict[str, str]], str], None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS updates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sheet TEXT NOT NULL,
+    spreadsheet_id TEXT NOT NULL,
+    key_column TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL,
+    next_attempt REAL NOT NULL
+)
+"""
+
+
+def _backoff(attempts: int) -> float:
+    return min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1))
+
+
+class UpdateJournal:
+    def __init__(self, path: Union[str, os.PathLike] = JOURNAL_PATH, writer: Optional[Writer] = None):
+        self.path = Path(path)
+        self.writer = writer
+        self._lock = threading.Lock()
+        self._draining = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection committed on success, rolled back on error and always closed."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, sheet: str, key_column: str, tag: str, payload: Dict[str, str], spreadsheet_id: str) -> int:
+        """Journal one tag's ``{column: value}`` changes and wake the worker; returns the entry id."""
+        return self.record_many(sheet, key_column, {tag: payload}, spreadsheet_id)[0]
+
+    def record_many(self, sheet: str, key_column: str, updates: Dict[str, Dict[str, str]], spreadsheet_id: str) -> List[int]:
+        """Journal ``{tag: {column: value}}`` in one transaction and wake the worker; returns the entry ids."""
+        now = time.time()
+        entry_ids = []
+        with self._lock, self._connect() as conn:
+            for tag, payload in updates.items():
+                cursor = conn.execute(
+                    "INSERT INTO updates (sheet, spreadsheet_id, key_column, tag, payload, status, created, next_attempt)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (sheet, spreadsheet_id, key_column, str(tag).strip(), json.dumps(payload), PENDING, now, now),
+                )
+                entry_ids.append(cursor.lastrowid)
+        self._wake.set()
+        return entry_ids
+
+    def entries(self, status: Optional[str] = None, sheet: Optional[str] = None) -> List[dict]:
+        """Journaled entries in the order they were recorded."""
+        query, args = "SELECT * FROM updates WHERE 1=1", []
+        if status:
+            query, args = query + " AND status = ?", args + [status]
+        if sheet:
+            query, args = query + " AND sheet = ?", args + [sheet]
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY id", args).fetchall()
+        return [dict(row, payload=json.loads(row["payload"])) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            found = dict(conn.execute("SELECT status, COUNT(*) FROM updates GROUP BY status").fetchall())
+        return {PENDING: found.get(PENDING, 0), FAILED: found.get(FAILED, 0)}
+
+    def retry_failed(self) -> int:
+        with self._lock, self._connect() as conn:
+            changed = conn.execute(
+                "UPDATE updates SET status = ?, attempts = 0, error = '', next_attempt = ? WHERE status = ?",
+                (PENDING, time.time(), FAILED),
+            ).rowcount
+        self._wake.set()
+        return changed
+
+    def discard_failed(self) -> int:
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM updates WHERE status = ?", (FAILED,)).rowcount
+
+    def overlay(self, sheet: str, df: pd.DataFrame) -> pd.DataFrame:
+        """``df`` with ``sheet``'s pending changes applied to the first row of each tag.
+
+        The result carries its own generation (the sheet's plus the pending
+        entries), so caches keyed by generation see the optimistic rows.
+        """
+        pending = self.entries(PENDING, sheet) if not df.empty else []
+        if not pending:
+            return df
+        out = df.copy()
+        headers = [str(col).strip() for col in out.columns]
+        tags = out.iloc[:, 0].astype(object).where(out.iloc[:, 0].notna(), "").astype(str).str.strip()
+        first = tags.reset_index(drop=True)
+        first = first[~first.duplicated()]
+        first_row = dict(zip(first.tolist(), first.index.tolist()))
+        for entry in pending:
+            row = first_row.get(entry["tag"])
+            if row is None:
+                continue
+            for column, value in entry["payload"].items():
+                if column in headers:
+                    out.iat[row, headers.index(column)] = value
+        base = frame_generation(df)
+        ids = ",".join(str(entry["id"]) for entry in pending)
+        out.attrs[GENERATION_ATTR] = f"{base}+{hashlib.sha1(ids.encode('utf-8')).hexdigest()[:8]}" if base else ""
+        return out
+
+    def drain(self, now: Optional[float] = None) -> int:
+        """Write up to ``BATCH_SIZE`` due entries per sheet; returns how many were written.
+
+        An entry is only taken once every earlier pending entry for its tag is
+        taken too, so a tag's changes reach the sheet in the order recorded.
+        """
+        if self.writer is None:
+            return 0
+        now = time.time() if now is None else now
+        with self._draining:
+            with self._connect() as conn:
+                pending = conn.execute("SELECT * FROM updates WHERE status = ? ORDER BY id", (PENDING,)).fetchall()
+            batches: Dict[tuple, List[sqlite3.Row]] = {}
+            held = set()
+            for row in pending:
+                sheet = (row["sheet"], row["spreadsheet_id"], row["key_column"])
+                batch = batches.setdefault(sheet, [])
+                if (sheet, row["tag"]) in held or row["next_attempt"] > now or len(batch) >= BATCH_SIZE:
+                    held.add((sheet, row["tag"]))  # later entries for the tag wait behind this one
+                    continue
+                batch.append(row)
+            written = 0
+            for (sheet, spreadsheet_id, key_column), rows in batches.items():
+                if rows:
+                    written += self._write_batch(sheet, spreadsheet_id, key_column, rows, now)
+            return written
+
+    def _write_batch(self, sheet: str, spreadsheet_id: str, key_column: str, rows: List[sqlite3.Row], now: float) -> int:
+        merged: Dict[str, Dict[str, str]] = {}
+        for row in rows:  # later entries for a tag win column by column
+            merged.setdefault(row["tag"], {}).update(json.loads(row["payload"]))
+        try:
+            self.writer(sheet, key_column, merged, spreadsheet_id)
+        except LookupError as exc:
+            if len(merged) > 1:
+                # One unknown tag or column fails the whole request; write the tags one at a time instead.
+                by_tag: Dict[str, List[sqlite3.Row]] = {}
+                for row in rows:
+                    by_tag.setdefault(row["tag"], []).append(row)
+                return sum(self._write_batch(sheet, spreadsheet_id, key_column, group, now) for group in by_tag.values())
+            self._settle(rows, str(exc), now, give_up=True)
+            return 0
+        except Exception as exc:
+            self._settle(rows, str(exc) or exc.__class__.__name__, now)
+            return 0
+        with self._lock, self._connect() as conn:
+            conn.executemany("DELETE FROM updates WHERE id = ?", [(row["id"],) for row in rows])
+            self._supersede(conn, sheet, spreadsheet_id, key_column, merged, rows)
+        return len(rows)
+
+    def _supersede(
+        self, conn: sqlite3.Connection, sheet: str, spreadsheet_id: str, key_column: str,
+        written: Dict[str, Dict[str, str]], rows: List[sqlite3.Row],
+    ) -> None:
+        """Drop the just-written columns from older failed entries, so retrying them cannot revert the sheet."""
+        newest = {}
+        for row in rows:
+            newest[row["tag"]] = max(newest.get(row["tag"], 0), row["id"])
+        for tag, changes in written.items():
+            older = conn.execute(
+                "SELECT id, payload FROM updates WHERE status = ? AND sheet = ? AND spreadsheet_id = ?"
+                " AND key_column = ? AND tag = ? AND id < ?",
+                (FAILED, sheet, spreadsheet_id, key_column, tag, newest[tag]),
+            ).fetchall()
+            for row in older:
+                payload = {col: val for col, val in json.loads(row["payload"]).items() if col not in changes}
+                if payload:
+                    conn.execute("UPDATE updates SET payload = ? WHERE id = ?", (json.dumps(payload), row["id"]))
+                else:
+                    conn.execute("DELETE FROM updates WHERE id = ?", (row["id"],))
+
+    def _settle(self, rows: List[sqlite3.Row], error: str, now: float, give_up: bool = False) -> None:
+        """Schedule a retry for a failed write, or mark the entries failed once out of attempts."""
+        with self._lock, self._connect() as conn:
+            for row in rows:
+                attempts = row["attempts"] + 1
+                status = FAILED if give_up or attempts >= MAX_ATTEMPTS else PENDING
+                conn.execute(
+                    "UPDATE updates SET status = ?, attempts = ?, error = ?, next_attempt = ? WHERE id = ?",
+                    (status, attempts, error, now + _backoff(attempts), row["id"]),
+                )
+
+    def start(self) -> None:
+        """Run ``drain`` on a daemon thread until the process exits (once per journal)."""
+        with self._lock:
+            if self._thread is not None or self.writer is None:
+                return
+            self._thread = threading.Thread(target=self._run, name="construction-journal", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(POLL_SECONDS)
+            self._wake.clear()
+            try:
+                while self.drain():
+                    pass
+            except Exception:
+                pass  # the journal is untouched; the next wake-up tries again
+
+
+def _write_to_sheets(sheet: str, key_column: str, updates: Dict[str, Dict[str, str]], spreadsheet_id: str) -> None:
+    get_sheets_manager().write_rows_by_key(sheet, key_column, updates, spreadsheet_id, value_input_option="USER_ENTERED")
+
+
+_journal: Optional[UpdateJournal] = None
+_journal_lock = threading.Lock()
+
+
+def get_update_journal() -> UpdateJournal:
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = UpdateJournal(writer=_write_to_sheets)
+            _journal.start()
+        return _journal
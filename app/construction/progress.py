@@ -0,0 +1,96 @@
+"""Completion-date index over the Construction Reporting progress columns.
+
+A row counts as completed on a day when any of its category's progress date
+columns (``CategorySchema.progress``) falls on that day. The columns are parsed
+once per sheet generation into a day-sorted array of row positions, so "what was
+completed on X" and "how much between X and Y" are binary searches instead of a
+``pd.to_datetime`` pass over every column for every question.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.construction.registry import CATEGORIES
+
+
+@dataclass
+class ProgressIndex:
+    generation: str
+    days: np.ndarray  # datetime64[D], sorted, one entry per (day, row) completion
+    rows: np.ndarray  # 0-based row positions aligned with ``days``
+
+    def _span(self, start: date, end: Optional[date] = None) -> slice:
+        first = np.searchsorted(self.days, np.datetime64(start, "D"), side="left")
+        last = np.searchsorted(self.days, np.datetime64(end or start, "D"), side="right")
+        return slice(first, max(first, last))
+
+    def rows_between(self, start: date, end: Optional[date] = None) -> np.ndarray:
+        """Sorted positions of the rows completed from ``start`` to ``end`` inclusive (``end`` defaults to ``start``)."""
+        return np.unique(self.rows[self._span(start, end)])
+
+    def rows_on(self, day: date) -> np.ndarray:
+        return self.rows_between(day)
+
+    def count_between(self, start: date, end: Optional[date] = None) -> int:
+        return int(self.rows_between(start, end).size)
+
+    def count_on(self, day: date) -> int:
+        span = self._span(day)
+        return span.stop - span.start
+
+    def daily_counts(self) -> pd.Series:
+        """Rows completed per day, indexed by day."""
+        days, counts = np.unique(self.days, return_counts=True)
+        return pd.Series(counts, index=pd.DatetimeIndex(days, name="Date"), name="Completed")
+
+
+_progress: Dict[str, ProgressIndex] = {}
+
+
+def parse_days(values: pd.Series) -> pd.Series:
+    parsed = pd.to_datetime(values, errors="coerce")
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_localize(None)
+    return parsed.dt.normalize()
+
+
+def build_progress_index(df: pd.DataFrame, category: str, generation: str = "") -> ProgressIndex:
+    schema = CATEGORIES.get(category)
+    positions = [idx for idx in (schema.progress if schema else ()) if idx < df.shape[1]]
+    days, rows = [], []
+    row_numbers = np.arange(len(df))
+    for position in positions:
+        parsed = parse_days(df.iloc[:, position])
+        found = parsed.notna().to_numpy()
+        days.append(parsed.to_numpy()[found].astype("datetime64[D]"))
+        rows.append(row_numbers[found])
+    if not days:
+        return ProgressIndex(generation, np.array([], dtype="datetime64[D]"), np.array([], dtype=np.int64))
+    pairs = pd.DataFrame({"day": np.concatenate(days), "row": np.concatenate(rows)})
+    # A row whose progress columns share a day is completed once that day.
+    pairs = pairs.drop_duplicates().sort_values(["day", "row"], kind="stable")
+    return ProgressIndex(generation, pairs["day"].to_numpy().astype("datetime64[D]"), pairs["row"].to_numpy())
+
+
+def progress_index(df: pd.DataFrame, category: str, generation: str) -> ProgressIndex:
+    """Cached ``ProgressIndex`` for ``category``, rebuilt when ``generation`` changes (never cached for "")."""
+    cached = _progress.get(category)
+    if generation and cached is not None and cached.generation == generation:
+        return cached
+    index = build_progress_index(df, category, generation)
+    if generation:
+        _progress[category] = index
+    return index
+
+
+def completion_counts(indexes: Mapping[str, ProgressIndex], start: date, end: Optional[date] = None) -> pd.DataFrame:
+    """Rows completed per category from ``start`` to ``end`` (one day when ``end`` is omitted)."""
+    return pd.DataFrame(
+        {
+            "Category": list(indexes),
+            "Completed": [index.count_between(start, end) for index in indexes.values()],
+        }
+    )
@@ -0,0 +1,202 @@
+"""Construction Reporting category registry.
+
+Each category sheet is described once by column position: the tag column, the
+detail block shown read-only, the status fields the update form edits (and
+which of them are dates), the sign-off columns stamped when a date is entered,
+the status columns that make a row complete, and the progress date columns.
+``resolve`` turns a schema into header names against a sheet's actual headers;
+the result is cached per header row, so the page renders every category from
+the same precomputed projection instead of per-category slicing code.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# How the current value of a status field is shown in the form:
+# "fields" formats only the date fields as YYYY-MM-DD, "header" also any field
+# whose header mentions a date, and "any" every value that parses as a date.
+DISPLAY_FIELDS = "fields"
+DISPLAY_HEADER = "header"
+DISPLAY_ANY = "any"
+
+
+@dataclass(frozen=True, eq=False)
+class CategorySchema:
+    name: str
+    noun: str  # used mid-sentence: "Unable to locate details for the selected {noun} tag."
+    title: str  # used in headings: "{title} Details", "Update {title} Status"
+    toggle_label: str
+    toggle_help: str
+    detail: Tuple[int, int]  # [start, stop)
+    fields: Tuple[int, ...]
+    date_fields: Tuple[int, ...] = ()
+    # {sign-off column: date columns}; the sign-off is stamped when any of the submitted dates is set
+    signoffs: Dict[int, Tuple[int, ...]] = field(default_factory=dict)
+    status: Tuple[int, int] = (0, 0)  # [start, stop) columns that must all be filled for a complete row
+    progress: Tuple[int, ...] = ()
+    display_dates: str = DISPLAY_FIELDS
+    header_date_inputs: bool = False  # headers mentioning a date also get a date picker
+    date_default_today: bool = False  # empty date pickers start on today instead of blank
+    key_prefix: str = ""
+
+    @property
+    def slug(self) -> str:
+        return self.name.lower().replace(" ", "_")
+
+    @property
+    def toggle_key(self) -> str:
+        return f"{self.slug}_only_incomplete_toggle"
+
+
+CATEGORIES: Dict[str, CategorySchema] = {
+    schema.name: schema
+    for schema in (
+        CategorySchema(
+            name="Cable", noun="cable", title="Cable",
+            toggle_label="Only Show Incomplete Cables",
+            toggle_help="Filter to cables missing Date Pulled or Checked By.",
+            detail=(1, 13), fields=(13, 14, 15), date_fields=(14,),
+            signoffs={16: (13,)}, status=(12, 15), progress=(13,),
+            display_dates=DISPLAY_HEADER, date_default_today=True, key_prefix="cable_update",
+        ),
+        CategorySchema(
+            name="Glands", noun="gland", title="Gland",
+            toggle_label="Only Show Incomplete Glands",
+            toggle_help="Filter to glands missing status fields.",
+            detail=(1, 6), fields=(6, 7, 8), date_fields=(6, 7),
+            signoffs={9: (6,), 10: (7,)}, status=(5, 10), progress=(5, 6),
+            key_prefix="gland_update",
+        ),
+        CategorySchema(
+            name="Terminations", noun="termination", title="Termination",
+            toggle_label="Only Show Incomplete Terminations",
+            toggle_help="Filter to terminations missing completion dates.",
+            detail=(1, 8), fields=(8, 9, 10), date_fields=(8, 9),
+            signoffs={11: (8,), 12: (9,)}, status=(7, 9), progress=(7, 8),
+            display_dates=DISPLAY_ANY, key_prefix="termination_update",
+        ),
+        CategorySchema(
+            name="Tray", noun="tray", title="Tray",
+            toggle_label="Only Show Incomplete Tray",
+            toggle_help="Filter to trays missing completion fields.",
+            detail=(1, 10), fields=(10, 11, 12, 13, 14), date_fields=(11, 13),
+            signoffs={15: (11,), 16: (13,)}, status=(10, 15), progress=(11, 13),
+            display_dates=DISPLAY_HEADER, header_date_inputs=True, key_prefix="tray_update",
+        ),
+        CategorySchema(
+            name="Equipment", noun="equipment", title="Equipment",
+            toggle_label="Only Show Incomplete Equipment",
+            toggle_help="Filter to equipment missing status fields.",
+            detail=(1, 8), fields=(8, 9),
+            signoffs={10: (8,)}, status=(8, 9), progress=(7,),
+            display_dates=DISPLAY_HEADER, header_date_inputs=True, key_prefix="equipment_update",
+        ),
+        CategorySchema(
+            name="Junction Boxes", noun="junction box", title="Junction Box",
+            toggle_label="Only Show Incomplete Junction Boxes",
+            toggle_help="Filter to junction boxes missing status fields.",
+            detail=(1, 7), fields=(7, 8),
+            signoffs={9: (7,)}, status=(7, 8), progress=(7,),
+            display_dates=DISPLAY_HEADER, header_date_inputs=True, key_prefix="junction_box_update",
+        ),
+        CategorySchema(
+            name="Instruments", noun="Instruments", title="Instruments",
+            toggle_label="Only Show Incomplete Instruments",
+            toggle_help="Filter to instruments missing completion fields.",
+            detail=(1, 7), fields=(7, 8), date_fields=(7,),
+            signoffs={9: (7,)}, status=(7, 9), progress=(7,),
+            key_prefix="instruments_update",
+        ),
+        CategorySchema(
+            name="Tubing", noun="Tubing", title="Tubing",
+            toggle_label="Only Show Incomplete Tubing",
+            toggle_help="Filter to tubing entries missing completion fields.",
+            detail=(1, 6), fields=(6, 7, 8, 9, 10), date_fields=(7, 9),
+            signoffs={11: (7, 9)}, status=(6, 9), progress=(7, 9),
+            key_prefix="tubing_update",
+        ),
+        CategorySchema(
+            name="EHT", noun="EHT", title="EHT",
+            toggle_label="Only Show Incomplete EHT",
+            toggle_help="Filter to EHT entries missing completion fields.",
+            detail=(1, 10), fields=(10, 11, 12, 13), date_fields=(11, 13),
+            signoffs={14: (11, 13)}, status=(10, 14), progress=(11, 13),
+            key_prefix="eht_update",
+        ),
+        CategorySchema(
+            name="EHT RTDs", noun="EHT RTDs", title="EHT RTDs",
+            toggle_label="Only Show Incomplete EHT RTDs",
+            toggle_help="Filter to EHT RTDs entries missing completion fields.",
+            detail=(1, 10), fields=(10,), date_fields=(10,),
+            signoffs={11: (10,)}, status=(10, 11), progress=(10,),
+            key_prefix="eht_rtds_update",
+        ),
+    )
+}
+CATEGORY_OPTIONS = list(CATEGORIES)
+
+
+def column_span(start: int, stop: int) -> str:
+    """Spreadsheet letters for 0-based ``[start, stop)``, e.g. (1, 13) -> "B-M"."""
+    def letter(position: int) -> str:
+        letters, index = "", position + 1
+        while index > 0:
+            index, remainder = divmod(index - 1, 26)
+            letters = chr(65 + remainder) + letters
+        return letters
+
+    return f"{letter(start)}-{letter(max(start, stop - 1))}"
+
+
+@dataclass(frozen=True)
+class ResolvedCategory:
+    schema: CategorySchema
+    headers: Tuple[str, ...]
+    tag: Optional[str]
+    detail: Tuple[str, ...]
+    fields: Tuple[str, ...]
+    date_fields: frozenset
+    signoffs: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    status: Tuple[str, ...]
+    progress: Tuple[str, ...]
+
+    def is_date_field(self, name: str) -> bool:
+        return name in self.date_fields or (self.schema.header_date_inputs and "date" in name.lower())
+
+    def displays_as_date(self, name: str) -> bool:
+        mode = self.schema.display_dates
+        if mode == DISPLAY_ANY:
+            return True
+        if mode == DISPLAY_HEADER and "date" in name.lower():
+            return True
+        return name in self.date_fields
+
+
+@lru_cache(maxsize=64)
+def _resolve(schema: CategorySchema, headers: Tuple[str, ...]) -> ResolvedCategory:
+    width = len(headers)
+
+    def names(positions) -> Tuple[str, ...]:
+        return tuple(headers[idx] for idx in positions if idx < width)
+
+    signoffs = tuple(
+        (headers[signoff], names(dates))
+        for signoff, dates in schema.signoffs.items()
+        if signoff < width and names(dates)
+    )
+    return ResolvedCategory(
+        schema=schema,
+        headers=headers,
+        tag=headers[0] if headers else None,
+        detail=names(range(*schema.detail)),
+        fields=names(schema.fields),
+        date_fields=frozenset(names(schema.date_fields)),
+        signoffs=signoffs,
+        status=names(range(*schema.status)),
+        progress=names(schema.progress),
+    )
+
+
+def resolve(category: str, headers) -> ResolvedCategory:
+    """``category``'s schema as column names of a sheet with ``headers`` (cached per header row)."""
+    return _resolve(CATEGORIES[category], tuple(str(col).strip() for col in headers))
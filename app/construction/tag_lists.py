@@ -0,0 +1,85 @@
+"""Tag dropdown lists for Construction Reporting, with and without complete rows.
+
+A row is complete when every one of its category's status columns (see
+``app.construction.registry``) holds a value. The completeness mask and both
+tag lists are computed column-wise once per sheet generation (see
+``GoogleSheetsManager.data_generation``) and reused on every rerun until the
+sheet's content changes.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pandas as pd
+
+from app.construction.registry import CATEGORIES
+from app.construction.tag_search import TagSearchIndex
+
+
+@dataclass
+class TagLists:
+    generation: str
+    complete: pd.Series
+    all_tags: List[str]
+    incomplete_tags: List[str]
+    first_row: Dict[str, int]  # tag -> 0-based position of its first row
+    _search: Dict[bool, TagSearchIndex] = field(default_factory=dict, repr=False)
+
+    def search_index(self, only_incomplete: bool = False) -> TagSearchIndex:
+        """Typeahead index over one of the lists, built on first use and kept with them."""
+        if only_incomplete not in self._search:
+            self._search[only_incomplete] = TagSearchIndex(self.incomplete_tags if only_incomplete else self.all_tags)
+        return self._search[only_incomplete]
+
+
+_tag_lists: Dict[str, TagLists] = {}
+
+
+def _text(values: pd.Series) -> pd.Series:
+    return values.astype(object).where(values.notna(), "").astype(str).str.strip()
+
+
+def completeness_mask(df: pd.DataFrame, category: str) -> pd.Series:
+    """True for rows whose status columns are all filled in.
+
+    Categories without status columns (or sheets too narrow to have them) have
+    no complete rows, so nothing is filtered out.
+    """
+    schema = CATEGORIES.get(category)
+    start, stop = schema.status if schema else (0, 0)
+    status = df.iloc[:, start:stop]
+    if status.shape[1] == 0:
+        return pd.Series(False, index=df.index)
+    complete = pd.Series(True, index=df.index)
+    for position in range(status.shape[1]):
+        complete &= _text(status.iloc[:, position]).ne("")
+    return complete
+
+
+def build_tag_lists(df: pd.DataFrame, category: str, generation: str = "") -> TagLists:
+    tags = _text(df.iloc[:, 0]) if df.shape[1] else pd.Series(dtype=str)
+    complete = completeness_mask(df, category)
+    named = tags.ne("")
+    first = tags.reset_index(drop=True)
+    first = first[named.to_numpy() & ~first.duplicated().to_numpy()]
+    return TagLists(
+        generation=generation,
+        complete=complete,
+        all_tags=first.tolist(),
+        incomplete_tags=tags[named & ~complete].drop_duplicates().tolist(),
+        first_row=dict(zip(first.tolist(), first.index.tolist())),
+    )
+
+
+def tag_lists(df: pd.DataFrame, category: str, generation: str) -> TagLists:
+    """Cached ``TagLists`` for ``category``, rebuilt when ``generation`` changes.
+
+    An empty ``generation`` (data that did not come through the Sheets cache)
+    is never cached.
+    """
+    cached = _tag_lists.get(category)
+    if generation and cached is not None and cached.generation == generation:
+        return cached
+    lists = build_tag_lists(df, category, generation)
+    if generation:
+        _tag_lists[category] = lists
+    return lists
@@ -0,0 +1,94 @@
+"""Server-side typeahead over a category's tags.
+
+The tag dropdowns on Construction Reporting only receive the top matches for
+what the user typed, so a sheet with tens of thousands of tags still sends a
+few dozen options to the browser. Tags are normalized (lower case, letters and
+digits only) and matched, best first, as:
+
+1. the whole normalized tag starting with the query,
+2. one of its tokens starting with it ("tr-0007" has tokens "tr", "0007" and "7"),
+3. the query appearing anywhere, found through a trigram index.
+
+Prefix lookups are bisections over sorted keys, and substring lookups only
+verify the candidates of the query's rarest trigram, so a search stays well
+under a millisecond whatever the sheet size.
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+SEARCH_LIMIT = 40
+GRAM = 3
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    return "".join(_TOKEN.findall(str(text).lower()))
+
+
+def tokens(text: str) -> List[str]:
+    """Lower-case alphanumeric runs of ``text``; numbers also appear without leading zeros."""
+    found = _TOKEN.findall(str(text).lower())
+    trimmed = [token.lstrip("0") for token in found if token.isdigit() and token.lstrip("0") not in ("", token)]
+    return found + trimmed
+
+
+class TagSearchIndex:
+    def __init__(self, tags: Sequence[str]):
+        self.tags = list(tags)
+        self.normalized = [normalize(tag) for tag in self.tags]
+        by_key = sorted((key, idx) for idx, key in enumerate(self.normalized) if key)
+        self._keys = [key for key, _ in by_key]
+        self._key_rows = [idx for _, idx in by_key]
+        by_token = sorted({(token, idx) for idx, tag in enumerate(self.tags) for token in tokens(tag)})
+        self._tokens = [token for token, _ in by_token]
+        self._token_rows = [idx for _, idx in by_token]
+        grams: Dict[str, List[int]] = {}
+        for idx, key in enumerate(self.normalized):
+            for gram in {key[pos:pos + GRAM] for pos in range(len(key) - GRAM + 1)}:
+                grams.setdefault(gram, []).append(idx)
+        self._grams = grams
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    @staticmethod
+    def _prefixed(keys: List[str], rows: List[int], prefix: str, limit: int) -> List[int]:
+        start = bisect_left(keys, prefix)
+        found = []
+        for pos in range(start, len(keys)):
+            if len(found) >= limit or not keys[pos].startswith(prefix):
+                break
+            found.append(rows[pos])
+        return found
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> List[str]:
+        """Up to ``limit`` tags matching ``query``, best matches first (the first tags when it is blank)."""
+        needle = normalize(query)
+        if not needle:
+            return self.tags[:limit]
+        picked: List[int] = []
+        seen = set()
+
+        def take(rows) -> bool:
+            for idx in rows:
+                if idx not in seen:
+                    seen.add(idx)
+                    picked.append(idx)
+                    if len(picked) >= limit:
+                        return True
+            return False
+
+        if take(self._prefixed(self._keys, self._key_rows, needle, limit)):
+            return [self.tags[idx] for idx in picked]
+        # A query with separators ("tr-00") is matched as a whole rather than per part.
+        single = len(_TOKEN.findall(str(query).lower())) == 1
+        for token in tokens(query) if single else [needle]:
+            if take(self._prefixed(self._tokens, self._token_rows, token, limit)):
+                return [self.tags[idx] for idx in picked]
+        if len(needle) >= GRAM:
+            postings = [self._grams.get(needle[pos:pos + GRAM], []) for pos in range(len(needle) - GRAM + 1)]
+            rarest = min(postings, key=len)
+            take(idx for idx in rarest if needle in self.normalized[idx])
+        return [self.tags[idx] for idx in picked]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from app.data.time_data import normalize_job_area_value
+
+
+CUBE_DIMENSIONS = ["Date", "Job Number", "Job Area", "Cost Code", "Name", "Indirect"]
+CUBE_MEASURES = ["RT Hours", "OT Hours", "Rows"]
+
+
+CellKey = Tuple[str, str, str, str, bool]
+
+
+def _text(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[col].astype(object).where(df[col].notna(), "").astype(str).str.strip()
+    return values.where(~values.str.lower().isin({"nan", "none"}), "")
+
+
+def _hours(df: pd.DataFrame, col: str) -> pd.Series:
+    text = _text(df, col)
+    return pd.to_numeric(text.where(text != "", "0"), errors="coerce").fillna(0.0)
+
+
+def _date_key(value) -> str:
+    if isinstance(value, str):
+        return value.strip()[:10]
+    return pd.to_datetime(value).strftime("%Y-%m-%d")
+
+
+def _aggregate(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Group raw Time Data rows into cube cells (one row per dimension tuple)."""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=CUBE_DIMENSIONS + CUBE_MEASURES)
+    dates = pd.to_datetime(_text(df, "Date").str[:10], errors="coerce", format="%Y-%m-%d")
+    frame = pd.DataFrame({
+        "Date": dates.dt.strftime("%Y-%m-%d").fillna(""),
+        "Job Number": _text(df, "Job Number"),
+        "Job Area": _text(df, "Job Area").map(normalize_job_area_value),
+        "Cost Code": _text(df, "Cost Code"),
+        "Name": _text(df, "Name"),
+        "Indirect": _text(df, "Indirect").str.upper().isin({"TRUE", "YES", "Y", "1", "INDIRECT"}),
+        "RT Hours": _hours(df, "RT Hours"),
+        "OT Hours": _hours(df, "OT Hours"),
+        "Rows": 1,
+    })
+    return frame.groupby(CUBE_DIMENSIONS, as_index=False, sort=False)[CUBE_MEASURES].sum()
+
+
+class LaborCube:
+    """Cached RT/OT/row-count totals over (date, job, area, cost code, employee, indirect).
+
+    Build it once from Time Data, then keep it current with :meth:`append` and
+    :meth:`remove` as rows are added or deleted. Day and week summaries only
+    read the cells stored under those dates.
+    """
+
+    def __init__(self):
+        self._cells: Dict[str, Dict[CellKey, list]] = {}
+
+    @classmethod
+    def from_time_data(cls, df: Optional[pd.DataFrame]) -> "LaborCube":
+        cube = cls()
+        cube.append(df)
+        return cube
+
+    def _apply(self, df: Optional[pd.DataFrame], sign: int) -> None:
+        grouped = _aggregate(df)
+        for row in grouped.itertuples(index=False):
+            day = self._cells.setdefault(row[0], {})
+            key = tuple(row[1:6])
+            cell = day.setdefault(key, [0.0, 0.0, 0])
+            cell[0] += sign * float(row[6])
+            cell[1] += sign * float(row[7])
+            cell[2] += sign * int(row[8])
+            if cell[2] <= 0:
+                del day[key]
+                if not day:
+                    del self._cells[row[0]]
+
+    def append(self, df: Optional[pd.DataFrame]) -> None:
+        """Add newly appended Time Data rows to the cube."""
+        self._apply(df, 1)
+
+    def remove(self, df: Optional[pd.DataFrame]) -> None:
+        """Subtract deleted Time Data rows from the cube."""
+        self._apply(df, -1)
+
+    @property
+    def dates(self) -> list[str]:
+        return sorted(self._cells)
+
+    def __len__(self) -> int:
+        return sum(len(day) for day in self._cells.values())
+
+    def _records(self, dates: Optional[Iterable[str]] = None):
+        selected = self._cells.keys() if dates is None else [d for d in dates if d in self._cells]
+        for day_key in selected:
+            for key, (rt, ot, rows) in self._cells[day_key].items():
+                yield (day_key, *key, rt, ot, rows)
+
+    def query(self, by: Sequence[str] = (), **filters) -> pd.DataFrame:
+        """Totals grouped by any subset of the cube dimensions.
+
+        Filters use the dimension names with spaces replaced by underscores,
+        e.g. ``query(by=["Name"], Date="2026-05-19", Job_Number="2624138043")``.
+        A filter value may be a single value or a collection of values.
+        """
+        by = list(by)
+        unknown = [col for col in by if col not in CUBE_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown cube dimension(s): {unknown}")
+        wanted = {}
+        for name, value in filters.items():
+            col = name.replace("_", " ")
+            if col not in CUBE_DIMENSIONS:
+                raise ValueError(f"Unknown cube dimension: {name}")
+            if isinstance(value, (str, bool, date)) or not isinstance(value, Iterable):
+                value = [value]
+            wanted[col] = {_date_key(v) for v in value} if col == "Date" else set(value)
+
+        frame = pd.DataFrame(
+            list(self._records(wanted.get("Date"))),
+            columns=CUBE_DIMENSIONS + CUBE_MEASURES,
+        )
+        for col, values in wanted.items():
+            if col != "Date":
+                frame = frame[frame[col].isin(values)]
+        if not by:
+            totals = frame[CUBE_MEASURES].sum()
+            return pd.DataFrame([totals.to_dict()], columns=CUBE_MEASURES).astype({"Rows": int})
+        if frame.empty:
+            return pd.DataFrame(columns=by + CUBE_MEASURES)
+        return frame.groupby(by, as_index=False)[CUBE_MEASURES].sum()
+
+    def daily_summary(self, day, by: Sequence[str] = ("Name",)) -> pd.DataFrame:
+        return self.query(by=by, Date=day)
+
+    def weekly_summary(self, week_start, by: Sequence[str] = ("Name",)) -> pd.DataFrame:
+        start = pd.to_datetime(week_start).date()
+        return self.query(by=by, Date=[start + timedelta(days=offset) for offset in range(7)])
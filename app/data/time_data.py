@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from datetime import date, datetime
 from numbers import Number
 from typing import Optional
@@ -11,9 +13,43 @@ TIME_DATA_COLUMNS = [
     "Job Number", "Job Area", "Date", "Name", "Trade Class",
     "Employee Number", "RT Hours", "OT Hours", "Description of work",
     "Comments", "Night Shift", "Premium Rate", "Subsistence Rate",
-    "Travel Rate", "Indirect", "Cost Code", "Entered By"
+    "Travel Rate", "Indirect", "Cost Code", "Entered By", "Entry ID"
 ]
 
+ENTRY_ID_COLUMN = "Entry ID"
+
+_CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def new_entry_id(timestamp_ms: Optional[int] = None) -> str:
+    """Return a ULID: 48-bit millisecond timestamp + 80 random bits, Crockford base32.
+
+    IDs sort by creation time, so entries added later also sort later.
+    """
+    if timestamp_ms is None:
+        timestamp_ms = int(time.time() * 1000)
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    chars = []
+    for _ in range(26):
+        chars.append(_CROCKFORD_BASE32[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def ensure_entry_ids(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Return a copy of ``df`` where every row has an Entry ID (blank IDs are filled in)."""
+    if df is None:
+        return pd.DataFrame(columns=TIME_DATA_COLUMNS)
+    df = df.copy()
+    if ENTRY_ID_COLUMN not in df.columns:
+        df[ENTRY_ID_COLUMN] = ""
+    ids = df[ENTRY_ID_COLUMN].astype(object).where(df[ENTRY_ID_COLUMN].notna(), "").astype(str).str.strip()
+    missing = ids.isin({"", "nan", "None"})
+    if missing.any():
+        ids[missing] = [new_entry_id() for _ in range(int(missing.sum()))]
+    df[ENTRY_ID_COLUMN] = ids
+    return df
+
 
 def normalize_job_area_value(value, blank_value: str = "") -> str:
     if value is None:
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import sys
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from app.data.time_data import ENTRY_ID_COLUMN, TIME_DATA_COLUMNS, prepare_time_data_dataframe
+
+
+HOURS_COLUMNS = ["RT Hours", "OT Hours"]
+DATE_COLUMNS = ["Date"]
+INTERNED_COLUMNS = ["Comments"]
+# Unique per row, so neither categories nor interning save anything.
+TEXT_COLUMNS = [ENTRY_ID_COLUMN]
+CATEGORICAL_COLUMNS = [
+    col for col in TIME_DATA_COLUMNS
+    if col not in HOURS_COLUMNS + DATE_COLUMNS + INTERNED_COLUMNS + TEXT_COLUMNS
+]
+
+SHEET_DATE_FORMAT = "%Y-%m-%d"
+
+
+def _format_hours(values) -> list[str]:
+    # float32 carries ~7 significant digits; formatting at that precision
+    # gives back the shortest text that round-trips (7.33 -> "7.33").
+    return ["" if np.isnan(v) else "{0:.7g}".format(v) for v in np.asarray(values, dtype="float64")]
+
+
+def _as_category(series: pd.Series) -> pd.Series:
+    return series.astype(object).astype("category")
+
+
+def _compact_hours(series: pd.Series) -> pd.Series:
+    text = series.astype(object)
+    numeric = pd.to_numeric(text.where(text != ""), errors="coerce").astype("float32")
+    if _format_hours(numeric.to_numpy()) != text.tolist():
+        return _as_category(series)
+    return numeric
+
+
+def _compact_dates(series: pd.Series) -> pd.Series:
+    text = series.astype(object)
+    parsed = pd.to_datetime(text.where(text != ""), format=SHEET_DATE_FORMAT, errors="coerce")
+    if parsed.dt.strftime(SHEET_DATE_FORMAT).fillna("").tolist() != text.tolist():
+        return _as_category(series)
+    return parsed
+
+
+def _interned(series: pd.Series) -> pd.Series:
+    return pd.Series(
+        [sys.intern(str(value)) for value in series.tolist()],
+        index=series.index,
+        dtype=object,
+        name=series.name,
+    )
+
+
+def to_compact_time_data(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Convert Time Data to the compact in-memory schema.
+
+    Repetitive text columns become categoricals, hours become float32, dates
+    become datetime64 and comments share interned strings. A column that would
+    not survive the round trip (e.g. hours typed as text) stays categorical.
+    """
+    prepared = prepare_time_data_dataframe(df)
+    compact = {}
+    for col in prepared.columns:
+        series = prepared[col]
+        if col in HOURS_COLUMNS:
+            compact[col] = _compact_hours(series)
+        elif col in DATE_COLUMNS:
+            compact[col] = _compact_dates(series)
+        elif col in INTERNED_COLUMNS:
+            compact[col] = _interned(series)
+        elif col in TEXT_COLUMNS:
+            compact[col] = series.astype(object)
+        else:
+            compact[col] = _as_category(series)
+    return pd.DataFrame(compact, index=prepared.index)
+
+
+def to_sheet_time_data(compact: pd.DataFrame) -> pd.DataFrame:
+    """Convert a compact Time Data frame back to the sheet's text representation."""
+    sheet = {}
+    for col in compact.columns:
+        series = compact[col]
+        if pd.api.types.is_float_dtype(series.dtype):
+            values = _format_hours(series.to_numpy())
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = series.dt.strftime(SHEET_DATE_FORMAT).fillna("").tolist()
+        else:
+            values = ["" if pd.isna(value) else str(value) for value in series.astype(object).tolist()]
+        sheet[col] = pd.Series(values, index=compact.index, dtype=object)
+    return pd.DataFrame(sheet, index=compact.index)
+
+
+def _column_bytes(series: pd.Series) -> int:
+    if series.dtype != object:
+        return int(series.memory_usage(index=False, deep=True))
+    # Count each distinct string object once so interning shows up.
+    values = series.tolist()
+    unique_objects = {id(value): value for value in values}
+    pointer_bytes = series.memory_usage(index=False, deep=False)
+    return int(pointer_bytes + sum(sys.getsizeof(value) for value in unique_objects.values()))
+
+
+def compact_memory_report(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Per-column memory of the sheet representation vs the compact schema."""
+    sheet = prepare_time_data_dataframe(df)
+    sheet = sheet.astype(object)
+    compact = to_compact_time_data(sheet)
+    rows = []
+    for col in sheet.columns:
+        sheet_bytes = int(sheet[col].memory_usage(index=False, deep=True))
+        compact_bytes = _column_bytes(compact[col])
+        rows.append({
+            "Column": col,
+            "Compact Type": str(compact[col].dtype),
+            "Sheet Bytes": sheet_bytes,
+            "Compact Bytes": compact_bytes,
+        })
+    report = pd.DataFrame(rows, columns=["Column", "Compact Type", "Sheet Bytes", "Compact Bytes"])
+    total = pd.DataFrame([{
+        "Column": "Total",
+        "Compact Type": "",
+        "Sheet Bytes": int(report["Sheet Bytes"].sum()),
+        "Compact Bytes": int(report["Compact Bytes"].sum()),
+    }])
+    report = pd.concat([report, total], ignore_index=True)
+    report["Saved Bytes"] = report["Sheet Bytes"] - report["Compact Bytes"]
+    sheet_bytes = report["Sheet Bytes"].where(report["Sheet Bytes"] > 0)
+    report["Saved %"] = (report["Saved Bytes"] / sheet_bytes * 100).round(1).fillna(0.0)
+    return report
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from app.data.time_data import normalize_job_area_value
+
+
+DUPLICATE_KEY_COLUMNS = ["Name", "Date", "Job Number", "Job Area", "Cost Code"]
+MAX_DAILY_HOURS = 24.0
+
+RESULT_COLUMNS = [
+    "Name", "Date", "RT Hours", "OT Hours", "Hours Valid", "Quarter Hour",
+    "Daily Total", "Over Daily Limit", "Duplicate", "Unknown Job",
+    "Unknown Cost Code", "Valid", "Issues",
+]
+
+
+def _text(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[col].astype(object).where(df[col].notna(), "")
+    values = values.astype(str).str.strip()
+    return values.where(~values.str.lower().isin({"nan", "none"}), "")
+
+
+def _hours(df: pd.DataFrame, col: str) -> pd.Series:
+    text = _text(df, col)
+    return pd.to_numeric(text.where(text != "", "0"), errors="coerce")
+
+
+def _dates(df: pd.DataFrame) -> pd.Series:
+    text = _text(df, "Date")
+    parsed = pd.to_datetime(text.str[:10], errors="coerce", format="%Y-%m-%d")
+    leftover = parsed.isna() & (text != "")
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(text[leftover], errors="coerce", format="mixed")
+    return parsed.dt.strftime("%Y-%m-%d").fillna("")
+
+
+def _keys(df: pd.DataFrame) -> pd.DataFrame:
+    keys = pd.DataFrame(index=df.index)
+    keys["Name"] = _text(df, "Name").str.upper()
+    keys["Date"] = _dates(df)
+    keys["Job Number"] = _text(df, "Job Number")
+    keys["Job Area"] = _text(df, "Job Area").map(normalize_job_area_value)
+    keys["Cost Code"] = _text(df, "Cost Code")
+    return keys
+
+
+def _normalized_codes(values: Optional[Iterable]) -> Optional[set[str]]:
+    if values is None:
+        return None
+    return {str(value).strip() for value in values if str(value).strip()}
+
+
+def validate_time_entries(
+    batch: pd.DataFrame,
+    existing: Optional[pd.DataFrame] = None,
+    known_jobs: Optional[Iterable] = None,
+    known_cost_codes: Optional[Iterable] = None,
+    max_daily_hours: float = MAX_DAILY_HOURS,
+) -> pd.DataFrame:
+    """Validate a candidate batch of Time Data rows against the date's existing rows.
+
+    Returns one result row per batch row (same index) with the parsed hours,
+    each check as a boolean column, the employee's daily total including
+    existing rows, and a readable ``Issues`` summary. ``Valid`` is True only
+    when no check failed.
+    """
+    if batch is None or batch.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    if existing is None:
+        existing = pd.DataFrame(columns=batch.columns)
+
+    batch_keys = _keys(batch)
+    existing_keys = _keys(existing)
+
+    result = pd.DataFrame(index=batch.index)
+    result["Name"] = _text(batch, "Name")
+    result["Date"] = batch_keys["Date"]
+    result["RT Hours"] = _hours(batch, "RT Hours")
+    result["OT Hours"] = _hours(batch, "OT Hours")
+
+    hours = result[["RT Hours", "OT Hours"]]
+    result["Hours Valid"] = hours.notna().all(axis=1) & (hours.fillna(0) >= 0).all(axis=1)
+    scaled = hours.fillna(0) * 4
+    result["Quarter Hour"] = ((scaled - scaled.round()).abs() < 1e-6).all(axis=1)
+
+    # Per-employee daily totals across existing + candidate rows.
+    existing_hours = _hours(existing, "RT Hours").fillna(0) + _hours(existing, "OT Hours").fillna(0)
+    batch_hours = hours.fillna(0).sum(axis=1)
+    combined = pd.concat(
+        [
+            pd.DataFrame({"Name": existing_keys["Name"], "Date": existing_keys["Date"], "Hours": existing_hours}),
+            pd.DataFrame({"Name": batch_keys["Name"], "Date": batch_keys["Date"], "Hours": batch_hours}),
+        ],
+        ignore_index=True,
+    )
+    totals = combined.groupby(["Name", "Date"], as_index=False)["Hours"].sum()
+    merged_totals = batch_keys[["Name", "Date"]].merge(totals, on=["Name", "Date"], how="left")
+    result["Daily Total"] = merged_totals["Hours"].fillna(0).to_numpy()
+    result["Over Daily Limit"] = result["Daily Total"] > max_daily_hours + 1e-9
+
+    # Duplicate keys, within the batch or against the existing rows.
+    within_batch = batch_keys.duplicated(subset=DUPLICATE_KEY_COLUMNS, keep=False)
+    existing_unique = existing_keys[DUPLICATE_KEY_COLUMNS].drop_duplicates()
+    against_existing = batch_keys[DUPLICATE_KEY_COLUMNS].merge(
+        existing_unique, on=DUPLICATE_KEY_COLUMNS, how="left", indicator=True
+    )["_merge"].eq("both")
+    result["Duplicate"] = within_batch.to_numpy() | against_existing.to_numpy()
+
+    jobs = _normalized_codes(known_jobs)
+    codes = _normalized_codes(known_cost_codes)
+    result["Unknown Job"] = ~batch_keys["Job Number"].isin(jobs) if jobs is not None else False
+    result["Unknown Cost Code"] = ~batch_keys["Cost Code"].isin(codes) if codes is not None else False
+
+    checks = {
+        "Hours Valid": (False, "hours must be non-negative numbers"),
+        "Quarter Hour": (False, "hours must be in 0.25 increments"),
+        "Over Daily Limit": (True, f"more than {max_daily_hours:g} hours for the day"),
+        "Duplicate": (True, "duplicate name/date/job/area/cost code"),
+        "Unknown Job": (True, "unknown job number"),
+        "Unknown Cost Code": (True, "unknown cost code"),
+    }
+    issues = pd.Series("", index=batch.index, dtype=object)
+    valid = pd.Series(True, index=batch.index)
+    for col, (fails_when, message) in checks.items():
+        failed = result[col].astype(bool) == fails_when
+        valid &= ~failed
+        issues = issues.where(~failed, issues + "; " + message)
+    result["Valid"] = valid
+    result["Issues"] = issues.str.lstrip("; ")
+    return result[RESULT_COLUMNS]
@@ -0,0 +1,52 @@
+import tempfile
+import zipfile
+from datetime import datetime
+
+from app.exports.daily_import import write_workbook
+
+# Archives stay in memory up to this size, then spill to a temporary file on disk.
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ExportArchive:
+    """ZIP of export workbooks written straight into a spooled buffer.
+
+    Workbooks are saved directly into their ZIP entry instead of being saved
+    to a file and read back, and the archive itself is held in memory only
+    until it grows past ``max_memory`` bytes.
+    """
+
+    def __init__(self, max_memory: int = SPOOL_MAX_BYTES):
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        self.zip_file = zipfile.ZipFile(self._buffer, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    def __enter__(self) -> "ExportArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.discard()
+
+    def add_workbook(self, name: str, wb, modified: datetime) -> None:
+        """Save an open workbook directly into a new ZIP entry."""
+        with self.zip_file.open(name, "w", force_zip64=True) as entry:
+            write_workbook(wb, entry, modified)
+
+    def add_bytes(self, name: str, content: bytes) -> None:
+        self.zip_file.writestr(name, content)
+
+    @property
+    def spilled_to_disk(self) -> bool:
+        return bool(getattr(self._buffer, "_rolled", False))
+
+    def getvalue(self) -> bytes:
+        """Finish the archive and return its bytes (the buffer is released afterwards)."""
+        self.zip_file.close()
+        self._buffer.seek(0)
+        data = self._buffer.read()
+        self._buffer.close()
+        return data
+
+    def discard(self) -> None:
+        self.zip_file.close()
+        self._buffer.close()
@@ -0,0 +1,307 @@
+import io
+import os
+import re
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from multiprocessing import get_context
+from numbers import Integral, Real
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.writer.excel import ExcelWriter
+
+from app.exports.template_cache import load_template, template_bytes, template_signature
+
+DATA_START_ROW = 4
+# Jobs with at least this many import lines skip openpyxl and stream sheet XML directly.
+STREAMING_MIN_ROWS = 200
+# Zip entry timestamps are fixed so identical workbooks produce identical bytes.
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+_pool: Optional[ProcessPoolExecutor] = None
+# {template path: (signature, layout)}; parsed once per template version and process.
+_layouts: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+class _StableZipFile(zipfile.ZipFile):
+    """ZipFile that stamps every entry with ZIP_TIMESTAMP instead of the current time."""
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if not isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            zinfo = zipfile.ZipInfo(zinfo_or_arcname, date_time=ZIP_TIMESTAMP)
+            zinfo.compress_type = self.compression
+            zinfo.external_attr = 0o600 << 16
+            zinfo_or_arcname = zinfo
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        # openpyxl streams worksheets through temp files; stamp those entries too.
+        with open(filename, "rb") as fh:
+            self.writestr(arcname or os.path.basename(filename), fh.read(), compress_type, compresslevel)
+
+
+def write_workbook(wb, fileobj: BinaryIO, modified: datetime) -> None:
+    """Save a workbook into any writable binary stream (seekable or not) with fixed timestamps."""
+    archive = _StableZipFile(fileobj, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+    wb.properties.modified = modified
+    ExcelWriter(wb, archive).save()
+
+
+def workbook_bytes(wb, modified: datetime) -> bytes:
+    """Serialize a workbook with a fixed modified time and zip timestamps."""
+    buffer = io.BytesIO()
+    write_workbook(wb, buffer, modified)
+    return buffer.getvalue()
+
+
+_SHEET_DATA = re.compile(r"<sheetData>(.*)</sheetData>|<sheetData/>", re.S)
+_TEMPLATE_ROW = re.compile(r'<row r="(\d+)"([^>]*?)(?:/>|>(.*?)</row>)', re.S)
+_TEMPLATE_CELL = re.compile(r'<c r="([A-Z]+)\d+"([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_STYLE_ATTR = re.compile(r'\ss="(\d+)"')
+_SPANS_ATTR = re.compile(r'\sspans="[^"]*"')
+_SHARED_STRING = re.compile(r"<si>.*?</si>|<si/>", re.S)
+_SST_OPEN = re.compile(r"<sst\b[^>]*>")
+_DIMENSION = re.compile(r'<dimension ref="[^"]*"/>')
+_CORE_MODIFIED = re.compile(r"(<dcterms:modified\b[^>]*>)[^<]*(</dcterms:modified>)")
+
+
+def _template_layout(template_path: str) -> Optional[Dict[str, Any]]:
+    """Split the TimeEntries package into reusable parts, once per template version.
+
+    Returns None when the template does not have the simple one-sheet,
+    shared-strings layout the streaming writer understands.
+    """
+    signature = template_signature(template_path)
+    cached = _layouts.get(str(template_path))
+    if cached and cached[0] == signature:
+        return cached[1]
+    layout = None
+    with zipfile.ZipFile(io.BytesIO(template_bytes(template_path))) as package:
+        names = package.namelist()
+        sheet_name = "xl/worksheets/sheet1.xml"
+        if sheet_name in names and "xl/sharedStrings.xml" in names:
+            sheet = package.read(sheet_name).decode("utf-8")
+            sst = package.read("xl/sharedStrings.xml").decode("utf-8")
+            match = _SHEET_DATA.search(sheet)
+            sst_open = _SST_OPEN.search(sst)
+            if match and sst_open:
+                rows = {}
+                for row_match in _TEMPLATE_ROW.finditer(match.group(1) or ""):
+                    row_num = int(row_match.group(1))
+                    styles = {}
+                    for cell in _TEMPLATE_CELL.finditer(row_match.group(3) or ""):
+                        style = _STYLE_ATTR.search(cell.group(2))
+                        styles[column_index_from_string(cell.group(1))] = style.group(1) if style else None
+                    rows[row_num] = (row_match.group(0), _SPANS_ATTR.sub("", row_match.group(2)), styles)
+                strings = _SHARED_STRING.findall(sst)
+                count = re.search(r'\scount="(\d+)"', sst_open.group(0))
+                layout = {
+                    "names": names,
+                    "members": {name: package.read(name) for name in names},
+                    "sheet_name": sheet_name,
+                    "sheet_head": sheet[:match.start()],
+                    "sheet_tail": sheet[match.end():],
+                    "rows": rows,
+                    "template_cols": max((max(styles, default=0) for _, _, styles in rows.values()), default=0),
+                    "sst_head": sst[:sst_open.start()],
+                    "sst_strings": strings,
+                    "sst_count": int(count.group(1)) if count else len(strings),
+                }
+    _layouts[str(template_path)] = (signature, layout)
+    return layout
+
+
+def _render_streaming(layout: Dict[str, Any], rows: Sequence[Sequence], modified: datetime) -> bytes:
+    """Emit the data rows straight into the template's sheet XML.
+
+    Every other part of the template package (styles, theme, column widths,
+    header rows) is copied as-is, and data cells reuse the style ids of the
+    template row they land on, so the output matches filling the template in
+    place without building an openpyxl cell per value.
+    """
+    template_rows = layout["rows"]
+    strings = list(layout["sst_strings"])
+    string_ids: Dict[str, int] = {}
+    string_refs = 0
+
+    def _shared(text: str) -> int:
+        idx = string_ids.get(text)
+        if idx is None:
+            idx = len(strings)
+            space = ' xml:space="preserve"' if text != text.strip() else ""
+            strings.append(f"<si><t{space}>{escape(text)}</t></si>")
+            string_ids[text] = idx
+        return idx
+
+    last_template_row = max(template_rows, default=0)
+    last_row = max(last_template_row, DATA_START_ROW + len(rows) - 1)
+    last_col = layout["template_cols"]
+    parts = ["<sheetData>"]
+    for row_num in range(1, last_row + 1):
+        data_idx = row_num - DATA_START_ROW
+        template_row = template_rows.get(row_num)
+        if not 0 <= data_idx < len(rows):
+            if template_row:
+                parts.append(template_row[0])
+            continue
+        values = rows[data_idx]
+        attrs, styles = (template_row[1], template_row[2]) if template_row else ("", {})
+        parts.append(f'<row r="{row_num}"{attrs}>')
+        for col in range(1, max(len(values), max(styles, default=0)) + 1):
+            value = values[col - 1] if col <= len(values) else None
+            style = styles.get(col)
+            ref = f"{get_column_letter(col)}{row_num}"
+            style_attr = f' s="{style}"' if style is not None else ""
+            if value is None or value == "":
+                if style is not None:
+                    parts.append(f'<c r="{ref}"{style_attr}/>')
+                continue
+            last_col = max(last_col, col)
+            if isinstance(value, bool):
+                parts.append(f'<c r="{ref}"{style_attr} t="b"><v>{int(value)}</v></c>')
+            elif isinstance(value, Real):
+                number = repr(int(value)) if isinstance(value, Integral) else repr(float(value))
+                parts.append(f'<c r="{ref}"{style_attr}><v>{number}</v></c>')
+            else:
+                string_refs += 1
+                parts.append(f'<c r="{ref}"{style_attr} t="s"><v>{_shared(str(value))}</v></c>')
+        parts.append("</row>")
+    parts.append("</sheetData>")
+
+    sheet_head = _DIMENSION.sub(
+        f'<dimension ref="A1:{get_column_letter(max(last_col, 1))}{max(last_row, 1)}"/>', layout["sheet_head"], count=1
+    )
+    sheet_xml = sheet_head + "".join(parts) + layout["sheet_tail"]
+    sst_xml = (
+        layout["sst_head"]
+        + '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        + f'count="{layout["sst_count"] + string_refs}" uniqueCount="{len(strings)}">'
+        + "".join(strings)
+        + "</sst>"
+    )
+    stamp = modified.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    buffer = io.BytesIO()
+    with _StableZipFile(buffer, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as package:
+        for name in layout["names"]:
+            if name == layout["sheet_name"]:
+                data = sheet_xml.encode("utf-8")
+            elif name == "xl/sharedStrings.xml":
+                data = sst_xml.encode("utf-8")
+            elif name == "docProps/core.xml":
+                core = layout["members"][name].decode("utf-8")
+                data = _CORE_MODIFIED.sub(lambda m: m.group(1) + stamp + m.group(2), core).encode("utf-8")
+            else:
+                data = layout["members"][name]
+            package.writestr(name, data)
+    return buffer.getvalue()
+
+
+def render_daily_import(template_path: str, rows: Sequence[Sequence], modified: datetime) -> bytes:
+    """Fill the TimeEntries template with prepared rows (starting at row 4) and return the xlsx bytes."""
+    if len(rows) >= STREAMING_MIN_ROWS:
+        layout = _template_layout(template_path)
+        if layout is not None:
+            return _render_streaming(layout, rows, modified)
+    wb = load_template(template_path)
+    ws = wb.active
+    for row_num, values in enumerate(rows, start=DATA_START_ROW):
+        for col, val in enumerate(values, 1):
+            ws.cell(row=row_num, column=col, value=val)
+    content = workbook_bytes(wb, modified)
+    wb.close()
+    return content
+
+
+def _render_job(args) -> bytes:
+    template_path, rows, modified = args
+    return render_daily_import(template_path, rows, modified)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """The process-wide render pool, sized once to ``default_workers()``.
+
+    Callers limit their concurrency by how many tasks they keep submitted, so
+    exports of different sizes share the same warm worker processes.
+    """
+    global _pool
+    if _pool is None:
+        # spawn: forking the Streamlit server process (with its threads) is not safe.
+        _pool = ProcessPoolExecutor(max_workers=default_workers(), mp_context=get_context("spawn"))
+    return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+
+
+def default_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def render_daily_imports(
+    template_path: str,
+    jobs: Iterable[Tuple[str, Sequence[Sequence]]],
+    modified: datetime,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[str, bytes]]:
+    """Render (file name, rows) jobs and yield (file name, bytes) in the order given.
+
+    A job may carry its own modified time as a third item, overriding
+    ``modified`` (batch exports stamp each day's files with that day). With more
+    than one job and worker, rendering is fanned out to a process pool; results
+    are still yielded in input order so the ZIP layout is fixed.
+    """
+    jobs = list(jobs)
+    tasks = [
+        (str(template_path), [list(row) for row in job[1]], job[2] if len(job) > 2 else modified)
+        for job in jobs
+    ]
+    workers = default_workers() if workers is None else max(1, workers)
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        for job, (_, rows, job_modified) in zip(jobs, tasks):
+            yield job[0], render_daily_import(template_path, rows, job_modified)
+        return
+
+    # At most ``workers`` renders are submitted at a time: that bounds both the
+    # concurrency on the shared pool and the workbooks held waiting to be written.
+    window = workers
+    done = 0
+    try:
+        pool = _get_pool()
+        pending = deque(pool.submit(_render_job, task) for task in tasks[:window])
+        submitted = len(pending)
+        while pending:
+            content = pending.popleft().result()
+            if submitted < len(tasks):
+                pending.append(pool.submit(_render_job, tasks[submitted]))
+                submitted += 1
+            yield jobs[done][0], content
+            done += 1
+    except BrokenProcessPool:
+        _reset_pool()
+        for job, task in zip(jobs[done:], tasks[done:]):
+            yield job[0], _render_job(task)
+
+
+def write_daily_imports(
+    zip_file: zipfile.ZipFile,
+    template_path: str,
+    jobs: List[Tuple[str, Sequence[Sequence]]],
+    modified: datetime,
+    workers: Optional[int] = None,
+) -> int:
+    """Render jobs and add them to an open ZIP in input order. Returns the number written."""
+    written = 0
+    for file_name, content in render_daily_imports(template_path, jobs, modified, workers=workers):
+        zip_file.writestr(file_name, content)
+        written += 1
+    return written
@@ -0,0 +1,268 @@
+"""Expand a day's Time Data entries into TimeEntries import rows.
+
+Every entry becomes zero or more import rows, one per pay-code rule whose amount
+is positive. The expansion is done column-wise (melt the amount columns against
+``PAY_CODE_RULES``, then repeat the shared entry columns) so a day with thousands
+of entries costs a handful of pandas operations instead of a Python loop per row.
+"""
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.data.time_data import normalize_job_area_value
+
+IMPORT_COLUMNS = [
+    "Date", "Time Record Type", "Person Number", "Employee Name", "Override Trade Class",
+    "Post To Payroll", "Cost Code / Phase", "JobArea", "Scope Change", "Pay Code", "Hours",
+    "Night Shift", "Premium Rate / Subsistence Rate / Travel Rate", "Comments",
+]
+RATE_COLUMN = "Premium Rate / Subsistence Rate / Travel Rate"
+
+# One import row per entry and rule when the entry's "Source" amount is positive.
+# The row's hours are the amount itself, or "Flat Hours" when set: subsistence is
+# booked as one unit whenever the employee has a positive subsistence rate.
+# Rule order is the row order within an entry.
+PAY_CODE_RULES = pd.DataFrame(
+    [
+        {"Pay Type": "REG", "Pay Code": "211", "Source": "RT Hours", "Flat Hours": np.nan},
+        {"Pay Type": "OT", "Pay Code": "212", "Source": "OT Hours", "Flat Hours": np.nan},
+        {"Pay Type": "SUBSISTENCE", "Pay Code": "261", "Source": "Subsistence Rate", "Flat Hours": 1.0},
+    ]
+)
+PAYCODE_MAP = dict(zip(PAY_CODE_RULES["Pay Type"], PAY_CODE_RULES["Pay Code"]))
+
+EMPLOYEE_FIELDS = [
+    "time_record_type", "post_to_payroll", "night_shift",
+    "premium_rate", "subsistence_rate", "travel_rate",
+]
+_FIELD_ALIASES = {"subsistence_rate": ("subsistence_rate", "subsistence")}
+
+JOB_COLUMN = "Job Number"
+
+
+def clean_text(values: pd.Series) -> pd.Series:
+    """``str`` of each value, with NaN/None/"nan"/"none" blanked."""
+    text = values.astype(object).astype(str)
+    blank = values.isna() | text.str.lower().isin({"nan", "none", ""})
+    return text.mask(blank, "")
+
+
+def _amount(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values.astype(object).astype(str).str.strip(), errors="coerce").fillna(0.0)
+
+
+def resolve_employees(names: Iterable, lookup: Callable[[str], Mapping]) -> pd.DataFrame:
+    """Employee List attributes for each distinct entry name, indexed by name.
+
+    ``lookup`` is called once per distinct name (it may do fuzzy matching), not
+    once per time entry.
+    """
+    records: Dict[str, Dict[str, object]] = {}
+    for name in pd.unique(pd.Series(list(names), dtype=object).astype(str)):
+        details = lookup(name) or {}
+        record = {}
+        for field in EMPLOYEE_FIELDS:
+            value = ""
+            for key in _FIELD_ALIASES.get(field, (field,)):
+                value = details.get(key, "")
+                if not pd.isna(value) and str(value) != "":
+                    break
+            record[field] = value
+        records[name] = record
+    frame = pd.DataFrame.from_dict(records, orient="index", columns=EMPLOYEE_FIELDS)
+    return frame.apply(clean_text) if not frame.empty else frame
+
+
+# Employee List headers for each attribute, first match wins.
+EMPLOYEE_LIST_HEADERS = {
+    "time_record_type": ["Time Record Type"],
+    "post_to_payroll": ["Post To Payroll", "Post to Payroll", "Post Payroll", "Payroll", "Payroll Post"],
+    "night_shift": ["Night Shift", "NightShift", "Nightshift", "Night"],
+    "premium_rate": ["Premium Rate", "Premium"],
+    "subsistence_rate": ["Subsistence Rate", "Subsistence"],
+    "travel_rate": ["Travel Rate", "Travel"],
+}
+
+
+def employees_from_list(employee_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """``resolve_employees``-shaped attributes read straight from an Employee List frame.
+
+    Names are matched exactly (after stripping); the first row wins for duplicates.
+    """
+    if employee_df is None or employee_df.empty:
+        return pd.DataFrame(columns=EMPLOYEE_FIELDS)
+    headers = {str(col).strip(): col for col in employee_df.columns}
+    name_col = next((headers[h] for h in ("Employee Name", "Name", "name") if h in headers), None)
+    if name_col is None:
+        return pd.DataFrame(columns=EMPLOYEE_FIELDS)
+    frame = pd.DataFrame(index=employee_df.index)
+    for field, candidates in EMPLOYEE_LIST_HEADERS.items():
+        value = pd.Series("", index=employee_df.index, dtype=object)
+        for header in reversed(candidates):
+            if header in headers:
+                candidate = clean_text(employee_df[headers[header]]).str.strip()
+                value = candidate.where(candidate != "", value)
+        frame[field] = value
+    frame.index = clean_text(employee_df[name_col]).str.strip()
+    frame = frame[frame.index != ""]
+    return frame[~frame.index.duplicated()]
+
+
+def explode_pay_codes(
+    base: pd.DataFrame,
+    amounts: pd.DataFrame,
+    rules: pd.DataFrame = PAY_CODE_RULES,
+) -> pd.DataFrame:
+    """Repeat the rows of ``base`` once per rule with a positive amount.
+
+    ``amounts`` is aligned with ``base`` and holds one numeric column per rule
+    "Source"; rules whose source column is absent are skipped. The result gains
+    "Pay Code" and "Hours" columns, ordered by entry and then by rule.
+    """
+    rules = rules[rules["Source"].isin(amounts.columns)].reset_index(drop=True)
+    if base.empty or rules.empty:
+        return base.iloc[0:0].assign(**{"Pay Code": pd.Series(dtype=object), "Hours": pd.Series(dtype=float)})
+    long = (
+        amounts[list(pd.unique(rules["Source"]))]
+        .set_axis(np.arange(len(amounts)), axis=0)
+        .rename_axis("_entry")
+        .reset_index()
+        .melt(id_vars="_entry", var_name="Source", value_name="Amount")
+    )
+    long = long[long["Amount"] > 0].merge(rules.rename_axis("_rule").reset_index(), on="Source")
+    long = long.sort_values(["_entry", "_rule"], kind="mergesort")
+    hours = long["Flat Hours"].astype(float).fillna(long["Amount"].astype(float))
+    out = base.iloc[long["_entry"].to_numpy()].reset_index(drop=True)
+    out["Pay Code"] = long["Pay Code"].to_numpy()
+    out["Hours"] = hours.to_numpy()
+    return out
+
+
+def expand_import_rows(
+    entries: pd.DataFrame,
+    export_date: Optional[date] = None,
+    employees: Optional[pd.DataFrame] = None,
+    rules: pd.DataFrame = PAY_CODE_RULES,
+) -> pd.DataFrame:
+    """Import rows (``IMPORT_COLUMNS`` plus the entry's Job Number) for Time Data ``entries``.
+
+    Employee List values in ``employees`` (see ``resolve_employees``) take
+    precedence over the rate and night-shift columns stored on each entry. Night
+    shift rows carry "NS" in the rate column; otherwise the first of the
+    subsistence, premium and travel rates is used. Column A is ``export_date``
+    when given, otherwise each entry's own date.
+    """
+    columns = [JOB_COLUMN] + IMPORT_COLUMNS
+    if entries is None or entries.empty:
+        return pd.DataFrame(columns=columns)
+    index = entries.index
+
+    def text(column: str) -> pd.Series:
+        if column in entries.columns:
+            return clean_text(entries[column])
+        return pd.Series("", index=index, dtype=object)
+
+    if employees is not None and not employees.empty and "Name" in entries.columns:
+        emp = employees.reindex(entries["Name"].astype(str).to_numpy()).set_axis(index, axis=0)
+        emp = emp.reindex(columns=EMPLOYEE_FIELDS).fillna("")
+    else:
+        emp = pd.DataFrame("", index=index, columns=EMPLOYEE_FIELDS)
+
+    def prefer_employee(field: str, column: str) -> pd.Series:
+        return emp[field].where(emp[field] != "", text(column))
+
+    premium = prefer_employee("premium_rate", "Premium Rate")
+    subsistence = prefer_employee("subsistence_rate", "Subsistence Rate")
+    travel = prefer_employee("travel_rate", "Travel Rate")
+    night_shift = prefer_employee("night_shift", "Night Shift")
+    rate = subsistence.where(subsistence != "", premium.where(premium != "", travel))
+    rate = rate.mask(night_shift != "", "NS")
+
+    if export_date is not None:
+        dates = pd.Series(export_date.strftime("%Y-%m-%d"), index=index)
+    else:
+        dates = pd.to_datetime(entries["Date"], errors="coerce").dt.strftime("%Y-%m-%d").fillna("")
+
+    job_area = entries["Job Area"] if "Job Area" in entries.columns else pd.Series("", index=index)
+    base = pd.DataFrame(
+        {
+            JOB_COLUMN: text(JOB_COLUMN).str.strip(),
+            "Date": dates,
+            "Time Record Type": emp["time_record_type"],
+            "Person Number": text("Employee Number"),
+            "Employee Name": text("Name"),
+            "Override Trade Class": text("Trade Class"),
+            "Post To Payroll": emp["post_to_payroll"],
+            "Cost Code / Phase": text("Cost Code"),
+            "JobArea": job_area.map(normalize_job_area_value),
+            "Scope Change": "",
+            "Night Shift": night_shift,
+            RATE_COLUMN: rate,
+            "Comments": "",
+        },
+        index=index,
+    )
+    resolved = {"Premium Rate": premium, "Subsistence Rate": subsistence, "Travel Rate": travel}
+    amounts = pd.DataFrame(
+        {
+            source: _amount(resolved[source] if source in resolved else entries[source])
+            for source in pd.unique(rules["Source"])
+            if source in resolved or source in entries.columns
+        },
+        index=index,
+    )
+    return explode_pay_codes(base, amounts, rules)[columns]
+
+
+def import_rows_by_job(
+    entries: pd.DataFrame,
+    export_date: Optional[date] = None,
+    employees: Optional[pd.DataFrame] = None,
+    rules: pd.DataFrame = PAY_CODE_RULES,
+) -> List[Tuple[str, List[list]]]:
+    """``[(job, rows)]`` in first-seen job order; entries without a job are skipped.
+
+    Jobs are included even when none of their entries produce a row, matching
+    the one-file-per-job exports.
+    """
+    if entries is None or entries.empty or JOB_COLUMN not in entries.columns:
+        return []
+    jobs = [job for job in pd.unique(clean_text(entries[JOB_COLUMN]).str.strip()) if job]
+    expanded = expand_import_rows(entries, export_date, employees, rules)
+    values = expanded[IMPORT_COLUMNS].to_numpy(dtype=object)
+    grouped = {
+        job: values[positions].tolist()
+        for job, positions in expanded.groupby(JOB_COLUMN, sort=False).indices.items()
+    }
+    return [(job, grouped.get(job, [])) for job in jobs]
+
+
+def import_rows_by_date_and_job(
+    entries: pd.DataFrame,
+    employees: Optional[pd.DataFrame] = None,
+    rules: pd.DataFrame = PAY_CODE_RULES,
+) -> List[Tuple[str, str, List[list]]]:
+    """``[(date, job, rows)]`` for entries spanning several days, partitioned in one pass.
+
+    Dates are each entry's own "YYYY-MM-DD"; entries without a valid date or a
+    job are skipped. Order is by date, then first-seen job within that date.
+    """
+    if entries is None or entries.empty or JOB_COLUMN not in entries.columns or "Date" not in entries.columns:
+        return []
+    keys = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(entries["Date"], errors="coerce").dt.strftime("%Y-%m-%d"),
+            JOB_COLUMN: clean_text(entries[JOB_COLUMN]).str.strip(),
+        }
+    )
+    keys = keys[keys["Date"].notna() & (keys[JOB_COLUMN] != "")].drop_duplicates()
+    keys = keys.sort_values("Date", kind="mergesort")
+    expanded = expand_import_rows(entries, None, employees, rules)
+    values = expanded[IMPORT_COLUMNS].to_numpy(dtype=object)
+    grouped = expanded.groupby(["Date", JOB_COLUMN], sort=False).indices
+    return [
+        (day, job, values[grouped[(day, job)]].tolist() if (day, job) in grouped else [])
+        for day, job in keys.itertuples(index=False)
+    ]
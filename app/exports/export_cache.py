@@ -0,0 +1,168 @@
+"""Content-addressed store for rendered export files.
+
+An entry is keyed by everything the export is rendered from: the export date,
+the day's Time Data rows, the reference sheets it reads (Employee List, Cost
+Codes, ...) and the template file versions. While none of those change, the
+stored files are served as-is instead of rebuilding every workbook.
+
+Entries live in ``<root>/<key>/`` with a ``manifest.json`` listing the files
+in order. The manifest's mtime is the entry's last use; once the store grows
+past its byte budget, the least recently used entries are deleted, except
+those pinned by a build that is still using their files.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from app.exports.template_cache import template_signature
+
+EXPORT_CACHE_DIR = Path(os.getenv("TIMESHEET_EXPORT_DIR", "") or Path(tempfile.gettempdir()) / "timesheet-exports")
+EXPORT_CACHE_BUDGET = int(os.getenv("TIMESHEET_EXPORT_CACHE_MB", "512")) * 1024 * 1024
+MANIFEST = "manifest.json"
+
+
+def frame_digest(df: Optional[pd.DataFrame]) -> str:
+    """SHA-256 of a frame's columns and values, in row order.
+
+    Values are hashed as text so the same rows hash alike whether they came from
+    Google Sheets (strings) or the session (numbers).
+    """
+    if df is None:
+        return ""
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    if not df.empty:
+        digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def export_key(
+    kind: str,
+    export_date: date,
+    frames: Sequence[Optional[pd.DataFrame]],
+    templates: Sequence[Union[str, os.PathLike]],
+) -> str:
+    """Cache key for one export: ``kind`` separates exports that share inputs but differ in output."""
+    parts = {
+        "kind": kind,
+        "date": export_date.isoformat(),
+        "frames": [frame_digest(df) for df in frames],
+        "templates": [
+            [Path(t).name, *template_signature(t)] if Path(t).exists() else [Path(t).name]
+            for t in templates
+        ],
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ExportCache:
+    def __init__(self, root: Union[str, os.PathLike] = EXPORT_CACHE_DIR, budget_bytes: int = EXPORT_CACHE_BUDGET):
+        self.root = Path(root)
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._pins: Counter = Counter()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def get(self, key: str) -> Optional[List[Path]]:
+        """Paths of the stored files for ``key`` (marking the entry as used), or None."""
+        manifest = self._entry(key) / MANIFEST
+        try:
+            names = json.loads(manifest.read_text(encoding="utf-8"))
+            paths = [manifest.parent / name for name in names]
+            if not all(p.exists() for p in paths):
+                return None
+            os.utime(manifest)
+            return paths
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, files: Iterable[Tuple[str, bytes]]) -> List[Path]:
+        """Store ``(name, bytes)`` files under ``key`` and return their paths.
+
+        Files are written to a scratch directory that is renamed into place, so
+        readers never see a half-written entry; if another writer got there
+        first, its entry is kept.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        scratch = self.root / f".{key}.{uuid.uuid4().hex}"
+        scratch.mkdir()
+        try:
+            names = []
+            for name, content in files:
+                (scratch / name).write_bytes(content)
+                names.append(name)
+            (scratch / MANIFEST).write_text(json.dumps(names), encoding="utf-8")
+            try:
+                os.rename(scratch, self._entry(key))
+            except OSError:
+                if self.get(key) is None:
+                    shutil.rmtree(self._entry(key), ignore_errors=True)
+                    os.rename(scratch, self._entry(key))
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+        self.evict(keep=[key])
+        return [self._entry(key) / name for name in names]
+
+    @contextmanager
+    def pinned(self, keys: Iterable[str]) -> Iterator[None]:
+        """Keep the entries for ``keys`` from being evicted until the block exits, then evict down to the budget."""
+        keys = list(keys)
+        with self._lock:
+            self._pins.update(keys)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pins.subtract(keys)
+                self._pins = +self._pins
+            self.evict()
+
+    def evict(self, keep: Iterable[str] = ()) -> None:
+        """Delete least recently used entries, other than ``keep`` and pinned ones, until the store fits the budget."""
+        with self._lock:
+            keep = set(keep) | set(self._pins)
+            entries = []
+            total = 0
+            for entry in self.root.iterdir() if self.root.exists() else []:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                try:
+                    used = (entry / MANIFEST).stat().st_mtime
+                    size = sum(f.stat().st_size for f in entry.iterdir())
+                except OSError:
+                    used, size = 0.0, 0
+                entries.append((used, entry, size))
+                total += size
+            for _, entry, size in sorted(entries, key=lambda item: item[0]):
+                if total <= self.budget_bytes:
+                    break
+                if entry.name in keep:
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+
+_cache: Optional[ExportCache] = None
+
+
+def get_export_cache() -> ExportCache:
+    global _cache
+    if _cache is None:
+        _cache = ExportCache()
+    return _cache
@@ -0,0 +1,161 @@
+"""Background export jobs.
+
+Exports run on a small thread pool so the Streamlit script thread never waits
+on them. Each job's state lives in ``<id>.json`` under the job store and its
+finished archive beside it as ``<id>.zip``, so a rerun, another tab or an admin
+who navigated away and came back can pick up the result. Rendering inside a job
+still fans out to the Daily Import process pool.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from app.exports.export_cache import EXPORT_CACHE_DIR
+
+JOBS_DIR = EXPORT_CACHE_DIR / "jobs"
+JOB_WORKERS = 1
+JOB_RETENTION_SECONDS = 7 * 24 * 3600
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+Progress = Callable[[float, str], None]
+
+
+def job_id_for(*parts) -> str:
+    """Stable job id for an export request; resubmitting the same request reuses the job."""
+    return hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()[:24]
+
+
+class ExportJobs:
+    def __init__(self, root: Union[str, os.PathLike] = JOBS_DIR, workers: int = JOB_WORKERS):
+        self.root = Path(root)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export-job")
+        self._lock = threading.Lock()
+        self._active: Dict[str, float] = {}
+        self._recover()
+
+    def _state_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.json"
+
+    def _archive_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.zip"
+
+    def _write(self, job: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._state_path(job["id"])
+        tmp = path.with_name(f".{path.name}.{threading.get_ident()}")
+        tmp.write_text(json.dumps(job), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _update(self, job_id: str, **changes) -> None:
+        with self._lock:
+            job = self.get(job_id) or {"id": job_id}
+            job.update(changes, updated=time.time())
+            self._write(job)
+
+    def _recover(self) -> None:
+        """Jobs left queued or running by a previous app process can never finish; mark them failed."""
+        for job in self.list():
+            if job.get("status") in (QUEUED, RUNNING):
+                job.update(status=FAILED, error="Interrupted by an app restart; please run the export again.")
+                self._write(job)
+
+    def submit(self, job_id: str, label: str, file_name: str, fn: Callable[[Progress], bytes]) -> str:
+        """Queue ``fn`` (which builds the archive bytes and reports progress) unless the same job is live or done."""
+        with self._lock:
+            job = self.get(job_id)
+            if job_id in self._active:
+                return job_id
+            if job and job.get("status") == DONE and self._archive_path(job_id).exists():
+                return job_id
+            self._prune()
+            self._active[job_id] = time.time()
+            self._write({
+                "id": job_id, "label": label, "file_name": file_name, "status": QUEUED,
+                "progress": 0.0, "message": "Waiting to start", "error": "",
+                "created": time.time(), "updated": time.time(),
+            })
+        self._executor.submit(self._run, job_id, fn)
+        return job_id
+
+    def _run(self, job_id: str, fn: Callable[[Progress], bytes]) -> None:
+        def progress(fraction: float, message: str) -> None:
+            self._update(job_id, progress=max(0.0, min(1.0, float(fraction))), message=message)
+
+        try:
+            self._update(job_id, status=RUNNING, message="Starting")
+            content = fn(progress)
+            archive = self._archive_path(job_id)
+            tmp = archive.with_name(f".{archive.name}.tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, archive)
+            self._update(job_id, status=DONE, progress=1.0, message="Ready", size=len(content))
+        except Exception as exc:
+            self._update(job_id, status=FAILED, error=str(exc) or exc.__class__.__name__)
+        finally:
+            with self._lock:
+                self._active.pop(job_id, None)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        try:
+            return json.loads(self._state_path(job_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def result(self, job_id: str) -> Optional[bytes]:
+        job = self.get(job_id)
+        if not job or job.get("status") != DONE:
+            return None
+        try:
+            return self._archive_path(job_id).read_bytes()
+        except OSError:
+            return None
+
+    def list(self) -> List[dict]:
+        """All stored jobs, newest first."""
+        jobs = []
+        for path in self.root.glob("*.json") if self.root.exists() else []:
+            job = self.get(path.stem)
+            if job:
+                jobs.append(job)
+        return sorted(jobs, key=lambda job: job.get("created", 0), reverse=True)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        for job in self.list():
+            if job.get("status") in (DONE, FAILED) and job.get("updated", 0) < cutoff:
+                for path in (self._state_path(job["id"]), self._archive_path(job["id"])):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    def wait(self, job_id: str, timeout: float = 60.0) -> Optional[dict]:
+        """Block until the job finishes or ``timeout`` passes (for scripts and tests)."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            job = self.get(job_id)
+            if job and job.get("status") in (DONE, FAILED) and job_id not in self._active:
+                return job
+            time.sleep(0.05)
+        return self.get(job_id)
+
+
+_jobs: Optional[ExportJobs] = None
+_jobs_lock = threading.Lock()
+
+
+def get_export_jobs() -> ExportJobs:
+    global _jobs
+    with _jobs_lock:
+        if _jobs is None:
+            _jobs = ExportJobs()
+        return _jobs
@@ -0,0 +1,51 @@
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
+
+PathLike = Union[str, os.PathLike]
+
+# {resolved path: ((mtime_ns, size), pristine bytes)}
+_templates: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+_lock = threading.Lock()
+
+
+def template_signature(path: PathLike) -> Tuple[int, int]:
+    """(mtime_ns, size) of a template file; changes whenever the file is replaced or edited."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def template_bytes(path: PathLike) -> bytes:
+    """Pristine bytes of a template, read from disk once per file version."""
+    key = str(Path(path).resolve())
+    signature = template_signature(key)
+    with _lock:
+        cached = _templates.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+    with open(key, "rb") as fh:
+        data = fh.read()
+    with _lock:
+        _templates[key] = (signature, data)
+    return data
+
+
+def load_template(path: PathLike) -> Workbook:
+    """Return a fresh, independent workbook built from the cached template bytes.
+
+    The bytes are replayed through ``load_workbook`` rather than cloning a parsed
+    workbook: ``copy.deepcopy`` is slower than reparsing these templates, and a
+    pickled workbook loses the defaults on ``row_dimensions`` that the exporters
+    rely on when hiding rows.
+    """
+    return load_workbook(io.BytesIO(template_bytes(path)))
+
+
+def clear_template_cache() -> None:
+    with _lock:
+        _templates.clear()
@@ -0,0 +1,191 @@
+"""Daily Time and per-job Daily Import exports for a day or a range of days of Time Data.
+
+Rendered workbooks are kept in the export cache, keyed by the export date, that
+day's rows, the Employee List and the template versions: repeat clicks, page
+reruns and other admins exporting the same unchanged day get the stored files
+back instead of re-rendering them.
+"""
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from app.config import APP_DIR
+from app.exports.archive import ExportArchive
+from app.exports.daily_import import render_daily_imports
+from app.exports.engine import employees_from_list, import_rows_by_date_and_job
+from app.exports.export_cache import export_key, get_export_cache
+from app.reports.daily_time import render_daily_time
+
+DAILY_TIME_TEMPLATE = APP_DIR / "Daily Time.xlsx"
+TIMEENTRIES_TEMPLATE = APP_DIR / "TimeEntries.xlsx"
+# Pay periods are PAY_PERIOD_DAYS long and start on PAY_PERIOD_START (any period start date).
+PAY_PERIOD_ANCHOR = date.fromisoformat(os.getenv("PAY_PERIOD_START", "") or "2024-01-01")
+PAY_PERIOD_DAYS = 14
+# Bump whenever the Daily Time or Daily Import rendering changes, so workbooks cached by older code are not served.
+DAILY_EXPORT_FORMAT = 2
+
+
+@dataclass
+class DailyExport:
+    export_date: date
+    daily: Path
+    jobs: List[Path] = field(default_factory=list)
+
+    def files(self) -> List[Tuple[str, bytes]]:
+        """``(file name, bytes)`` for the Daily Time workbook and then each job."""
+        return [(path.name, path.read_bytes()) for path in [self.daily] + self.jobs]
+
+
+def read_employee_list() -> pd.DataFrame:
+    """Employee List from Google Sheets with the export's column names (empty on failure)."""
+    from app.data.workbook import get_employees
+
+    try:
+        return get_employees().rename(columns={"name": "Employee Name"})
+    except Exception:
+        return pd.DataFrame()
+
+
+def pay_period_bounds(day: date, anchor: date = PAY_PERIOD_ANCHOR, days: int = PAY_PERIOD_DAYS) -> Tuple[date, date]:
+    """First and last day of the pay period containing ``day``."""
+    start = anchor + timedelta(days=((day - anchor).days // days) * days)
+    return start, start + timedelta(days=days - 1)
+
+
+def _check_templates() -> Tuple[Path, Path]:
+    templates = (DAILY_TIME_TEMPLATE, TIMEENTRIES_TEMPLATE)
+    for template in templates:
+        if not template.exists():
+            raise FileNotFoundError(f"Export template '{template.name}' not found beside the app.")
+    return templates
+
+
+def _days_in_range(df: Optional[pd.DataFrame], start: date, end: date) -> Dict[date, pd.DataFrame]:
+    """Rows between ``start`` and ``end`` split by day, with the date column parsed once."""
+    if df is None or df.empty or "Date" not in df.columns:
+        return {}
+    parsed = pd.to_datetime(df["Date"], errors="coerce")
+    days = parsed.dt.normalize()
+    mask = days.between(pd.Timestamp(start), pd.Timestamp(end))
+    selected = df[mask].copy()
+    selected["Date"] = parsed[mask]
+    return {
+        pd.Timestamp(day).date(): selected.iloc[positions]
+        for day, positions in selected.groupby(days[mask].to_numpy(), sort=True).indices.items()
+    }
+
+
+@contextmanager
+def held_range_exports(
+    start: date,
+    end: date,
+    df: pd.DataFrame,
+    employees: Optional[pd.DataFrame] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[float, str], None]] = None,
+) -> Iterator[List[DailyExport]]:
+    """Daily Time and per-job Daily Import workbooks for every day from ``start`` to ``end`` with entries.
+
+    Days already in the export cache are served from it. The remaining days are
+    partitioned by (date, job) in one pass and all their Daily Import workbooks
+    are rendered in a single batch through the worker pool. Every day's cache
+    entry stays pinned until the block exits, so neither this build's later
+    days nor a concurrent export can evict files the caller has yet to read.
+    ``employees`` is the Employee List; it is read from Google Sheets when omitted.
+    ``progress(fraction, message)`` is called as workbooks are rendered.
+    Raises ``FileNotFoundError`` when a template is missing and ``ValueError``
+    when ``df`` has no rows in the range.
+    """
+    report = progress or (lambda fraction, message: None)
+    templates = _check_templates()
+    days = _days_in_range(df, start, end)
+    if not days:
+        if start == end:
+            raise ValueError(f"No time entries found for {start.strftime('%Y-%m-%d')}.")
+        raise ValueError(f"No time entries found from {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}.")
+    if employees is None:
+        employees = read_employee_list()
+
+    cache = get_export_cache()
+    kind = f"daily-time-v{DAILY_EXPORT_FORMAT}"
+    keys = {day: export_key(kind, day, [rows, employees], templates) for day, rows in days.items()}
+    with cache.pinned(keys.values()):
+        paths = {day: cache.get(key) for day, key in keys.items()}
+        missing = [day for day, found in paths.items() if found is None]
+        if missing:
+            jobs = []
+            for day_text, job, rows in import_rows_by_date_and_job(
+                pd.concat([days[day] for day in missing]), employees_from_list(employees)
+            ):
+                day = date.fromisoformat(day_text)
+                stamp = day.strftime("%m-%d-%Y")
+                jobs.append((day, (f"{stamp} - {job} - Daily Import.xlsx", rows, datetime.combine(day, datetime.min.time()))))
+            total = len(jobs) + len(missing)
+            report(0.0, f"Rendering {total} workbooks for {len(missing)} day(s)")
+            rendered = render_daily_imports(str(TIMEENTRIES_TEMPLATE), [job for _, job in jobs], None, workers=workers)
+            files: Dict[date, List[Tuple[str, bytes]]] = {day: [] for day in missing}
+            for done, ((day, _), result) in enumerate(zip(jobs, rendered), start=1):
+                files[day].append(result)
+                report(done / total, f"Rendered {result[0]}")
+            for done, day in enumerate(missing, start=len(jobs) + 1):
+                daily = (
+                    f"{day.strftime('%m-%d-%Y')} - Daily Time.xlsx",
+                    render_daily_time(days[day], day, DAILY_TIME_TEMPLATE),
+                )
+                paths[day] = cache.put(keys[day], [daily, *files[day]])
+                report(done / total, f"Rendered {daily[0]}")
+        report(1.0, f"{len(days)} day(s) ready")
+        yield [DailyExport(export_date=day, daily=paths[day][0], jobs=paths[day][1:]) for day in days]
+
+
+def build_range_exports(
+    start: date,
+    end: date,
+    df: pd.DataFrame,
+    employees: Optional[pd.DataFrame] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[float, str], None]] = None,
+) -> List[DailyExport]:
+    """``held_range_exports`` for callers that read the files straight away, after the pin is released."""
+    with held_range_exports(start, end, df, employees, workers, progress) as exports:
+        return exports
+
+
+def build_daily_exports(export_date: date, df: pd.DataFrame, employees: Optional[pd.DataFrame] = None) -> DailyExport:
+    """Render (or fetch from the export cache) the Daily Time and per-job Daily Import workbooks for one day.
+
+    Raises ``FileNotFoundError`` when a template is missing and ``ValueError``
+    when ``df`` has no rows for ``export_date``.
+    """
+    return build_range_exports(export_date, export_date, df, employees)[0]
+
+
+def export_date_range(
+    start: date,
+    end: date,
+    df: pd.DataFrame,
+    employees: Optional[pd.DataFrame] = None,
+    progress: Optional[Callable[[float, str], None]] = None,
+) -> bytes:
+    """ZIP of every day's exports from ``start`` to ``end``, one ``YYYY-MM-DD/`` folder per day."""
+    with ExportArchive() as archive, held_range_exports(start, end, df, employees, progress=progress) as exports:
+        for export in exports:
+            folder = export.export_date.isoformat()
+            for name, content in export.files():
+                archive.add_bytes(f"{folder}/{name}", content)
+        return archive.getvalue()
+
+
+def export_daily_time(
+    export_date: date,
+    df: pd.DataFrame,
+    employees: Optional[pd.DataFrame] = None,
+) -> Tuple[Path, List[Path]]:
+    """Export one day and return ``(daily_time_path, [daily_import_paths])``."""
+    export = build_daily_exports(export_date, df, employees)
+    return export.daily, export.jobs
@@ -5,7 +5,10 @@ Supports both gspread and direct Sheets API access.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import re
+import threading
 import time
 from typing import Optional, Dict, Any, Tuple, List
 from urllib.parse import quote
@@ -55,6 +58,59 @@ def _values_to_dataframe(values: List[List[Any]]) -> pd.DataFrame:
     return pd.DataFrame(normalized_rows, columns=headers)
 
 
+GENERATION_ATTR = "sheets_generation"
+
+
+def frame_generation(df: pd.DataFrame) -> str:
+    """Content hash stamped on a frame read through the manager ("" for frames from elsewhere).
+
+    Unlike ``GoogleSheetsManager.data_generation`` it always describes this very
+    frame, even if a background refresh has replaced the cached one since.
+    """
+    return str(df.attrs.get(GENERATION_ATTR, "")) if isinstance(df, pd.DataFrame) else ""
+
+
+def _frame_generation(df: pd.DataFrame) -> str:
+    """Short content hash of a frame's headers and cells; changes only when the data does."""
+    digest = hashlib.sha1("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    if not df.empty:
+        digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _column_letter(index: int) -> str:
+    """Convert a 1-based column index to its A1 letter (1 -> A, 27 -> AA)."""
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _a1(title: str, cells: str) -> str:
+    """Prefix an A1 range with a quoted worksheet title."""
+    return "'" + str(title).replace("'", "''") + "'!" + cells
+
+
+_UPDATED_RANGE_START = re.compile(r"!\$?[A-Z]+\$?(\d+)")
+# Stale-while-revalidate reads re-read a cached frame in the background once it is this old.
+STALE_AFTER_SECONDS = 30
+# Above this many keys, re-reading the key column is cheaper than one range per key.
+_KEY_CHECK_LIMIT = 200
+
+
+def _same_cell(current: Any, expected: Any) -> bool:
+    """Compare a sheet cell with a last-known value, treating 8 / "8" / "8.00" as equal."""
+    left = "" if current is None else str(current).strip()
+    right = "" if expected is None else str(expected).strip()
+    if left == right:
+        return True
+    try:
+        return float(left.replace(",", "")) == float(right.replace(",", ""))
+    except ValueError:
+        return False
+
+
 class GoogleSheetsManager:
     """Manages Google Sheets integration for timesheet data"""
 
@@ -69,8 +125,14 @@ class GoogleSheetsManager:
             'worksheets': []
         }
         self._data_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+        # {worksheet name: content hash of the cached frame}
+        self._data_generation: Dict[str, str] = {}
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
         self._cache_ttl = 600
         self._force_refresh_cooldown = 5
+        # {title: {"key_column", "letter", "position", "rows": {key: sheet_row}, "timestamp"}}
+        self._row_index_cache: Dict[str, Dict[str, Any]] = {}
 
     # ------------------------------------------------------------------
     # Credential / client helpers
@@ -231,51 +293,50 @@ class GoogleSheetsManager:
             st.error(f"Worksheet '{worksheet_name}' not found")
             return pd.DataFrame()
 
+        try:
+            df = self._download_frame(worksheet, actual_name, spreadsheet_id)
+        except APIError as exc:
+            if exc.response.status_code == 429:
+                cache_entry = self._data_cache.get(cache_key)
+                if cache_entry:
+                    st.info("Using cached Google Sheets data while rate limit resets.")
+                    return cache_entry[1].copy()
+                st.warning("Google Sheets rate limit reached while reading data. Please wait a few seconds and try again.")
+                return pd.DataFrame()
+            st.error(f"Failed to read worksheet '{worksheet_name}': {exc}")
+            return pd.DataFrame()
+        except Exception as exc:
+            st.error(f"Failed to read worksheet '{worksheet_name}': {exc}")
+            return pd.DataFrame()
+        if df is None:
+            return pd.DataFrame()
+
+        self._store_frame(cache_key, df)
+        return df
+
+    def _download_frame(self, worksheet, actual_name: str, spreadsheet_id: Optional[str]) -> Optional[pd.DataFrame]:
+        """Fetch a worksheet's formatted values as a frame (None without a session). Raises on API errors."""
         # gspread path --------------------------------------------------
         if gspread is not None and hasattr(worksheet, "get_all_records"):
-            try:
-                values = worksheet.get_all_values(
-                    value_render_option=ValueRenderOption.formatted,
-                    date_time_render_option=DateTimeOption.formatted_string,
-                )
-                df = _values_to_dataframe(values)
-            except APIError as exc:
-                if exc.response.status_code == 429:
-                    cache_entry = self._data_cache.get(cache_key)
-                    if cache_entry:
-                        st.info("Using cached Google Sheets data while rate limit resets.")
-                        return cache_entry[1].copy()
-                    st.warning("Google Sheets rate limit reached while reading data. Please wait a few seconds and try again.")
-                    return pd.DataFrame()
-                st.error(f"Failed to read worksheet '{worksheet_name}': {exc}")
-                return pd.DataFrame()
-            except Exception as exc:
-                st.error(f"Failed to read worksheet '{worksheet_name}': {exc}")
-                return pd.DataFrame()
+            values = worksheet.get_all_values(
+                value_render_option=ValueRenderOption.formatted,
+                date_time_render_option=DateTimeOption.formatted_string,
+            )
         else:  # HTTP path ---------------------------------------------
             session = self._ensure_session()
             if session is None or spreadsheet_id is None:
-                return pd.DataFrame()
+                return None
             range_name = quote(actual_name)
             url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}/values/{range_name}"
             params = {
                 "valueRenderOption": "FORMATTED_VALUE",
                 "dateTimeRenderOption": "FORMATTED_STRING",
             }
-            try:
-                response = session.get(url, params=params)
-                response.raise_for_status()
-                values = response.json().get("values", [])
-                if not values:
-                    return pd.DataFrame()
-                df = _values_to_dataframe(values)
-            except HTTPError as exc:
-                st.error(f"Failed to read worksheet '{worksheet_name}': {exc}")
-                return pd.DataFrame()
-            except Exception as exc:
-                st.error(f"Failed to read worksheet '{worksheet_name}': {exc}")
-                return pd.DataFrame()
+            response = session.get(url, params=params)
+            response.raise_for_status()
+            values = response.json().get("values", [])
 
+        df = _values_to_dataframe(values)
         if not df.empty:
             df.columns = [str(col).strip() for col in df.columns]
             df = df[[col for col in df.columns if col and col.strip()]]
@@ -284,9 +345,72 @@ class GoogleSheetsManager:
                     'TRUE': True, 'FALSE': False, 'YES': True, 'NO': False,
                     'Y': True, 'N': False, '1': True, '0': False
                 }).fillna(df['Active'])
+        return df
 
+    def _store_frame(self, cache_key: str, df: pd.DataFrame) -> bool:
+        """Cache ``df`` as the current frame for ``cache_key``; True when its content changed."""
+        generation = _frame_generation(df)
+        previous = self._data_cache.get(cache_key)
+        if previous is not None and self._data_generation.get(cache_key) == generation:
+            # Same content: keep the frame (and anything derived from it), just mark it fresh.
+            self._data_cache[cache_key] = (time.time(), previous[1])
+            return False
+        df.attrs[GENERATION_ATTR] = generation
         self._data_cache[cache_key] = (time.time(), df.copy())
-        return df
+        self._data_generation[cache_key] = generation
+        return True
+
+    def data_generation(self, worksheet_name: str) -> str:
+        """Content hash of the last frame read for ``worksheet_name`` ("" if never read).
+
+        Derived data (indexes, masks, rollups) can be keyed on it and reused until
+        a read returns different content.
+        """
+        return self._data_generation.get(worksheet_name, "")
+
+    def read_worksheet_swr(self, worksheet_name: str, spreadsheet_id: Optional[str] = None, stale_after: float = STALE_AFTER_SECONDS) -> pd.DataFrame:
+        """Stale-while-revalidate read: the cached frame at once, a fresh copy in the background.
+
+        With nothing cached this blocks like ``read_worksheet``. Otherwise the
+        cached frame is returned immediately and, once it is ``stale_after``
+        seconds old, re-read on a background thread. ``data_generation`` only
+        changes when the re-read content differs, so a page can re-render on
+        that (see ``is_refreshing``). Writes drop the cached frame, so the read
+        after a write always waits for fresh data.
+        """
+        entry = self._data_cache.get(worksheet_name)
+        if entry is None:
+            return self.read_worksheet(worksheet_name, spreadsheet_id)
+        if (time.time() - entry[0]) >= stale_after:
+            self._revalidate(worksheet_name, spreadsheet_id, entry)
+        return entry[1].copy()
+
+    def is_refreshing(self, worksheet_name: str) -> bool:
+        return worksheet_name in self._refreshing
+
+    def _revalidate(self, worksheet_name: str, spreadsheet_id: Optional[str], entry: Tuple[float, pd.DataFrame]) -> None:
+        with self._refresh_lock:
+            if worksheet_name in self._refreshing:
+                return
+            self._refreshing.add(worksheet_name)
+        # Resolve the worksheet on the script thread, where errors can be shown.
+        worksheet, actual_name = self.find_worksheet([worksheet_name], spreadsheet_id)
+        if not worksheet:
+            self._refreshing.discard(worksheet_name)
+            return
+
+        def _refresh() -> None:
+            try:
+                df = self._download_frame(worksheet, actual_name, spreadsheet_id)
+                # Skip the result if a write (or a foreground read) replaced the frame meanwhile.
+                if df is not None and self._data_cache.get(worksheet_name) is entry:
+                    self._store_frame(worksheet_name, df)
+            except Exception:
+                pass  # keep serving the cached frame; the next stale read tries again
+            finally:
+                self._refreshing.discard(worksheet_name)
+
+        threading.Thread(target=_refresh, name=f"sheets-refresh-{worksheet_name}", daemon=True).start()
 
     def append_rows(self, worksheet_name: str, rows: List[List[Any]], spreadsheet_id: Optional[str] = None, value_input_option: str = "USER_ENTERED") -> bool:
         """Append rows to a worksheet without overwriting existing data"""
@@ -312,8 +436,9 @@ class GoogleSheetsManager:
 
         if gspread is not None and hasattr(worksheet, "append_rows"):
             try:
-                worksheet.append_rows(cleaned_rows, value_input_option=value_input_option)
+                response = worksheet.append_rows(cleaned_rows, value_input_option=value_input_option)
                 self._data_cache.pop(actual_name or worksheet_name, None)
+                self._record_appended_rows(actual_name or worksheet_name, response, cleaned_rows)
                 return True
             except APIError as exc:
                 if exc.response.status_code == 429:
@@ -338,6 +463,7 @@ class GoogleSheetsManager:
             response = session.post(url, params=params, json=payload)
             response.raise_for_status()
             self._data_cache.pop(actual_name or worksheet_name, None)
+            self._record_appended_rows(actual_name or worksheet_name, response.json(), cleaned_rows)
             return True
         except HTTPError as exc:
             st.error(f"Failed to append to worksheet '{worksheet_name}': {exc}")
@@ -379,6 +505,7 @@ class GoogleSheetsManager:
                 worksheet.update(values, value_input_option=value_input_option)
                 cache_key = actual_name or worksheet_name
                 self._data_cache[cache_key] = (time.time(), data.copy())
+                self._row_index_cache.pop(cache_key, None)
                 return True
             except APIError as exc:
                 if exc.response.status_code == 429:
@@ -402,6 +529,7 @@ class GoogleSheetsManager:
             update_resp.raise_for_status()
             cache_key = actual_name or worksheet_name
             self._data_cache[cache_key] = (time.time(), data.copy())
+            self._row_index_cache.pop(cache_key, None)
             return True
         except HTTPError as exc:
             st.error(f"Failed to write to worksheet '{worksheet_name}': {exc}")
@@ -410,6 +538,436 @@ class GoogleSheetsManager:
             st.error(f"Failed to write to worksheet '{worksheet_name}': {exc}")
             return False
 
+    # ------------------------------------------------------------------
+    # Keyed row operations
+    # ------------------------------------------------------------------
+    def _values_batch_get(self, worksheet, actual_name: str, ranges: List[str], spreadsheet_id: Optional[str]) -> List[List[List[Any]]]:
+        """Read several A1 ranges (without sheet prefix) in one request."""
+        if gspread is not None and hasattr(worksheet, "batch_get"):
+            return [list(block) for block in worksheet.batch_get(
+                ranges,
+                value_render_option=ValueRenderOption.formatted,
+                date_time_render_option=DateTimeOption.formatted_string,
+            )]
+        session = self._ensure_session()
+        if session is None or spreadsheet_id is None:
+            raise RuntimeError("Google Sheets session is not available")
+        url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}/values:batchGet"
+        params = {
+            "ranges": [_a1(actual_name, cells) for cells in ranges],
+            "valueRenderOption": "FORMATTED_VALUE",
+            "dateTimeRenderOption": "FORMATTED_STRING",
+        }
+        response = session.get(url, params=params)
+        response.raise_for_status()
+        return [block.get("values", []) for block in response.json().get("valueRanges", [])]
+
+    def _values_batch_update(self, worksheet, actual_name: str, data: List[Tuple[str, List[List[Any]]]], spreadsheet_id: Optional[str], value_input_option: str) -> None:
+        """Write several A1 ranges (without sheet prefix) in one request."""
+        if gspread is not None and hasattr(worksheet, "batch_update"):
+            worksheet.batch_update(
+                [{"range": cells, "values": values} for cells, values in data],
+                value_input_option=value_input_option,
+            )
+            return
+        session = self._ensure_session()
+        if session is None or spreadsheet_id is None:
+            raise RuntimeError("Google Sheets session is not available")
+        url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}/values:batchUpdate"
+        payload = {
+            "valueInputOption": value_input_option,
+            "data": [{"range": _a1(actual_name, cells), "values": values} for cells, values in data],
+        }
+        response = session.post(url, json=payload)
+        response.raise_for_status()
+
+    def _delete_sheet_rows(self, worksheet, actual_name: str, rows: List[int], spreadsheet_id: Optional[str]) -> None:
+        """Delete 1-based sheet rows in one structural batchUpdate (bottom-up so indexes stay valid)."""
+        if gspread is not None and hasattr(worksheet, "spreadsheet") and hasattr(worksheet, "id"):
+            sheet_id = worksheet.id
+        else:
+            sheet_id = next(
+                (ws.get("sheetId") for ws in self._list_worksheets_http(spreadsheet_id) if ws.get("title") == actual_name),
+                None,
+            )
+            if sheet_id is None:
+                raise RuntimeError(f"Could not resolve sheet id for '{actual_name}'")
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "dimension": "ROWS",
+                        "startIndex": row - 1,
+                        "endIndex": row,
+                    }
+                }
+            }
+            for row in sorted(set(rows), reverse=True)
+        ]
+        body = {"requests": requests}
+        if gspread is not None and hasattr(worksheet, "spreadsheet"):
+            worksheet.spreadsheet.batch_update(body)
+            return
+        session = self._ensure_session()
+        if session is None or spreadsheet_id is None:
+            raise RuntimeError("Google Sheets session is not available")
+        response = session.post(f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}:batchUpdate", json=body)
+        response.raise_for_status()
+
+    def _build_row_index(self, worksheet, actual_name: str, key_column: str, spreadsheet_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        header = self._values_batch_get(worksheet, actual_name, ["1:1"], spreadsheet_id)
+        headers = [str(cell).strip() for cell in (header[0][0] if header and header[0] else [])]
+        wanted = _normalize_title(key_column)
+        position = next((idx for idx, name in enumerate(headers) if _normalize_title(name) == wanted), None)
+        if position is None:
+            return None
+        letter = _column_letter(position + 1)
+        column = self._values_batch_get(worksheet, actual_name, [f"{letter}2:{letter}"], spreadsheet_id)
+        rows: Dict[str, int] = {}
+        for offset, cell in enumerate(column[0] if column else [], start=2):
+            key = str(cell[0]).strip() if cell else ""
+            if key:
+                rows.setdefault(key, offset)  # the first row holding a key wins, as in _frame_row_index
+        entry = {
+            "key_column": key_column,
+            "letter": letter,
+            "position": position,
+            "rows": rows,
+            "headers": headers,
+            "timestamp": time.time(),
+        }
+        self._row_index_cache[actual_name] = entry
+        return entry
+
+    def _frame_row_index(self, worksheet_name: str, actual_name: str, key_column: str) -> Optional[Dict[str, Any]]:
+        """Index ``key_column`` from the cached frame of the sheet, without a request.
+
+        Frame row ``i`` is sheet row ``i + 2``; the first row holding a key wins.
+        The column letter assumes no blank headers sit before the key column,
+        which ``_locate_rows`` checks against the live header before trusting it.
+        """
+        cached = self._data_cache.get(worksheet_name) or self._data_cache.get(actual_name)
+        if not cached:
+            return None
+        stamp, df = cached
+        if (time.time() - stamp) >= self._cache_ttl or key_column not in df.columns:
+            return None
+        keys = df[key_column].astype(str).str.strip().reset_index(drop=True)
+        keys = keys[keys.ne("") & ~keys.duplicated()]
+        position = list(df.columns).index(key_column)
+        entry = {
+            "key_column": key_column,
+            "letter": _column_letter(position + 1),
+            "position": position,
+            "rows": dict(zip(keys.tolist(), (keys.index + 2).tolist())),
+            "headers": None,
+            "timestamp": stamp,
+        }
+        self._row_index_cache[actual_name] = entry
+        return entry
+
+    def _cached_row_index(self, actual_name: str, key_column: str, worksheet_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """The row index for ``key_column``, reseeded from the cached frame when that is newer."""
+        entry = self._row_index_cache.get(actual_name)
+        if entry and entry["key_column"] != key_column:
+            entry = None
+        if entry and (time.time() - entry["timestamp"]) >= self._cache_ttl:
+            entry = None
+        if worksheet_name is not None:
+            cached = self._data_cache.get(worksheet_name) or self._data_cache.get(actual_name)
+            if cached and (entry is None or cached[0] > entry["timestamp"]):
+                entry = self._frame_row_index(worksheet_name, actual_name, key_column) or entry
+        return entry
+
+    def _record_appended_rows(self, actual_name: str, response: Any, rows: List[List[Any]]) -> None:
+        """Extend a cached row index with rows we just appended, using the API's updatedRange."""
+        entry = self._row_index_cache.get(actual_name)
+        if not entry:
+            return
+        updated_range = ""
+        if isinstance(response, dict):
+            updated_range = (response.get("updates") or {}).get("updatedRange", "")
+        match = _UPDATED_RANGE_START.search(updated_range or "")
+        if not match:
+            self._row_index_cache.pop(actual_name, None)
+            return
+        first_row = int(match.group(1))
+        position = entry["position"]
+        for offset, row in enumerate(rows):
+            key = str(row[position]).strip() if position < len(row) and row[position] is not None else ""
+            if key:
+                entry["rows"][key] = first_row + offset
+
+    def get_row_index(self, worksheet_name: str, key_column: str, spreadsheet_id: Optional[str] = None, force_refresh: bool = False) -> Dict[str, int]:
+        """Map each non-blank value of ``key_column`` to its 1-based sheet row."""
+        worksheet, actual_name = self.find_worksheet([worksheet_name], spreadsheet_id)
+        if not worksheet:
+            st.error(f"Worksheet '{worksheet_name}' not found")
+            return {}
+        entry = None if force_refresh else self._cached_row_index(actual_name, key_column)
+        if entry is None:
+            try:
+                entry = self._build_row_index(worksheet, actual_name, key_column, spreadsheet_id)
+            except Exception as exc:
+                st.error(f"Failed to index worksheet '{worksheet_name}': {exc}")
+                return {}
+        return dict(entry["rows"]) if entry else {}
+
+    def _locate_rows(
+        self,
+        worksheet,
+        actual_name: str,
+        key_column: str,
+        keys: List[str],
+        spreadsheet_id: Optional[str],
+        worksheet_name: Optional[str] = None,
+    ) -> Tuple[Optional[Dict[str, int]], List[str]]:
+        """Resolve keys to sheet rows and return them with the sheet's header row.
+
+        With a cached index the header and the key cell of each row come back in
+        one batchGet; if the header moved or a cell no longer holds its key the
+        sheet is re-indexed once.
+        """
+        entry = self._cached_row_index(actual_name, key_column, worksheet_name)
+        if entry is not None and len(keys) <= _KEY_CHECK_LIMIT and all(key in entry["rows"] for key in keys):
+            located = {key: entry["rows"][key] for key in keys}
+            cells = [f"{entry['letter']}{row}" for row in located.values()]
+            found = self._values_batch_get(worksheet, actual_name, ["1:1"] + cells, spreadsheet_id)
+            headers = [str(cell).strip() for cell in (found[0][0] if found and found[0] else [])]
+            current = [str(block[0][0]).strip() if block and block[0] else "" for block in found[1:]]
+            in_place = (
+                entry["position"] < len(headers)
+                and _normalize_title(headers[entry["position"]]) == _normalize_title(key_column)
+            )
+            if in_place and current == list(located.keys()):
+                entry["headers"] = headers
+                return located, headers
+        entry = self._build_row_index(worksheet, actual_name, key_column, spreadsheet_id)
+        if entry is None:
+            return None, []
+        if not all(key in entry["rows"] for key in keys):
+            return None, entry["headers"]
+        return {key: entry["rows"][key] for key in keys}, entry["headers"]
+
+    def update_rows_by_key(
+        self,
+        worksheet_name: str,
+        key_column: str,
+        updates: Dict[str, Dict[str, Any]],
+        spreadsheet_id: Optional[str] = None,
+        value_input_option: str = "RAW",
+    ) -> bool:
+        """Update columns of the rows identified by ``key_column`` values in one batch request.
+
+        ``updates`` maps key -> {column header: new value}. Only the listed cells are written.
+        """
+        try:
+            self.write_rows_by_key(worksheet_name, key_column, updates, spreadsheet_id, value_input_option)
+            return True
+        except LookupError as exc:
+            st.error(str(exc))
+            return False
+        except APIError as exc:
+            if exc.response.status_code == 429:
+                st.warning("Google Sheets rate limit reached while writing data. Please wait a few seconds and try again.")
+                return False
+            st.error(f"Failed to update worksheet '{worksheet_name}': {exc}")
+            return False
+        except Exception as exc:
+            st.error(f"Failed to update worksheet '{worksheet_name}': {exc}")
+            return False
+
+    def write_rows_by_key(
+        self,
+        worksheet_name: str,
+        key_column: str,
+        updates: Dict[str, Dict[str, Any]],
+        spreadsheet_id: Optional[str] = None,
+        value_input_option: str = "RAW",
+    ) -> None:
+        """``update_rows_by_key`` for callers off the script thread: failures raise instead of reaching the page.
+
+        A missing worksheet, key or column raises ``LookupError``; API and network errors propagate.
+        """
+        if not updates:
+            return
+        worksheet, actual_name = self.find_worksheet([worksheet_name], spreadsheet_id)
+        if not worksheet:
+            raise LookupError(f"Worksheet '{worksheet_name}' not found")
+        keys = [str(key).strip() for key in updates]
+        located, headers = self._locate_rows(worksheet, actual_name, key_column, keys, spreadsheet_id, worksheet_name)
+        if located is None:
+            raise LookupError(f"Some rows to update were not found in '{worksheet_name}'.")
+        positions = {_normalize_title(name): idx for idx, name in enumerate(headers) if name}
+        data = []
+        for key, columns in updates.items():
+            row = located[str(key).strip()]
+            for column, value in columns.items():
+                position = positions.get(_normalize_title(column))
+                if position is None:
+                    raise LookupError(f"Column '{column}' not found in '{worksheet_name}'.")
+                value = "" if value is None or (isinstance(value, float) and pd.isna(value)) else value
+                data.append((f"{_column_letter(position + 1)}{row}", [[value]]))
+        self._values_batch_update(worksheet, actual_name, data, spreadsheet_id, value_input_option)
+        self._data_cache.pop(actual_name, None)
+        self._data_cache.pop(worksheet_name, None)
+
+    def delete_rows_by_key(
+        self,
+        worksheet_name: str,
+        key_column: str,
+        keys: List[str],
+        spreadsheet_id: Optional[str] = None,
+    ) -> bool:
+        """Delete the rows identified by ``key_column`` values without rewriting the sheet."""
+        keys = [str(key).strip() for key in keys if str(key).strip()]
+        if not keys:
+            return True
+        worksheet, actual_name = self.find_worksheet([worksheet_name], spreadsheet_id)
+        if not worksheet:
+            st.error(f"Worksheet '{worksheet_name}' not found")
+            return False
+        try:
+            located, _ = self._locate_rows(worksheet, actual_name, key_column, keys, spreadsheet_id, worksheet_name)
+            if located is None:
+                st.error(f"Some rows to delete were not found in '{worksheet_name}'.")
+                return False
+            deleted = sorted(set(located.values()))
+            self._delete_sheet_rows(worksheet, actual_name, deleted, spreadsheet_id)
+            self._data_cache.pop(actual_name, None)
+            self._data_cache.pop(worksheet_name, None)
+            entry = self._row_index_cache.get(actual_name)
+            if entry:
+                remaining = {}
+                for key, row in entry["rows"].items():
+                    if key in located:
+                        continue
+                    # Each deleted row above this one shifts it up by one.
+                    shift = sum(1 for gone in deleted if gone < row)
+                    remaining[key] = row - shift
+                entry["rows"] = remaining
+            return True
+        except APIError as exc:
+            if exc.response.status_code == 429:
+                st.warning("Google Sheets rate limit reached while writing data. Please wait a few seconds and try again.")
+                return False
+            st.error(f"Failed to delete rows from worksheet '{worksheet_name}': {exc}")
+            return False
+        except Exception as exc:
+            st.error(f"Failed to delete rows from worksheet '{worksheet_name}': {exc}")
+            return False
+
+    def update_row_by_key(
+        self,
+        worksheet_name: str,
+        key_column: str,
+        key: str,
+        updates: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        spreadsheet_id: Optional[str] = None,
+        value_input_option: str = "RAW",
+    ) -> Optional[Dict[str, Any]]:
+        """Edit cells of one keyed row with a single values:batchUpdate of just those cells.
+
+        Cells that are not edited are never written, so a concurrent change to
+        another column of the row is kept. The row is read first; if any column in ``expected`` no longer matches,
+        nothing is written (someone else changed the row). Returns the row as
+        written, keyed by header, or None when the update did not happen.
+        """
+        key = str(key).strip()
+        worksheet, actual_name = self.find_worksheet([worksheet_name], spreadsheet_id)
+        if not worksheet:
+            st.error(f"Worksheet '{worksheet_name}' not found")
+            return None
+        try:
+            header = self._values_batch_get(worksheet, actual_name, ["1:1"], spreadsheet_id)
+            headers = [str(cell).strip() for cell in (header[0][0] if header and header[0] else [])]
+            positions = {_normalize_title(name): idx for idx, name in enumerate(headers) if name}
+            key_position = positions.get(_normalize_title(key_column))
+            if key_position is None:
+                st.error(f"Column '{key_column}' not found in '{worksheet_name}'.")
+                return None
+
+            def _read_row(row_number: int) -> List[Any]:
+                block = self._values_batch_get(worksheet, actual_name, [f"{row_number}:{row_number}"], spreadsheet_id)
+                cells = list(block[0][0]) if block and block[0] else []
+                return cells + ["" for _ in range(len(headers) - len(cells))]
+
+            entry = self._cached_row_index(actual_name, key_column, worksheet_name)
+            row_number = entry["rows"].get(key) if entry else None
+            current = _read_row(row_number) if row_number else []
+            if not current or str(current[key_position]).strip() != key:
+                entry = self._build_row_index(worksheet, actual_name, key_column, spreadsheet_id)
+                row_number = entry["rows"].get(key) if entry else None
+                if not row_number:
+                    st.error(f"The row to edit was not found in '{worksheet_name}'. It may have been deleted.")
+                    return None
+                current = _read_row(row_number)
+
+            for column, value in (expected or {}).items():
+                position = positions.get(_normalize_title(column))
+                if position is not None and not _same_cell(current[position], value):
+                    st.warning("This entry was changed by someone else since it was loaded. Refresh and try again.")
+                    return None
+
+            edited = {}
+            for column, value in updates.items():
+                position = positions.get(_normalize_title(column))
+                if position is None:
+                    st.error(f"Column '{column}' not found in '{worksheet_name}'.")
+                    return None
+                edited[position] = "" if value is None or (isinstance(value, float) and pd.isna(value)) else value
+            if not edited:
+                return dict(zip(headers, current))
+
+            data = [(f"{_column_letter(position + 1)}{row_number}", [[value]]) for position, value in sorted(edited.items())]
+            self._values_batch_update(worksheet, actual_name, data, spreadsheet_id, value_input_option)
+            self._data_cache.pop(actual_name, None)
+            self._data_cache.pop(worksheet_name, None)
+            written = list(current)
+            for position, value in edited.items():
+                written[position] = value
+            return dict(zip(headers, written))
+        except APIError as exc:
+            if exc.response.status_code == 429:
+                st.warning("Google Sheets rate limit reached while writing data. Please wait a few seconds and try again.")
+                return None
+            st.error(f"Failed to update worksheet '{worksheet_name}': {exc}")
+            return None
+        except Exception as exc:
+            st.error(f"Failed to update worksheet '{worksheet_name}': {exc}")
+            return None
+
+    def update_ranges(
+        self,
+        worksheet_name: str,
+        data: List[Tuple[str, List[List[Any]]]],
+        spreadsheet_id: Optional[str] = None,
+        value_input_option: str = "RAW",
+    ) -> bool:
+        """Write a list of (A1 range, values) pairs in one values:batchUpdate request."""
+        if not data:
+            return True
+        worksheet, actual_name = self.find_worksheet([worksheet_name], spreadsheet_id)
+        if not worksheet:
+            st.error(f"Worksheet '{worksheet_name}' not found")
+            return False
+        try:
+            self._values_batch_update(worksheet, actual_name, data, spreadsheet_id, value_input_option)
+            self._data_cache.pop(actual_name, None)
+            self._data_cache.pop(worksheet_name, None)
+            return True
+        except APIError as exc:
+            if exc.response.status_code == 429:
+                st.warning("Google Sheets rate limit reached while writing data. Please wait a few seconds and try again.")
+                return False
+            st.error(f"Failed to update worksheet '{worksheet_name}': {exc}")
+            return False
+        except Exception as exc:
+            st.error(f"Failed to update worksheet '{worksheet_name}': {exc}")
+            return False
+
 
 # Global instance
 sheets_manager = GoogleSheetsManager()
@@ -420,16 +978,20 @@ def get_sheets_manager() -> GoogleSheetsManager:
     return sheets_manager
 
 
-def read_timesheet_data(worksheet_name: str, force_refresh: bool = False) -> pd.DataFrame:
+def read_timesheet_data(worksheet_name: str, force_refresh: bool = False, stale_while_revalidate: bool = False) -> pd.DataFrame:
     """
     Convenience function to read timesheet data from Google Sheets
     Falls back to Excel if Google Sheets is not configured
+    With stale_while_revalidate, a cached frame is returned at once and refreshed in the background
     """
     try:
         sheet_id = st.secrets.get("google_sheets_id", "")
         if sheet_id:
             manager = get_sheets_manager()
-            df = manager.read_worksheet(worksheet_name, sheet_id, force_refresh=force_refresh)
+            if stale_while_revalidate and not force_refresh:
+                df = manager.read_worksheet_swr(worksheet_name, sheet_id)
+            else:
+                df = manager.read_worksheet(worksheet_name, sheet_id, force_refresh=force_refresh)
             if isinstance(df, pd.DataFrame) and not df.empty:
                 return df
     except Exception as exc:
@@ -1,10 +1,11 @@
-import io
 import pandas as pd
-from datetime import date
-from openpyxl import load_workbook
+from datetime import date, datetime
+from pathlib import Path
 from openpyxl.styles import Font
 from app.config import APP_DIR
 from app.data.workbook import get_time_data
+from app.exports.daily_import import workbook_bytes
+from app.exports.template_cache import load_template
 
 DAILY_TEMPLATE_BOOK  = APP_DIR.parent / "Daily Time.xlsx"
 
@@ -16,10 +17,15 @@ def daily_time_report(xlsx_path: str, export_date: date) -> bytes | None:
     day = td[td["Date"].astype(str).str[:10] == date_str].copy()
     if day.empty:
         return None
-    if not DAILY_TEMPLATE_BOOK.exists():
+    return render_daily_time(day, export_date)
+
+def render_daily_time(day: pd.DataFrame, export_date: date, template: Path = DAILY_TEMPLATE_BOOK) -> bytes | None:
+    """Fill the Daily Time template for one day's entries; identical input gives identical bytes."""
+    if not template.exists():
         return None
+    date_str = export_date.strftime("%Y-%m-%d")
 
-    wb = load_workbook(DAILY_TEMPLATE_BOOK)
+    wb = load_template(template)
     ws = wb.active
 
     try:
@@ -57,6 +63,6 @@ def daily_time_report(xlsx_path: str, export_date: date) -> bytes | None:
             ws.cell(row=row_ptr, column=2, value=comment); row_ptr += 1
         row_ptr += 1
 
-    out = io.BytesIO()
-    wb.save(out); out.seek(0)
-    return out.getvalue()
+    content = workbook_bytes(wb, datetime.combine(export_date, datetime.min.time()))
+    wb.close()
+    return content
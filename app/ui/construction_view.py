@@ -0,0 +1,130 @@
+from datetime import date
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+import streamlit as st
+
+from app.construction.registry import CATEGORIES, column_span, resolve
+
+
+def _slug(text: str) -> str:
+    return ''.join(ch.lower() if ch.isalnum() else '_' for ch in text).strip('_')
+
+
+def _text(value) -> str:
+    return "" if pd.isna(value) else str(value).strip()
+
+
+def _date_text(value) -> str:
+    parsed = pd.to_datetime(value, errors="coerce")
+    return parsed.strftime("%Y-%m-%d") if pd.notna(parsed) else str(value).strip()
+
+
+def _submitted(value) -> str:
+    if value is None:
+        return ""
+    if hasattr(value, "strftime") and not isinstance(value, str):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def incomplete_toggle(category: str) -> bool:
+    """The category's "Only Show Incomplete ..." checkbox (False for unknown categories)."""
+    schema = CATEGORIES.get(category)
+    if schema is None:
+        return False
+    return st.checkbox(
+        schema.toggle_label,
+        value=st.session_state.get(schema.toggle_key, False),
+        key=schema.toggle_key,
+        help=schema.toggle_help,
+    )
+
+
+def category_view(
+    category: str,
+    sheet_df: pd.DataFrame,
+    tag: str,
+    row_position: Optional[int],
+    update_row: Callable[[str, str, Dict[str, object]], bool],
+    user_name: Callable[[], str],
+):
+    """Details table and status update form for one tag of a registered category.
+
+    ``row_position`` is the tag's 0-based row in ``sheet_df``; ``update_row``
+    writes the submitted ``{column: value}`` changes and ``user_name`` supplies
+    the sign-off stamp.
+    """
+    schema = CATEGORIES[category]
+    noun = schema.noun
+    if sheet_df.empty:
+        st.warning(f"No {noun} data is available to display.")
+        return
+    view = resolve(category, sheet_df.columns)
+    if view.tag is None:
+        st.warning(f"{category} sheet is missing header information.")
+        return
+    if row_position is None:
+        st.warning(f"Unable to locate details for the selected {noun} tag.")
+        return
+    row = dict(zip(view.headers, sheet_df.iloc[row_position].tolist()))
+
+    if not view.detail:
+        st.info(f"No additional columns ({column_span(*schema.detail)}) are available for this {noun} sheet.")
+    else:
+        st.subheader(f"{schema.title} Details")
+        st.table(pd.DataFrame({"Field": list(view.detail), "Value": [_text(row.get(col, "")) for col in view.detail]}))
+
+    if not view.fields:
+        span = column_span(min(schema.fields), max(schema.fields) + 1)
+        st.info(f"No status columns ({span}) are available for this {noun} sheet.")
+        return
+
+    st.write("")
+    st.subheader(f"Update {schema.title} Status")
+    updated_values = {}
+    tag_slug = _slug(tag) or 'tag'
+    for col in view.fields:
+        raw_value = row.get(col, "")
+        if pd.isna(raw_value):
+            current_value = ""
+        elif view.displays_as_date(col):
+            current_value = _date_text(raw_value)
+        else:
+            current_value = str(raw_value).strip()
+        label = col or "Field"
+        input_key = f"{schema.key_prefix}_{tag_slug}_{_slug(col or 'field')}"
+        if view.is_date_field(col):
+            default_date = None
+            if current_value:
+                parsed_date = pd.to_datetime(current_value, errors="coerce")
+                if pd.notna(parsed_date):
+                    default_date = parsed_date.date()
+            if default_date is None and schema.date_default_today:
+                default_date = date.today()
+            date_value = st.date_input(label, value=default_date, key=input_key, format="YYYY-MM-DD")
+            updated_values[col] = date_value if date_value else None
+        else:
+            updated_values[col] = st.text_input(label, value=current_value, key=input_key)
+
+    if st.button(f"Submit {schema.title} Status", type="primary"):
+        try:
+            updates_to_apply = {col: _submitted(value) for col, value in updated_values.items()}
+            user_identifier = None
+            for signoff_column, date_columns in view.signoffs:
+                written = [updates_to_apply[col] for col in date_columns if col in updates_to_apply]
+                if not written:
+                    continue
+                if user_identifier is None:
+                    user_identifier = user_name()
+                has_value = any(str(value).strip() for value in written)
+                updates_to_apply[signoff_column] = user_identifier if has_value else ""
+            if not updates_to_apply:
+                st.warning(f"Nothing to update for this {noun} tag.")
+            elif update_row(category, tag.strip(), updates_to_apply):
+                st.success(f"{noun[:1].upper()}{noun[1:]} details updated successfully.")
+                st.rerun()
+            else:
+                st.error(f"Failed to update {noun} details.")
+        except Exception as exc:
+            st.error(f"Unexpected error while submitting {noun} updates: {exc}")
@@ -13,7 +13,7 @@ def export_panel():
             st.download_button(f"Download {file_name}", data=file_bytes, file_name=file_name, use_container_width=True)
             n_files += 1
         if n_files == 0:
-            st.info("No per‑job files were created (no REG/OT hours).")
+            st.info("No per‑job files were created (no time entries for this date).")
         # Daily
         out = daily_time_report(st.session_state.xlsx_path, export_date)
         if out:
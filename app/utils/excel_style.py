@@ -1,12 +1,94 @@
-from openpyxl.utils import get_column_letter
+from copy import copy
+from typing import Iterable, Optional
+
+from openpyxl.styles import NamedStyle
+
+
+def clone_row_block(src_ws, dst_ws, src_row: int, first_row: int, last_row: int, max_col: int):
+    """Copy the styles (and height) of ``src_row`` onto every row in ``first_row..last_row``.
+
+    The template row's style arrays are read once; each destination cell then gets
+    its own copy of the array, which is all openpyxl stores per cell (font, fill,
+    border, alignment, number format and protection are indices into the
+    workbook's shared style tables). Both sheets must belong to the same workbook.
+    """
+    height = src_ws.row_dimensions[src_row].height if src_row in src_ws.row_dimensions else None
+    styles = []
+    for col in range(1, max_col + 1):
+        src_cell = src_ws._cells.get((src_row, col))
+        if src_cell is not None and src_cell.has_style:
+            styles.append((col, src_cell._style))
+    for row in range(first_row, last_row + 1):
+        if row == src_row and dst_ws is src_ws:
+            continue
+        if height is not None:
+            dst_ws.row_dimensions[row].height = height
+        for col, style in styles:
+            dst_ws.cell(row=row, column=col)._style = copy(style)
+
 
 def clone_row_styles(src_ws, dst_ws, src_row: int, dst_row: int, max_col: int):
-    if src_row in src_ws.row_dimensions:
-        dst_ws.row_dimensions[dst_row].height = src_ws.row_dimensions[src_row].height
-    for col in range(1, max_col+1):
-        c = get_column_letter(col)
-        src_cell = src_ws[f"{c}{src_row}"]
-        dst_cell = dst_ws[f"{c}{dst_row}"]
-        if src_cell.has_style:
-            dst_cell._style = src_cell._style
-        dst_cell.number_format = src_cell.number_format
+    clone_row_block(src_ws, dst_ws, src_row, dst_row, dst_row, max_col)
+
+
+def named_style_from_cell(wb, name: str, cell) -> str:
+    """Register ``cell``'s formatting as the named style ``name`` (once per workbook) and return the name."""
+    if name not in wb.named_styles:
+        style = NamedStyle(name=name)
+        style.font = copy(cell.font)
+        style.fill = copy(cell.fill)
+        style.border = copy(cell.border)
+        style.alignment = copy(cell.alignment)
+        style.protection = copy(cell.protection)
+        style.number_format = cell.number_format
+        wb.add_named_style(style)
+    return name
+
+
+def apply_named_style(ws, name: str, rows: Iterable[int], cols: Iterable[int], row_height: Optional[float] = None):
+    """Give every cell in ``rows`` x ``cols`` the named style ``name``.
+
+    The style is resolved by name once; the remaining cells receive a copy of
+    the resulting style array instead of repeating the lookup per cell.
+    """
+    rows, cols = list(rows), list(cols)
+    if not rows or not cols:
+        return
+    first = ws.cell(row=rows[0], column=cols[0])
+    first.style = name
+    style = first._style
+    for row in rows:
+        if row_height is not None:
+            ws.row_dimensions[row].height = row_height
+        for col in cols:
+            cell = ws.cell(row=row, column=col)
+            if cell is not first:
+                cell._style = copy(style)
+
+
+def restyle_block(ws, min_row: int, max_row: int, min_col: int, max_col: int, **attrs):
+    """Set style attributes (``font=``, ``alignment=``, ...) on every existing cell of a block.
+
+    Cells that share a style are restyled once and the rest get a copy of the
+    result, so number formats written by pandas survive and the workbook's
+    style tables are searched once per distinct source style, not per cell.
+    """
+    if (max_row - min_row + 1) * (max_col - min_col + 1) < len(ws._cells):
+        block = (ws._cells.get((row, col)) for row in range(min_row, max_row + 1) for col in range(min_col, max_col + 1))
+    else:
+        block = (
+            cell for (row, col), cell in ws._cells.items()
+            if min_row <= row <= max_row and min_col <= col <= max_col
+        )
+    resolved = {}
+    for cell in block:
+        if cell is None:
+            continue
+        key = None if cell._style is None else tuple(cell._style)
+        style = resolved.get(key)
+        if style is None:
+            for name, value in attrs.items():
+                setattr(cell, name, value)
+            resolved[key] = cell._style
+        else:
+            cell._style = copy(style)
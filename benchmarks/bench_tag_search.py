@@ -0,0 +1,42 @@
+"""Time the Construction Reporting tag search on a synthetic category sheet.
+
+    python benchmarks/bench_tag_search.py [tags]
+
+Defaults to 50,000 tags and reports the index build time and the average
+search time for a mix of prefix, token and substring queries.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.construction.tag_search import TagSearchIndex  # noqa: E402
+
+QUERIES = ["c", "cab-01", "0042", "42", "tr 7", "b-12", "x9z", "2-3", "ab-0999", "7-00"]
+
+
+def synthetic_tags(count: int):
+    prefixes = ["CAB", "TR", "JB", "EQ", "INST"]
+    return [f"{prefixes[i % len(prefixes)]}-{(i // 7) % 10:01d}{i:05d}-{chr(65 + i % 26)}" for i in range(count)]
+
+
+def main(count: int = 50_000) -> None:
+    tags = synthetic_tags(count)
+    start = time.perf_counter()
+    index = TagSearchIndex(tags)
+    build = time.perf_counter() - start
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in QUERIES:
+            index.search(query)
+    per_search = (time.perf_counter() - start) / (rounds * len(QUERIES))
+    print(f"{count} tags: build {build * 1000:.0f} ms, search {per_search * 1e6:.0f} us on average")
+    for query in QUERIES[:4]:
+        print(f"  {query!r}: {index.search(query, limit=3)}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -1,27 +1,30 @@
 import streamlit as st
 import pandas as pd
 from pathlib import Path
-import io
-import zipfile
-import os
 import re
-import tempfile
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
 import openpyxl.styles
 from copy import copy
-from shutil import copyfile
 from time import sleep
 import time
 from app.data.time_data import (
+    ENTRY_ID_COLUMN,
     TIME_DATA_COLUMNS,
     append_time_rows,
+    ensure_entry_ids,
     filter_time_data_by_date,
     normalize_job_area_value,
     normalize_sheet_value,
     prepare_time_data_dataframe,
 )
+from app.data.labor_cube import LaborCube
+from app.data.validation import validate_time_entries
+from app.exports.archive import ExportArchive
+from app.exports.daily_import import write_daily_imports
+from app.exports.engine import import_rows_by_job, resolve_employees
+from app.exports.export_cache import export_key, get_export_cache
+from app.exports.template_cache import load_template
 from app.style_utils import apply_app_theme, apply_watermark
 from datetime import datetime, date
 from typing import Optional
@@ -90,6 +93,9 @@ if "auto_fresh_data" not in st.session_state:
 
 XLSX = None
 
+# Bump whenever the export package's rendering changes, so packages cached on disk by older code are not served.
+EXPORT_PACKAGE_FORMAT = 2
+
 # File modification time monitoring for automatic reloads
 def check_file_modified():
     """Placeholder: Google Sheets updates are handled via cache refresh."""
@@ -374,6 +380,13 @@ def _sync_time_data_to_google(new_data_df: pd.DataFrame) -> bool:
         def _norm(col_name: str) -> str:
             return ''.join(ch for ch in str(col_name).strip().lower() if ch.isalnum())
 
+        if header_values and _norm(ENTRY_ID_COLUMN) not in {_norm(header) for header in headers}:
+            # Older sheets predate Entry IDs; add the header after the last column.
+            header_cell = f"{get_column_letter(len(header_values) + 1)}1"
+            if not manager.update_ranges(actual_title, [(header_cell, [[ENTRY_ID_COLUMN]])], sheet_id):
+                return False
+            headers = [str(cell).strip() for cell in header_values] + [ENTRY_ID_COLUMN]
+
         header_norms = {_norm(header) for header in headers}
         df_norms = {_norm(col) for col in df_to_sync.columns}
         if not df_norms.issubset(header_norms):
@@ -437,8 +450,10 @@ def _replace_time_data_in_google(updated_df: pd.DataFrame) -> bool:
         header_values = worksheet.row_values(1)
         headers = [str(cell).strip() for cell in header_values if str(cell).strip()]
 
-        df_to_write = _prepare_time_data_dataframe(updated_df)
+        df_to_write = ensure_entry_ids(_prepare_time_data_dataframe(updated_df))
 
+        if headers and ENTRY_ID_COLUMN not in headers:
+            headers.append(ENTRY_ID_COLUMN)
         if headers:
             for header in headers:
                 if header not in df_to_write.columns:
@@ -462,6 +477,82 @@ def _replace_time_data_in_google(updated_df: pd.DataFrame) -> bool:
         return False
 
 
+def _time_data_sheet_target():
+    """Return (manager, sheet_id, worksheet title) for keyed Time Data writes, or None."""
+    if not (
+        HAVE_GOOGLE_SHEETS
+        and "google_sheets_id" in st.secrets
+        and st.secrets["google_sheets_id"]
+    ):
+        st.error("Shared Google Sheets storage is not configured. Time entries were not saved.")
+        return None
+    sheet_id = st.secrets["google_sheets_id"]
+    manager = get_sheets_manager()
+    worksheet, actual_title = manager.find_worksheet(("Time Data", "TimeData"), sheet_id)
+    if not worksheet or not actual_title:
+        st.warning("Time Data worksheet not found in Google Sheets. Please ensure a tab named 'Time Data' exists.")
+        return None
+    return manager, sheet_id, actual_title
+
+
+def _entry_ids_for(rows: pd.DataFrame) -> Optional[list[str]]:
+    """Entry IDs of ``rows``, or None when any row predates Entry IDs."""
+    if rows is None or ENTRY_ID_COLUMN not in rows.columns:
+        return None
+    ids = rows[ENTRY_ID_COLUMN].astype(str).str.strip().tolist()
+    if any(not entry_id or entry_id.lower() in {"nan", "none"} for entry_id in ids):
+        return None
+    return ids
+
+
+def _delete_time_entries_in_google(entry_ids: list[str]) -> bool:
+    """Delete only the Time Data rows with these Entry IDs."""
+    target = _time_data_sheet_target()
+    if target is None:
+        return False
+    manager, sheet_id, actual_title = target
+    success = manager.delete_rows_by_key(actual_title, ENTRY_ID_COLUMN, entry_ids, sheet_id)
+    if success:
+        _cached_sheet_data.clear()
+    return bool(success)
+
+
+EDITABLE_TIME_COLUMNS = ["Job Area", "Cost Code", "RT Hours", "OT Hours", "Description of work", "Comments"]
+
+
+def _edit_time_entry_in_google(entry_id: str, original: dict, changes: dict) -> Optional[dict]:
+    """Write the changed cells of one entry if its sheet row still matches ``original``."""
+    target = _time_data_sheet_target()
+    if target is None:
+        return None
+    manager, sheet_id, actual_title = target
+    normalized = {
+        column: _normalize_job_area_value(value) if column == "Job Area" else _normalize_sheet_value(value)
+        for column, value in changes.items()
+    }
+    expected = {column: original.get(column, "") for column in EDITABLE_TIME_COLUMNS + ["Name", "Date"]}
+    written = manager.update_row_by_key(
+        actual_title, ENTRY_ID_COLUMN, entry_id, normalized, expected=expected, spreadsheet_id=sheet_id
+    )
+    if written is not None:
+        _cached_sheet_data.clear()
+    return written
+
+
+def _refresh_session_entry(entry_id: str, written: dict) -> None:
+    """Replace one row of the session Time Data with the values now in the sheet."""
+    data = st.session_state.get("session_time_data")
+    if data is None or ENTRY_ID_COLUMN not in data.columns:
+        return
+    matches = data.index[data[ENTRY_ID_COLUMN].astype(str) == str(entry_id)]
+    if len(matches) == 0:
+        return
+    old_rows = data.loc[matches]
+    updated = data.copy()
+    for column, value in written.items():
+        if column in updated.columns:
+            updated.loc[matches, column] = _normalize_job_area_value(value) if column == "Job Area" else _normalize_sheet_value(value)
+    _set_session_time_data(updated, added=updated.loc[matches], removed=old_rows)
 
 
 def _is_blank_value(val) -> bool:
@@ -603,6 +694,35 @@ def _enrich_with_employee_details(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
 
+def _get_labor_cube() -> LaborCube:
+    """Return the labor cube for this user's Time Data, rebuilding it only when the data was replaced."""
+    version = st.session_state.get("session_time_data_version", 0)
+    cube = st.session_state.get("labor_cube")
+    if cube is None or st.session_state.get("labor_cube_source") != version:
+        cube = LaborCube.from_time_data(st.session_state.get("session_time_data"))
+        st.session_state["labor_cube"] = cube
+        st.session_state["labor_cube_source"] = version
+    return cube
+
+
+def _set_session_time_data(updated_df: pd.DataFrame, added=None, removed=None) -> None:
+    """Store new session Time Data, applying appended/deleted rows to the labor cube in place.
+
+    Every replacement must go through here: it bumps the version the labor cube is keyed on.
+    """
+    version = st.session_state.get("session_time_data_version", 0)
+    cube = st.session_state.get("labor_cube")
+    in_sync = cube is not None and st.session_state.get("labor_cube_source") == version
+    st.session_state.session_time_data = updated_df
+    st.session_state["session_time_data_version"] = version + 1
+    if in_sync and (added is not None or removed is not None):
+        if added is not None:
+            cube.append(added)
+        if removed is not None:
+            cube.remove(removed)
+        st.session_state["labor_cube_source"] = version + 1
+
+
 def save_to_session(new_rows):
     """Append new rows to shared Google Sheets, then update this user's page cache."""
     try:
@@ -613,11 +733,12 @@ def save_to_session(new_rows):
         if new_data_df.empty:
             return False
 
-        new_data_df = _enrich_with_employee_details(new_data_df)
+        new_data_df = ensure_entry_ids(_enrich_with_employee_details(new_data_df))
         google_synced = _sync_time_data_to_google(new_data_df)
+        appended_only = google_synced
         if not google_synced:
             refreshed_df, _ = _load_latest_time_data_for_sync()
-            updated_df = append_time_rows(refreshed_df, new_data_df)
+            updated_df = ensure_entry_ids(append_time_rows(refreshed_df, new_data_df))
             google_synced = _replace_time_data_in_google(updated_df)
         else:
             existing_df = st.session_state.get("session_time_data")
@@ -626,7 +747,10 @@ def save_to_session(new_rows):
             st.error("Could not update shared Google Sheets Time Data. No local-only entry was saved.")
             return False
 
-        st.session_state.session_time_data = updated_df
+        if appended_only:
+            _set_session_time_data(updated_df, added=new_data_df)
+        else:
+            _set_session_time_data(updated_df)
         return True
     except Exception as e:
         st.error(f"Error saving to Time Data: {e}")
@@ -883,9 +1007,9 @@ if "session_time_data" not in st.session_state:
         initial_data = pd.DataFrame()
 
     if isinstance(initial_data, pd.DataFrame) and (not initial_data.empty or len(initial_data.columns) > 0):
-        st.session_state.session_time_data = initial_data
+        _set_session_time_data(initial_data)
     else:
-        st.session_state.session_time_data = pd.DataFrame(columns=TIME_DATA_COLUMNS.copy())
+        _set_session_time_data(pd.DataFrame(columns=TIME_DATA_COLUMNS.copy()))
 
 # --- Helper functions ---
 def _pad_area(val: object) -> str:
@@ -1253,9 +1377,19 @@ if add_line_clicked:
                 }
                 new_rows.append(new_row)
             
-            success = save_to_session(new_rows)
-
-            if success:
+            validation = validate_time_entries(
+                pd.DataFrame(new_rows),
+                get_time_data_from_session(date_str),
+                known_jobs=[_parse_job(option)[0] for option in job_options],
+                known_cost_codes=[option.split(" - ", 1)[0] for option in cost_options],
+            )
+            invalid_lines = validation.loc[~validation["Valid"]]
+            if not invalid_lines.empty:
+                st.error(
+                    "No lines were added. Fix the following and try again:\n"
+                    + "\n".join(f"- {line.Name}: {line.Issues}" for line in invalid_lines.itertuples(index=False))
+                )
+            elif save_to_session(new_rows):
                 current_counter = st.session_state.form_counter
                 for suffix in ("job_choice", "cost_choice", "selected_employees", "rt_hours", "ot_hours", "comments"):
                     key = f"{suffix}_{current_counter}"
@@ -1281,7 +1415,7 @@ with col2:
     if st.button("🔄 Refresh Data", help="Clear cache and reload Time Data"):
         refreshed_df, _ = _load_latest_time_data_for_sync()
         if isinstance(refreshed_df, pd.DataFrame):
-            st.session_state.session_time_data = refreshed_df
+            _set_session_time_data(refreshed_df)
         st.session_state['sheet_cache_token'] = st.session_state.get('sheet_cache_token', 0) + 1
         st.success("Time Data reloaded from source.")
         st.rerun()
@@ -1321,14 +1455,93 @@ try:
             display_data,
             use_container_width=True,
             hide_index=True,
-            column_config={"Job Area": st.column_config.TextColumn("Job Area")},
+            column_config={"Job Area": st.column_config.TextColumn("Job Area"), ENTRY_ID_COLUMN: None},
         )
 
+        with st.expander("Labor Summary"):
+            labor_cube = _get_labor_cube()
+            selected_day = pd.to_datetime(date_val).date()
+            week_start = selected_day - pd.Timedelta(days=selected_day.weekday())
+            day_col, week_col = st.columns(2)
+            with day_col:
+                st.caption(f"Totals by employee for {selected_day}")
+                st.dataframe(labor_cube.daily_summary(selected_day, by=["Name"]), hide_index=True, use_container_width=True)
+            with week_col:
+                st.caption(f"Totals by job for the week of {week_start}")
+                st.dataframe(labor_cube.weekly_summary(week_start, by=["Job Number", "Job Area"]), hide_index=True, use_container_width=True)
+
         # Only show Delete Entries section to Admin users
         if user_type.upper() == "ADMIN":
-            st.subheader("Delete Entries")
+            st.subheader("Edit or Delete Entries")
+
+            edit_tab, *delete_tabs = st.tabs(["Edit Entry", "Delete Multiple", "Delete All"])
 
-            delete_tabs = st.tabs(["Delete Multiple", "Delete All"])
+            with edit_tab:
+                edit_labels = {}
+                for display_idx, (actual_index, row) in enumerate(filtered_data.iterrows(), start=1):
+                    edit_labels[str(actual_index)] = (
+                        f"Row {display_idx}: {row['Name']} - {row.get('Job Number', '')} "
+                        f"({row.get('RT Hours', 0)}RT/{row.get('OT Hours', 0)}OT)"
+                    )
+                selected_edit = st.selectbox(
+                    f"Entry to edit (for {date_val}):",
+                    list(edit_labels),
+                    format_func=lambda opt: edit_labels.get(opt, opt),
+                    key=f"edit_entry_option_{selected_date_str}",
+                )
+                if selected_edit is not None:
+                    original_row = total_data.loc[int(selected_edit)]
+                    original_values = {col: original_row.get(col, "") for col in total_data.columns}
+                    editor_frame = pd.DataFrame(
+                        [{col: str(original_values.get(col, "")) for col in EDITABLE_TIME_COLUMNS}]
+                    )
+                    edited_frame = st.data_editor(
+                        editor_frame,
+                        hide_index=True,
+                        use_container_width=True,
+                        num_rows="fixed",
+                        column_config={col: st.column_config.TextColumn(col) for col in EDITABLE_TIME_COLUMNS},
+                        key=f"edit_entry_editor_{selected_date_str}_{selected_edit}",
+                    )
+                    edited_values = edited_frame.iloc[0].to_dict()
+                    changes = {
+                        col: edited_values[col]
+                        for col in EDITABLE_TIME_COLUMNS
+                        if str(edited_values[col]).strip() != str(original_values.get(col, "")).strip()
+                    }
+                    col1, col2 = st.columns([2, 1])
+                    with col2:
+                        save_edit_button = st.button(
+                            "Save Changes", type="primary", disabled=not changes, key=f"save_edit_{selected_date_str}"
+                        )
+                    if save_edit_button and changes:
+                        candidate = pd.DataFrame([{**original_values, **changes}])
+                        others = filtered_data.drop(index=int(selected_edit))
+                        check = validate_time_entries(candidate, existing=others).iloc[0]
+                        if not check["Valid"]:
+                            st.error(f"Entry not saved: {check['Issues']}")
+                        else:
+                            with st.spinner("Saving entry..."):
+                                entry_ids = _entry_ids_for(total_data.loc[[int(selected_edit)]])
+                                if entry_ids is not None:
+                                    written = _edit_time_entry_in_google(entry_ids[0], original_values, changes)
+                                    if written is not None:
+                                        _refresh_session_entry(entry_ids[0], written)
+                                        st.success("Entry updated.")
+                                        st.rerun()
+                                else:
+                                    # Rows that predate Entry IDs can only be saved by rewriting the sheet.
+                                    updated_data = total_data.copy()
+                                    for col, value in changes.items():
+                                        updated_data.at[int(selected_edit), col] = value
+                                    updated_data = ensure_entry_ids(_prepare_time_data_dataframe(updated_data))
+                                    if _replace_time_data_in_google(updated_data):
+                                        _set_session_time_data(updated_data)
+                                        st.session_state['sheet_cache_token'] = st.session_state.get('sheet_cache_token', 0) + 1
+                                        st.success("Entry updated.")
+                                        st.rerun()
+                                    else:
+                                        st.error("Could not update shared Google Sheets Time Data. The entry was not changed.")
 
             with delete_tabs[0]:
                 option_labels = {}
@@ -1361,12 +1574,18 @@ try:
                             indices_to_delete = [int(opt) for opt in selected_multiple_delete]
 
                             if indices_to_delete:
+                                rows_to_delete = total_data.loc[indices_to_delete]
                                 updated_data = total_data.drop(index=indices_to_delete).reset_index(drop=True)
-                                synced = _replace_time_data_in_google(updated_data)
+                                entry_ids = _entry_ids_for(rows_to_delete)
+                                if entry_ids is not None:
+                                    synced = _delete_time_entries_in_google(entry_ids)
+                                else:
+                                    updated_data = ensure_entry_ids(updated_data)
+                                    synced = _replace_time_data_in_google(updated_data)
                                 if not synced:
                                     st.error("Could not update shared Google Sheets Time Data. No local-only deletion was saved.")
                                 else:
-                                    st.session_state.session_time_data = updated_data
+                                    _set_session_time_data(updated_data, removed=rows_to_delete)
                                     st.session_state['sheet_cache_token'] = st.session_state.get('sheet_cache_token', 0) + 1
                                     st.success(f"Deleted {len(indices_to_delete)} selected entries from {date_val}.")
                                     st.rerun()
@@ -1391,11 +1610,16 @@ try:
                                 pd.to_datetime(total_data["Date"]).dt.strftime("%Y-%m-%d") != selected_date_str
                             ].reset_index(drop=True) if not total_data.empty else pd.DataFrame()
 
-                            synced = _replace_time_data_in_google(remaining_data)
+                            entry_ids = _entry_ids_for(filtered_data)
+                            if entry_ids is not None:
+                                synced = _delete_time_entries_in_google(entry_ids)
+                            else:
+                                remaining_data = ensure_entry_ids(remaining_data)
+                                synced = _replace_time_data_in_google(remaining_data)
                             if not synced:
                                 st.error("Could not update shared Google Sheets Time Data. No local-only deletion was saved.")
                             else:
-                                st.session_state.session_time_data = remaining_data
+                                _set_session_time_data(remaining_data, removed=filtered_data)
                                 st.session_state['sheet_cache_token'] = st.session_state.get('sheet_cache_token', 0) + 1
                                 st.success(f"Deleted {filtered_entries} entries from {date_val}.")
                                 st.rerun()
@@ -1644,19 +1868,28 @@ if user_type.upper() == "ADMIN":
                     return None
 
                 try:
-                    zip_buffer = io.BytesIO()
+                    daily_time_template = Path(__file__).resolve().parent.parent / "Daily Time.xlsx"
+                    timeentries_template = Path(__file__).resolve().parent.parent / "TimeEntries.xlsx"
+                    employee_df = safe_read_excel(XLSX, "Employee List")
+                    cost_codes_df = safe_read_excel(XLSX, "Cost Codes")
+
+                    # Unchanged day, reference sheets and templates: serve the stored package.
+                    export_cache = get_export_cache()
+                    cache_key = export_key(
+                        f"export-package-v{EXPORT_PACKAGE_FORMAT}",
+                        export_date,
+                        [filtered_data, employee_df, cost_codes_df],
+                        [daily_time_template, timeentries_template],
+                    )
+                    cached = export_cache.get(cache_key)
+                    if cached:
+                        return cached[0].read_bytes()
 
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                    with ExportArchive() as archive:
                     
-                        daily_time_template = Path(__file__).resolve().parent.parent / "Daily Time.xlsx"
                         if daily_time_template.exists():
-                            tmp_path = None
+                            wb = load_template(daily_time_template)
                             try:
-                                with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-                                    tmp_path = tmp.name
-                                    copyfile(daily_time_template, tmp_path)
-
-                                wb = load_workbook(tmp_path)
                                 ws = wb.active
 
                                 for row_idx in range(1, 15):
@@ -1666,8 +1899,7 @@ if user_type.upper() == "ADMIN":
                                             ws.cell(row=row_idx, column=col_idx + 1, value=export_date.strftime('%Y-%m-%d'))
                                             break
 
-                                # Load employee data to determine indirect/direct status
-                                employee_df = safe_read_excel(XLSX, "Employee List")
+                                # Employee data determines indirect/direct status
                                 employee_info = {}
                                 if not employee_df.empty:
                                     for _, emp_row in employee_df.iterrows():
@@ -1683,8 +1915,7 @@ if user_type.upper() == "ADMIN":
                                             'time_record_type': str(emp_row.get("Time Record Type", "") or "").strip()
                                         }
 
-                                # Load cost codes for descriptions
-                                cost_codes_df = safe_read_excel(XLSX, "Cost Codes")
+                                # Cost codes for descriptions
                                 cost_code_descriptions = {}
                                 if not cost_codes_df.empty:
                                     for _, cc_row in cost_codes_df.iterrows():
@@ -1813,20 +2044,15 @@ if user_type.upper() == "ADMIN":
                                         # Add blank line between job groups
                                         current_summary_row += 1
 
-                                wb.save(tmp_path)
-                                wb.close()
-
-                                with open(tmp_path, 'rb') as f:
-                                    zip_file.writestr(f"{export_date.strftime('%m-%d-%Y')} - Daily Time.xlsx", f.read())
+                                archive.add_workbook(
+                                    f"{export_date.strftime('%m-%d-%Y')} - Daily Time.xlsx",
+                                    wb,
+                                    datetime.combine(export_date, datetime.min.time()),
+                                )
 
                             finally:
-                                if tmp_path and os.path.exists(tmp_path):
-                                    try:
-                                        os.unlink(tmp_path)
-                                    except Exception:
-                                        pass
+                                wb.close()
                         
-                        timeentries_template = Path(__file__).resolve().parent.parent / "TimeEntries.xlsx"
                         if timeentries_template.exists():
                             # Load employee data for rates (if not already loaded)
                             if 'employee_info' not in locals():
@@ -1850,119 +2076,26 @@ if user_type.upper() == "ADMIN":
                                             'time_record_type': str(emp_row.get("Time Record Type", "") or "").strip()
                                         }
 
-                            unique_jobs = filtered_data['Job Number'].dropna().unique()
-
-                            for job in unique_jobs:
-                                if pd.isna(job) or str(job).strip() == '':
-                                    continue
-                                
-                                job_data = filtered_data[filtered_data['Job Number'].astype(str).str.strip() == str(job).strip()].copy()
-                                if job_data.empty:
-                                    continue
-
-                                tmp_path = None
-                                try:
-                                    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-                                        tmp_path = tmp.name
-                                        copyfile(timeentries_template, tmp_path)
-
-                                    wb = load_workbook(tmp_path)
-                                    ws = wb.active
-
-                                    current_row = 4
-                                    for _, row in job_data.iterrows():
-                                        # Get employee data for rates
-                                        emp_name = str(row.get('Name', ''))
-                                        emp_info = _employee_info_lookup(employee_info, emp_name)
-
-                                        # Helper function to clean values
-                                        def clean_value(val):
-                                            if pd.isna(val) or str(val).lower() in ['nan', 'none', '']:
-                                                return ''
-                                            return str(val)
-
-                                        premium_rate = clean_value(emp_info.get('premium_rate', '')) or clean_value(row.get('Premium Rate', ''))
-                                        subsistence_rate = clean_value(emp_info.get('subsistence', '')) or clean_value(row.get('Subsistence Rate', ''))
-                                        travel_rate = clean_value(emp_info.get('travel_rate', '')) or clean_value(row.get('Travel Rate', ''))
-                                        night_shift = clean_value(emp_info.get('night_shift', ''))
-                                        if not night_shift:
-                                            night_shift = clean_value(row.get('Night Shift', ''))
-
-                                        time_record_type = clean_value(emp_info.get('time_record_type', ''))
-                                        post_to_payroll = clean_value(emp_info.get('post_to_payroll', ''))
-
-                                        rate_cell = "NS" if night_shift else (subsistence_rate or premium_rate or travel_rate)
-
-                                        base_data = [
-                                            export_date.strftime('%Y-%m-%d'),  # A - Date
-                                            time_record_type,                  # B - Time Record Type
-                                            clean_value(row.get('Employee Number', '')),  # C - Employee Number
-                                            clean_value(row.get('Name', '')),             # D - Name
-                                            clean_value(row.get('Trade Class', '')),      # E - Trade Class
-                                            post_to_payroll,                   # F - Post To Payroll
-                                            clean_value(row.get('Cost Code', '')),        # G - Cost Code
-                                            _normalize_job_area_value(row.get('Job Area', '')),  # H - Job Area
-                                            '',                                # I - Empty
-                                            '211',                             # J - Pay Code (will be changed per entry)
-                                            0.0,                               # K - Hours (will be set per entry)
-                                            night_shift,                       # L - Night Shift
-                                            rate_cell,                         # M - NS when night shift, otherwise rate
-                                            '',                                # N - Comments (left blank)
-                                            ''                                 # O - Extra column (left blank)
-                                        ]
-
-                                        rt_hours = float(row.get('RT Hours', 0) or 0)
-                                        if rt_hours > 0:
-                                            rt_data = base_data.copy()
-                                            rt_data[9] = '211'  # Regular time pay code
-                                            rt_data[10] = rt_hours
-
-                                            for col, val in enumerate(rt_data, 1):
-                                                ws.cell(row=current_row, column=col, value=val)
-                                            current_row += 1
-
-                                        ot_hours = float(row.get('OT Hours', 0) or 0)
-                                        if ot_hours > 0:
-                                            ot_data = base_data.copy()
-                                            ot_data[9] = '212'  # Overtime pay code
-                                            ot_data[10] = ot_hours
-
-                                            for col, val in enumerate(ot_data, 1):
-                                                ws.cell(row=current_row, column=col, value=val)
-                                            current_row += 1
-
-                                        # Add subsistence entry if employee has subsistence rate
-                                        if subsistence_rate and subsistence_rate != '':
-                                            try:
-                                                subsistence_amount = float(subsistence_rate)
-                                                if subsistence_amount > 0:
-                                                    sub_data = base_data.copy()
-                                                    sub_data[9] = '261'  # Subsistence pay code
-                                                    sub_data[10] = 1.0   # Hours = 1 for subsistence
-                                                    if not night_shift:
-                                                        sub_data[12] = subsistence_rate  # Put subsistence rate in column M
-
-                                                    for col, val in enumerate(sub_data, 1):
-                                                        ws.cell(row=current_row, column=col, value=val)
-                                                    current_row += 1
-                                            except (ValueError, TypeError):
-                                                pass  # Skip if subsistence rate is not a valid number
-
-                                    wb.save(tmp_path)
-                                    wb.close()
-
-                                    with open(tmp_path, 'rb') as f:
-                                        zip_file.writestr(f"{export_date.strftime('%m-%d-%Y')} - {job} - Daily Import.xlsx", f.read())
-
-                                finally:
-                                    if tmp_path and os.path.exists(tmp_path):
-                                        try:
-                                            os.unlink(tmp_path)
-                                        except Exception:
-                                            pass
+                            employees = resolve_employees(
+                                filtered_data['Name'],
+                                lambda emp_name: _employee_info_lookup(employee_info, emp_name),
+                            )
+                            daily_import_jobs = [
+                                (f"{export_date.strftime('%m-%d-%Y')} - {job} - Daily Import.xlsx", job_rows)
+                                for job, job_rows in import_rows_by_job(filtered_data, export_date, employees)
+                            ]
+
+                            # Jobs render in parallel worker processes; files land in the ZIP in job order.
+                            write_daily_imports(
+                                archive.zip_file,
+                                str(timeentries_template),
+                                daily_import_jobs,
+                                datetime.combine(export_date, datetime.min.time()),
+                            )
                     
-                    zip_buffer.seek(0)
-                    return zip_buffer.getvalue()
+                        package = archive.getvalue()
+                    export_cache.put(cache_key, [(f"{export_date.strftime('%m-%d-%Y')} - Export Package.zip", package)])
+                    return package
                     
                 except Exception as e:
                     st.error(f"Error creating export: {e}")
@@ -1973,7 +2106,7 @@ if user_type.upper() == "ADMIN":
                     fresh_time_data = smart_read_data("Time Data", force_refresh=True)
                     if isinstance(fresh_time_data, pd.DataFrame) and not fresh_time_data.empty:
                         time_data_for_export = _prepare_time_data_dataframe(_enrich_with_employee_details(fresh_time_data))
-                        st.session_state.session_time_data = time_data_for_export.copy()
+                        _set_session_time_data(time_data_for_export.copy())
                     zip_data = create_template_exports(date_val)
                     if zip_data:
                         st.download_button(
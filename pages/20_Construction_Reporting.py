@@ -9,11 +9,21 @@ from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
 
-from app.integrations.google_sheets import get_sheets_manager, read_timesheet_data
+from app.construction.bulk_updates import bulk_payload, read_bulk_csv, updates_for_tags, validate_bulk_updates
+from app.construction.burnup import burnup_report, burnup_workbook
+from app.construction.journal import FAILED, PENDING, get_update_journal
+from app.construction.progress import progress_index
+from app.construction.registry import CATEGORIES, CATEGORY_OPTIONS
+from app.construction.tag_lists import tag_lists
+from app.construction.tag_search import SEARCH_LIMIT, TagSearchIndex
+from app.integrations.google_sheets import frame_generation, get_sheets_manager, read_timesheet_data
 from app.style_utils import apply_app_theme, apply_watermark
+from app.utils.excel_style import restyle_block
+from app.ui.construction_view import category_view, incomplete_toggle
 
 PAGE_TITLE = "Construction Reporting"
 PAGE_ICON = "📊"
+CENTERED = Alignment(horizontal="center", vertical="center")
 
 st.set_page_config(page_title=PAGE_TITLE, page_icon=PAGE_ICON, layout="wide")
 apply_app_theme()
@@ -45,35 +55,6 @@ if st.sidebar.button("Refresh All Dropdowns", use_container_width=True):
 
 st.title(st.session_state.get("page_header", "Page"))
 
-CATEGORY_OPTIONS = [
-    "Cable",
-    "Glands",
-    "Terminations",
-    "Tray",
-    "Equipment",
-    "Junction Boxes",
-    "Instruments",
-    "Tubing",
-    "EHT",
-    "EHT RTDs",
-]
-
-
-CATEGORY_PROGRESS_COLUMN_MAP = {
-    "Cable": [13],
-    "Glands": [5, 6],
-    "Terminations": [7, 8],
-    # Tray progress should consider the two date columns L (11) and N (13)
-    "Tray": [11, 13],
-    "Equipment": [7],
-    "Junction Boxes": [7],
-    "EHT": [11, 13],
-    "EHT RTDs": [10],
-    "Instruments": [7],
-    "Tubing": [7, 9],
-}
-
-
 USER_DIRECTORY_CACHE_KEY = "_user_directory_lookup"
 
 
@@ -138,72 +119,73 @@ def _current_user_display_name() -> str:
 
 
 def _filter_completed_rows(df: pd.DataFrame, category: str, target_date: date_cls) -> pd.DataFrame:
-    column_indexes = CATEGORY_PROGRESS_COLUMN_MAP.get(category, [])
-    if not column_indexes or df.empty:
+    if category not in CATEGORIES or df.empty:
         return df.iloc[0:0].copy()
-
-    match_series = pd.Series(False, index=df.index)
-    for col_index in column_indexes:
-        if col_index >= len(df.columns):
-            continue
-        col_name = df.columns[col_index]
-        parsed_dates = pd.to_datetime(df[col_name], errors="coerce").dt.date
-        match_series = match_series | (parsed_dates == target_date)
-
-    return df.loc[match_series].copy()
+    completed = progress_index(df, category, frame_generation(df)).rows_on(target_date)
+    return df.iloc[completed].copy()
+
+
+def _column_widths(df: pd.DataFrame) -> List[int]:
+    """Widest header or value (as text) of each column."""
+    widths = [len(str(col)) for col in df.columns]
+    if df.empty:
+        return widths
+    lengths = df.astype(str).apply(lambda col: col.str.len().max())
+    return [max(width, int(length)) for width, length in zip(widths, lengths)]
+
+
+def _format_progress_sheet(worksheet, df: pd.DataFrame, category: str) -> None:
+    max_column = worksheet.max_column
+    max_row = worksheet.max_row
+    restyle_block(worksheet, 1, 1, 1, max_column, font=Font(color="FFFFFF", bold=True), alignment=CENTERED)
+    restyle_block(worksheet, 2, max_row, 1, max_column, alignment=CENTERED)
+    for col_idx, width in enumerate(_column_widths(df), start=1):
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = width + 2
+
+    if not df.empty:
+        table_ref = f"A1:{get_column_letter(max_column)}{max_row}"
+        table_name = f"Table_{category[:20].replace(' ', '_')}"
+        table = Table(displayName=table_name, ref=table_ref)
+        table.tableStyleInfo = TableStyleInfo(
+            name="TableStyleLight8",
+            showFirstColumn=False,
+            showLastColumn=False,
+            showRowStripes=False,
+            showColumnStripes=False
+        )
+        worksheet.add_table(table)
 
 
 def _build_progress_workbook(target_date: date_cls) -> tuple[bytes, bool]:
+    """Workbook of the rows completed on ``target_date``, one sheet per category with any.
+
+    When nothing was completed, every category gets a header-only sheet instead.
+    """
+    filtered = {}
+    for category in CATEGORY_OPTIONS:
+        df = read_timesheet_data(category, stale_while_revalidate=True)
+        filtered[category] = df if df.empty else _filter_completed_rows(df, category, target_date)
+    any_rows = any(not df.empty for df in filtered.values())
+    if any_rows:
+        filtered = {category: df for category, df in filtered.items() if not df.empty}
+
     buffer = BytesIO()
-    any_rows = False
     with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        for category in CATEGORY_OPTIONS:
-            df = read_timesheet_data(category, force_refresh=True)
-            if df.empty:
-                filtered_df = df
-            else:
-                filtered_df = _filter_completed_rows(df, category, target_date)
-                if not filtered_df.empty:
-                    any_rows = True
+        for category, filtered_df in filtered.items():
             filtered_df.to_excel(writer, sheet_name=category[:31], index=False)
-
-            worksheet = writer.sheets[category[:31]]
-            max_column = worksheet.max_column
-            max_row = worksheet.max_row
-
-            alignment = Alignment(horizontal="center", vertical="center")
-            for row in worksheet.iter_rows(min_row=1, max_row=max_row, min_col=1, max_col=max_column):
-                for cell in row:
-                    cell.alignment = alignment
-
-            header_font = Font(color="FFFFFF", bold=True)
-            for cell in worksheet[1]:
-                cell.font = header_font
-
-            for col_idx in range(1, max_column + 1):
-                column_letter = get_column_letter(col_idx)
-                if not filtered_df.empty and col_idx <= len(filtered_df.columns):
-                    column_cells = [filtered_df.columns[col_idx - 1]] + filtered_df.iloc[:, col_idx - 1].astype(str).tolist()
-                else:
-                    column_cells = [worksheet.cell(row=1, column=col_idx).value or ""]
-                max_length = max(len(str(cell)) for cell in column_cells)
-                worksheet.column_dimensions[column_letter].width = max_length + 2
-
-            if not filtered_df.empty:
-                table_ref = f"A1:{get_column_letter(max_column)}{max_row}"
-                table_name = f"Table_{category[:20].replace(' ', '_')}"
-                table = Table(displayName=table_name, ref=table_ref)
-                table.tableStyleInfo = TableStyleInfo(
-                    name="TableStyleLight8",
-                    showFirstColumn=False,
-                    showLastColumn=False,
-                    showRowStripes=False,
-                    showColumnStripes=False
-                )
-                worksheet.add_table(table)
+            _format_progress_sheet(writer.sheets[category[:31]], filtered_df, category)
     buffer.seek(0)
     return buffer.getvalue(), any_rows
 
+
+def _build_burnup_report():
+    frames = {}
+    for category in CATEGORY_OPTIONS:
+        df = read_timesheet_data(category, stale_while_revalidate=True)
+        frames[category] = (df, frame_generation(df))
+    return burnup_report(frames)
+
+
 def _get_column_a_details(sheet_name: str) -> Tuple[str, List[str]]:
     sheet_id = str(st.secrets.get("google_sheets_id", "")).strip()
     if not sheet_id:
@@ -282,19 +264,13 @@ def _get_column_a_details(sheet_name: str) -> Tuple[str, List[str]]:
     return header, values
 
 
-
-def _column_letter(col_index: int) -> str:
-    if col_index <= 0:
-        raise ValueError("Column index must be positive")
-    result = []
-    current = col_index
-    while current > 0:
-        current, remainder = divmod(current - 1, 26)
-        result.append(chr(65 + remainder))
-    return ''.join(reversed(result))
-
-
 def _update_cable_row(sheet_name: str, tag_value: str, updates: dict[str, object]) -> bool:
+    """Journal ``updates`` for the row holding ``tag_value`` in column A of ``sheet_name``.
+
+    The change is stored locally and shown at once; the journal's worker
+    writes it to Google Sheets in the background (see
+    ``app.construction.journal``), so saving never waits on the API.
+    """
     sheet_id = str(st.secrets.get("google_sheets_id", "")).strip()
     if not sheet_id:
         st.error("Google Sheets ID is not configured.")
@@ -302,66 +278,162 @@ def _update_cable_row(sheet_name: str, tag_value: str, updates: dict[str, object
 
     manager = get_sheets_manager()
     try:
-        worksheet, actual_name = manager.find_worksheet([sheet_name], sheet_id)
+        df = manager.read_worksheet_swr(sheet_name, sheet_id)
     except Exception as exc:
-        st.error(f"Could not locate worksheet '{sheet_name}': {exc}")
-        return False
-
-    actual_title = actual_name or sheet_name
-    try:
-        df = manager.read_worksheet(actual_title, sheet_id, force_refresh=True)
-    except Exception as exc:
-        st.error(f"Failed to read worksheet '{actual_title}': {exc}")
+        st.error(f"Failed to read worksheet '{sheet_name}': {exc}")
         return False
 
     if df.empty or df.shape[1] == 0:
         st.error("Worksheet does not contain data to update.")
         return False
 
-    df = df.copy()
-    df.columns = [str(col).strip() for col in df.columns]
-    columns = df.columns.tolist()
+    columns = [str(col).strip() for col in df.columns]
     tag_column = columns[0]
-    match_mask = df[tag_column].astype(str).str.strip() == str(tag_value).strip()
-    if not match_mask.any():
-        st.error("Selected cable tag could not be found in the worksheet.")
-        return False
-
-    first_match_idx = df[match_mask].index[0]
-    row_number = first_match_idx + 2  # account for header row
 
-    payload: list[tuple[int, str]] = []
+    payload: dict[str, str] = {}
     for col, value in updates.items():
         if col not in columns:
             continue
-        col_idx = columns.index(col) + 1
         if value is None:
-            str_value = ''
+            payload[col] = ''
         elif hasattr(value, 'strftime') and not isinstance(value, str):
-            str_value = value.strftime('%Y-%m-%d')
+            payload[col] = value.strftime('%Y-%m-%d')
         else:
-            str_value = str(value).strip()
-        payload.append((col_idx, str_value))
-        df.at[first_match_idx, col] = str_value
+            payload[col] = str(value).strip()
 
     if not payload:
         return True
 
-    if worksheet is not None and hasattr(worksheet, 'update'):
-        try:
-            for col_idx, str_value in payload:
-                worksheet.update_cell(row_number, col_idx, str_value)
-            if hasattr(manager, '_data_cache'):
-                manager._data_cache.pop(actual_title, None)
-            return True
-        except Exception as exc:
-            st.warning(f"Direct cell update failed: {exc}. Falling back to full-sheet write.")
-
     try:
-        return manager.write_worksheet(actual_title, df, sheet_id)
+        get_update_journal().record(sheet_name, tag_column, str(tag_value).strip(), payload, sheet_id)
     except Exception as exc:
-        st.error(f"Failed to write updates to worksheet '{actual_title}': {exc}")
+        st.error(f"Failed to save the update locally: {exc}")
         return False
+    return True
+
+
+def _searchable_tags(index: TagSearchIndex, label: str, key: str, keep: List[str]) -> List[str]:
+    """Tags to offer in a dropdown: all of them for short lists, otherwise the top matches for a search box.
+
+    ``keep`` (the current selection) is always offered so the widget does not lose it.
+    """
+    if len(index) <= SEARCH_LIMIT:
+        return index.tags
+    query = st.text_input(
+        f"Search {label}",
+        key=key,
+        placeholder="Type part of a tag",
+        help=f"{len(index)} tags; the best {SEARCH_LIMIT} matches are listed.",
+    )
+    matches = index.search(query)
+    return [tag for tag in keep if tag and tag not in matches] + matches
+
+
+def _render_bulk_update(category: str, sheet_df: pd.DataFrame, tag_index: TagSearchIndex) -> None:
+    headers = [str(col).strip() for col in sheet_df.columns]
+    slug = category.lower().replace(' ', '_')
+    mode = st.radio(
+        "Update from",
+        ["Selected tags", "CSV upload"],
+        horizontal=True,
+        key=f"bulk_update_mode_{slug}",
+    )
+    if mode == "Selected tags":
+        tags_key = f"bulk_update_tags_{slug}"
+        tag_options = _searchable_tags(
+            tag_index, "tags", f"bulk_update_search_{slug}", st.session_state.get(tags_key, [])
+        )
+        tags = st.multiselect("Tags", tag_options, key=tags_key)
+        column = st.selectbox("Column", headers[1:], key=f"bulk_update_column_{slug}")
+        value = st.text_input(
+            "Value",
+            key=f"bulk_update_value_{slug}",
+            help="Dates as YYYY-MM-DD. Leave blank to clear the cell for every selected tag.",
+        )
+        updates = updates_for_tags(tags, column, value)
+    else:
+        uploaded = st.file_uploader(
+            "Tag / Column / Value CSV",
+            type=["csv"],
+            key=f"bulk_update_csv_{slug}",
+            help="One row per cell to change, with Tag, Column and Value headers.",
+        )
+        if uploaded is None:
+            return
+        try:
+            updates = read_bulk_csv(uploaded)
+        except Exception as exc:
+            st.error(f"Could not read the CSV: {exc}")
+            return
+
+    valid, problems = validate_bulk_updates(sheet_df, updates)
+    if not problems.empty:
+        st.warning(f"{len(problems)} row(s) will be skipped.")
+        st.dataframe(problems, hide_index=True, use_container_width=True)
+    if valid.empty:
+        return
+    st.caption(f"{valid['Tag'].nunique()} tag(s), {len(valid)} cell(s) ready to write.")
+    if st.button(f"Apply {len(valid)} Update(s)", type="primary", key=f"bulk_update_apply_{slug}"):
+        sheet_id = str(st.secrets.get("google_sheets_id", "")).strip()
+        if not sheet_id:
+            st.error("Google Sheets ID is not configured.")
+            return
+        payload = bulk_payload(valid, headers, category, _current_user_display_name())
+        # Through the journal, so bulk and single-tag changes to a tag reach the sheet in the order they were made.
+        journal = get_update_journal()
+        try:
+            journal.record_many(category, headers[0], payload, sheet_id)
+        except Exception as exc:
+            st.error(f"Failed to save the bulk updates locally: {exc}")
+            return
+        journal.drain()  # write now if Sheets is reachable; anything left syncs in the background
+        st.success(f"Saved {len(payload)} {category} tag(s).")
+        st.rerun()
+
+
+@st.fragment(run_every=2)
+def _rerun_when_journal_changes(counts: dict) -> None:
+    """Poll the update journal while changes are waiting and rerun the page once any of them settle."""
+    if get_update_journal().counts() != counts:
+        st.rerun()
+
+
+def _render_sync_status() -> None:
+    journal = get_update_journal()
+    counts = journal.counts()
+    pending, failed = counts[PENDING], counts[FAILED]
+    if pending:
+        st.info(f"{pending} saved update(s) waiting to sync to Google Sheets.")
+        _rerun_when_journal_changes(counts)
+    if failed:
+        with st.expander(f"{failed} update(s) failed to sync", expanded=True):
+            failures = journal.entries(FAILED)
+            st.dataframe(
+                pd.DataFrame(
+                    {
+                        "Sheet": [entry["sheet"] for entry in failures],
+                        "Tag": [entry["tag"] for entry in failures],
+                        "Changes": [", ".join(f"{col}: {val}" for col, val in entry["payload"].items()) for entry in failures],
+                        "Error": [entry["error"] for entry in failures],
+                    }
+                ),
+                hide_index=True,
+                use_container_width=True,
+            )
+            retry_col, discard_col = st.columns(2)
+            if retry_col.button("Retry Failed Updates"):
+                journal.retry_failed()
+                st.rerun()
+            if discard_col.button("Discard Failed Updates"):
+                journal.discard_failed()
+                st.rerun()
+
+
+@st.fragment(run_every=2)
+def _rerun_when_sheet_changes(category: str, generation: str) -> None:
+    """Poll a background refresh and rerun the page only if the sheet's content changed."""
+    if get_sheets_manager().data_generation(category) != generation:
+        st.rerun()
 
 
 select_options = ["Select a category..."] + CATEGORY_OPTIONS
@@ -391,6 +463,28 @@ if progress_bytes:
     if not st.session_state.get("progress_download_has_rows", False):
         st.info("No completed entries were found for the selected date. The workbook contains headers only.")
 
+with st.expander("Burn-up Report"):
+    st.caption("Cumulative completions per category from the progress date columns; sheets that have not changed are reused.")
+    if st.button("Build Burn-up Report"):
+        try:
+            report = _build_burnup_report()
+            st.session_state["burnup_report"] = report
+            st.session_state["burnup_bytes"] = burnup_workbook(report)
+        except Exception as exc:
+            st.error(f"Unable to build burn-up report: {exc}")
+    report = st.session_state.get("burnup_report")
+    if report is not None:
+        if report.summary.empty:
+            st.info("No completed entries were found in any category.")
+        else:
+            st.line_chart(report.summary, x="Date", y=list(report.totals))
+        st.download_button(
+            "Download Burn-up Report",
+            data=st.session_state["burnup_bytes"],
+            file_name=f"burnup_{date_cls.today()}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
 category = st.selectbox(
     "Category",
     select_options,
@@ -402,171 +496,49 @@ category = st.selectbox(
 if category == select_options[0]:
     st.info("Select a category to start exploring construction reporting views.")
 else:
-    sheet_df = read_timesheet_data(category, force_refresh=True)
-    column_label, column_values = _get_column_a_details(category)
+    # Serve the cached sheet at once and refresh it in the background; the
+    # sidebar refresh (and any write) forces a fresh read instead.
+    force_refresh = bool(st.session_state.pop('force_fresh_data', False))
+    sheet_df = read_timesheet_data(category, force_refresh=force_refresh, stale_while_revalidate=True)
+    if get_sheets_manager().is_refreshing(category):
+        _rerun_when_sheet_changes(category, frame_generation(sheet_df))
+    # Saved changes that have not reached Google Sheets yet are shown as if they had.
+    sheet_df = get_update_journal().overlay(category, sheet_df)
+    sheet_generation = frame_generation(sheet_df)
+    _render_sync_status()
+    if sheet_df.empty:
+        column_label, column_values = _get_column_a_details(category)
+    else:
+        column_label, column_values = str(sheet_df.columns[0]).strip(), []
 
-    normalized_category = category.strip().lower()
     primary_label = (column_label or "Selection").strip() or "Selection"
     placeholder = f"Select {primary_label}..."
 
-    only_incomplete_flag = False
-    toggle_key = None
-    if normalized_category == "cable":
-        toggle_key = "cable_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Cables",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to cables missing Date Pulled or Checked By."
-        )
-    elif normalized_category == "glands":
-        toggle_key = "glands_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Glands",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to glands missing status fields."
-        )
-    elif normalized_category == "tray":
-        toggle_key = "tray_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Tray",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to trays missing completion fields."
-        )
-    elif normalized_category == "junction boxes":
-        toggle_key = "junction_boxes_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Junction Boxes",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to junction boxes missing status fields."
-        )
-    elif normalized_category == "eht":
-        toggle_key = "eht_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete EHT",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to EHT entries missing completion fields."
-        )
-    elif normalized_category == "eht rtds":
-        toggle_key = "eht_rtds_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete EHT RTDs",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to EHT RTDs entries missing completion fields."
-        )
-    elif normalized_category == "instruments":
-        toggle_key = "instruments_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Instruments",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to instruments missing completion fields."
-        )
-    elif normalized_category == "tubing":
-        toggle_key = "tubing_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Tubing",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to tubing entries missing completion fields."
-        )
-    elif normalized_category == "equipment":
-        toggle_key = "equipment_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Equipment",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to equipment missing status fields."
-        )
-    elif normalized_category == "terminations":
-        toggle_key = "terminations_only_incomplete_toggle"
-        only_incomplete_flag = st.checkbox(
-            "Only Show Incomplete Terminations",
-            value=st.session_state.get(toggle_key, False),
-            key=toggle_key,
-            help="Filter to terminations missing completion dates."
-        )
-    if normalized_category in ("cable", "glands", "terminations", "tray", "equipment", "junction boxes", "eht", "eht rtds", "instruments", "tubing") and not sheet_df.empty:
-        working_df_options = sheet_df.copy()
-        working_df_options.columns = [str(col).strip() for col in working_df_options.columns]
-        if working_df_options.columns.tolist():
-            tag_column = working_df_options.columns[0]
-            if normalized_category == "cable":
-                status_cols = list(working_df_options.columns[12:15])
-            elif normalized_category == "glands":
-                status_cols = list(working_df_options.columns[5:10])
-            elif normalized_category == "terminations":
-                status_cols = list(working_df_options.columns[7:9])
-            elif normalized_category == "tray":
-                # Tray status now references columns K–O (indices 10–14)
-                status_cols = list(working_df_options.columns[10:15])
-            elif normalized_category == "junction boxes":
-                status_cols = [working_df_options.columns[7]] if len(working_df_options.columns) > 7 else []
-            elif normalized_category == "eht rtds":
-                status_cols = [working_df_options.columns[10]] if len(working_df_options.columns) > 10 else []
-            elif normalized_category == "instruments":
-                status_cols = list(working_df_options.columns[7:9])
-            elif normalized_category == "tubing":
-                status_cols = list(working_df_options.columns[6:9])
-            elif normalized_category == "eht":
-                status_cols = list(working_df_options.columns[10:14])
-            elif normalized_category == "equipment":
-                # Incomplete filtering: treat any value in I (index 8) as complete
-                status_cols = [working_df_options.columns[8]] if len(working_df_options.columns) > 8 else []
-            filtered_tags = []
-            seen_tags = set()
-            for _, entry_row in working_df_options.iterrows():
-                tag_value = str(entry_row.get(tag_column, "")).strip()
-                if not tag_value:
-                    continue
-                if only_incomplete_flag:
-                    completeness = []
-                    for col in status_cols:
-                        raw_status = entry_row.get(col, "")
-                        if pd.isna(raw_status):
-                            completeness.append("")
-                        else:
-                            completeness.append(str(raw_status).strip())
-                    if status_cols and all(completeness):
-                        continue
-                if tag_value not in seen_tags:
-                    seen_tags.add(tag_value)
-                    filtered_tags.append(tag_value)
-            column_values = filtered_tags
-
-    if normalized_category == "cable" and not sheet_df.empty:
-        working_df_options = sheet_df.copy()
-        working_df_options.columns = [str(col).strip() for col in working_df_options.columns]
-        if working_df_options.columns.tolist():
-            tag_column = working_df_options.columns[0]
-            status_cols = list(working_df_options.columns[12:15])
-            filtered_tags = []
-            seen_tags = set()
-            for _, cable_row in working_df_options.iterrows():
-                tag_value = str(cable_row.get(tag_column, "")).strip()
-                if not tag_value:
-                    continue
-                if only_incomplete_flag:
-                    completeness = [str(cable_row.get(col, "")).strip() for col in status_cols]
-                    if status_cols and all(completeness):
-                        continue
-                if tag_value not in seen_tags:
-                    seen_tags.add(tag_value)
-                    filtered_tags.append(tag_value)
-            column_values = filtered_tags
+    only_incomplete_flag = incomplete_toggle(category)
+    lists = None
+    if category in CATEGORIES and not sheet_df.empty:
+        lists = tag_lists(sheet_df, category, sheet_generation)
+        tag_index = lists.search_index(only_incomplete_flag)
+        column_values = tag_index.tags
+    else:
+        tag_index = TagSearchIndex(column_values)
 
     if not column_label and not column_values and sheet_df.empty:
         st.warning("No data found for this category in Google Sheets.")
 
-    detail_options = [placeholder] + column_values if column_values else [placeholder]
+    if not sheet_df.empty:
+        with st.expander(f"Bulk Update {category}"):
+            _render_bulk_update(category, sheet_df, tag_index)
 
     label_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in primary_label).strip('_') or 'field'
     detail_key = f"construction_reporting_{category.lower().replace(' ', '_')}_{label_slug}_detail"
+    current_choice = st.session_state.get(detail_key)
+    detail_options = [placeholder] + _searchable_tags(
+        tag_index,
+        primary_label,
+        f"{detail_key}_search",
+        [] if current_choice in (None, placeholder) else [current_choice],
+    )
     detail_choice = st.selectbox(
         primary_label,
         detail_options,
@@ -580,821 +552,14 @@ else:
             st.info(f"Choose a {primary_label} to continue.")
         else:
             st.info(f"No {primary_label} values found in this sheet yet.")
+    elif category in CATEGORIES:
+        category_view(
+            category,
+            sheet_df,
+            detail_choice,
+            lists.first_row.get(detail_choice.strip()) if lists else None,
+            _update_cable_row,
+            _current_user_display_name,
+        )
     else:
-        normalized_category = category.strip().lower()
-        if normalized_category == "cable":
-            if sheet_df.empty:
-                st.warning("No cable data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning("Cable sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning("Unable to locate details for the selected cable tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        detail_columns = working_df.columns[1:13]
-                        if not list(detail_columns):
-                            st.info("No additional columns (B-M) are available for this cable sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader("Cable Details")
-                            st.table(details_df)
-
-                            mirror_columns = list(working_df.columns[13:16])
-                            date_only_column = working_df.columns[14] if len(working_df.columns) > 14 else None
-                            mirror_data = []
-                            pulled_status_column = mirror_columns[0] if mirror_columns else None
-                            pulled_signoff_column = working_df.columns[16] if len(working_df.columns) > 16 else None
-                            for col in mirror_columns:
-                                raw_value = row.get(col, "")
-                                if pd.isna(raw_value):
-                                    value = ""
-                                elif (date_only_column and col == date_only_column) or (col and 'date' in col.lower()):
-                                    parsed = pd.to_datetime(raw_value, errors='coerce')
-                                    value = parsed.strftime('%Y-%m-%d') if pd.notna(parsed) else str(raw_value).strip()
-                                else:
-                                    value = str(raw_value).strip()
-                                mirror_data.append((col, value))
-
-                            st.write("")
-                            st.subheader("Update Cable Status")
-                            updated_values = {}
-                            tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                            for col, current_value in mirror_data:
-                                label = col if col else "Field"
-                                input_key = f"cable_update_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                is_date_field = date_only_column and col == date_only_column
-                                if is_date_field:
-                                    default_date = None
-                                    if current_value:
-                                        parsed_date = pd.to_datetime(current_value, errors='coerce')
-                                        if pd.notna(parsed_date):
-                                            default_date = parsed_date.date()
-                                    date_value = st.date_input(
-                                        label,
-                                        value=default_date or date_cls.today(),
-                                        key=input_key,
-                                        format="YYYY-MM-DD"
-                                    )
-                                    updated_values[col] = date_value
-                                else:
-                                    updated_values[col] = st.text_input(
-                                        label,
-                                        value=current_value,
-                                        key=input_key
-                                    )
-
-                            if st.button("Submit", type="primary"):
-                                try:
-                                    updates_to_apply = {}
-                                    for col, value in updated_values.items():
-                                        if isinstance(value, pd.Timestamp):
-                                            updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                        elif hasattr(value, 'strftime') and not isinstance(value, str):
-                                            updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                        else:
-                                            updates_to_apply[col] = value
-
-                                    if updates_to_apply and pulled_status_column and pulled_signoff_column:
-                                        user_identifier = _current_user_display_name()
-
-                                        if pulled_status_column in updates_to_apply:
-                                            pulled_value = updates_to_apply[pulled_status_column]
-                                            if pulled_value is None or (isinstance(pulled_value, str) and not pulled_value.strip()):
-                                                updates_to_apply[pulled_signoff_column] = ""
-                                            else:
-                                                updates_to_apply[pulled_signoff_column] = user_identifier
-                                    if not updates_to_apply:
-                                        st.warning("Nothing to update for this cable tag.")
-                                    else:
-                                        if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                            st.success("Cable details updated successfully.")
-                                            st.rerun()
-                                        else:
-                                            st.error("Failed to update cable details.")
-                                except Exception as exc:
-                                    st.error(f"Unexpected error while submitting updates: {exc}")
-        elif normalized_category == "tray":
-            if sheet_df.empty:
-                st.warning("No tray data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning("Tray sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning("Unable to locate details for the selected tray tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        # Tray Details now reference columns B–J (indices 1–9)
-                        detail_columns = working_df.columns[1:10]
-                        if not list(detail_columns):
-                            st.info("No additional columns (B-J) are available for this tray sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader("Tray Details")
-                            st.table(details_df)
-                            # Username signoffs: P (index 15) for L, Q (index 16) for N
-                            signoff_l_column = working_df.columns[15] if len(working_df.columns) > 15 else None
-                            signoff_n_column = working_df.columns[16] if len(working_df.columns) > 16 else None
-                            # Update Tray Status now references columns K–O (indices 10–14)
-                            status_columns = list(working_df.columns[10:15])
-                            if not list(status_columns):
-                                st.info("No status columns (K-O) are available for this tray sheet.")
-                            else:
-                                status_data = []
-                                # Columns L (index 11) and N (index 13) are dates only
-                                l_col = working_df.columns[11] if len(working_df.columns) > 11 else None
-                                n_col = working_df.columns[13] if len(working_df.columns) > 13 else None
-                                date_only_cols = {c for c in (l_col, n_col) if c is not None}
-                                for col in status_columns:
-                                    raw_value = row.get(col, "")
-                                    if pd.isna(raw_value):
-                                        value = ""
-                                    elif (col in date_only_cols) or (col and 'date' in col.lower()):
-                                        parsed = pd.to_datetime(raw_value, errors='coerce')
-                                        value = parsed.strftime('%Y-%m-%d') if pd.notna(parsed) else str(raw_value).strip()
-                                    else:
-                                        value = str(raw_value).strip()
-                                    status_data.append((col, value))
-                                st.write("")
-                                st.subheader("Update Tray Status")
-                                updated_values = {}
-                                tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                                for col, current_value in status_data:
-                                    label = col if col else "Field"
-                                    input_key = f"tray_update_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                    # Enforce date inputs for L and N regardless of label text
-                                    if (col in date_only_cols) or (label and 'date' in label.lower()):
-                                        default_date = None
-                                        if current_value:
-                                            parsed_date = pd.to_datetime(current_value, errors='coerce')
-                                            if pd.notna(parsed_date):
-                                                default_date = parsed_date.date()
-                                        date_value = st.date_input(
-                                            label,
-                                            value=default_date,
-                                            key=input_key,
-                                            format="YYYY-MM-DD"
-                                        )
-                                        updated_values[col] = date_value if date_value else None
-                                    else:
-                                        updated_values[col] = st.text_input(
-                                            label,
-                                            value=current_value,
-                                            key=input_key
-                                        )
-                                if st.button("Submit Tray Status", type="primary"):
-                                    try:
-                                        updates_to_apply = {}
-                                        for col, value in updated_values.items():
-                                            if isinstance(value, pd.Timestamp):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            elif hasattr(value, 'strftime') and not isinstance(value, str):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            else:
-                                                updates_to_apply[col] = value
-                                        # Apply username signoffs based on entries for L and N
-                                        if updates_to_apply and (signoff_l_column or signoff_n_column):
-                                            user_identifier = _current_user_display_name()
-                                            # Determine if L (index 11) has a non-empty update
-                                            if l_col and signoff_l_column:
-                                                if l_col in updates_to_apply:
-                                                    l_val = updates_to_apply[l_col]
-                                                    if l_val is None or (isinstance(l_val, str) and not l_val.strip()):
-                                                        updates_to_apply[signoff_l_column] = ""
-                                                    else:
-                                                        updates_to_apply[signoff_l_column] = user_identifier
-                                            # Determine if N (index 13) has a non-empty update
-                                            if n_col and signoff_n_column:
-                                                if n_col in updates_to_apply:
-                                                    n_val = updates_to_apply[n_col]
-                                                    if n_val is None or (isinstance(n_val, str) and not n_val.strip()):
-                                                        updates_to_apply[signoff_n_column] = ""
-                                                    else:
-                                                        updates_to_apply[signoff_n_column] = user_identifier
-                                        if not updates_to_apply:
-                                            st.warning("Nothing to update for this tray tag.")
-                                        else:
-                                            if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                                st.success("Tray details updated successfully.")
-                                                st.rerun()
-                                            else:
-                                                st.error("Failed to update tray details.")
-                                    except Exception as exc:
-                                        st.error(f"Unexpected error while submitting tray updates: {exc}")
-        elif normalized_category == "junction boxes":
-            if sheet_df.empty:
-                st.warning("No junction box data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning("Junction box sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning("Unable to locate details for the selected junction box tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        detail_columns = working_df.columns[1:7]
-                        if not list(detail_columns):
-                            st.info("No additional columns (B-G) are available for this junction box sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader("Junction Box Details")
-                            st.table(details_df)
-                            signoff_column = working_df.columns[9] if len(working_df.columns) > 9 else None
-                            status_columns = list(working_df.columns[7:9])
-                            if not list(status_columns):
-                                st.info("No status columns (H-I) are available for this junction box sheet.")
-                            else:
-                                status_data = []
-                                for col in status_columns:
-                                    raw_value = row.get(col, "")
-                                    if pd.isna(raw_value):
-                                        value = ""
-                                    elif col and 'date' in col.lower():
-                                        parsed = pd.to_datetime(raw_value, errors='coerce')
-                                        value = parsed.strftime('%Y-%m-%d') if pd.notna(parsed) else str(raw_value).strip()
-                                    else:
-                                        value = str(raw_value).strip()
-                                    status_data.append((col, value))
-                                st.write("")
-                                st.subheader("Update Junction Box Status")
-                                updated_values = {}
-                                tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                                for col, current_value in status_data:
-                                    label = col if col else "Field"
-                                    input_key = f"junction_box_update_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                    if label and 'date' in label.lower():
-                                        default_date = None
-                                        if current_value:
-                                            parsed_date = pd.to_datetime(current_value, errors='coerce')
-                                            if pd.notna(parsed_date):
-                                                default_date = parsed_date.date()
-                                        date_value = st.date_input(
-                                            label,
-                                            value=default_date,
-                                            key=input_key,
-                                            format="YYYY-MM-DD"
-                                        )
-                                        updated_values[col] = date_value if date_value else None
-                                    else:
-                                        updated_values[col] = st.text_input(
-                                            label,
-                                            value=current_value,
-                                            key=input_key
-                                        )
-                                if st.button("Submit Junction Box Status", type="primary"):
-                                    try:
-                                        updates_to_apply = {}
-                                        for col, value in updated_values.items():
-                                            if isinstance(value, pd.Timestamp):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            elif hasattr(value, 'strftime') and not isinstance(value, str):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            else:
-                                                updates_to_apply[col] = value
-                                        if updates_to_apply and signoff_column and status_columns:
-                                            date_col = status_columns[0]
-                                            if date_col in updates_to_apply:
-                                                user_identifier = _current_user_display_name()
-                                                date_value = updates_to_apply[date_col]
-                                                if date_value is None or (isinstance(date_value, str) and not date_value.strip()):
-                                                    updates_to_apply[signoff_column] = ""
-                                                else:
-                                                    updates_to_apply[signoff_column] = user_identifier
-                                        if not updates_to_apply:
-                                            st.warning("Nothing to update for this junction box tag.")
-                                        else:
-                                            if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                                st.success("Junction box details updated successfully.")
-                                                st.rerun()
-                                            else:
-                                                st.error("Failed to update junction box details.")
-                                    except Exception as exc:
-                                        st.error(f"Unexpected error while submitting junction box updates: {exc}")
-
-        elif normalized_category in {"eht", "eht rtds", "instruments", "tubing"}:
-            category_label = category.strip()
-            if sheet_df.empty:
-                st.warning(f"No {category_label} data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning(f"{category_label} sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning(f"Unable to locate details for the selected {category_label} tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        if normalized_category == "instruments":
-                            detail_columns = working_df.columns[1:7]
-                        elif normalized_category == "tubing":
-                            detail_columns = working_df.columns[1:6]
-                        else:
-                            detail_columns = working_df.columns[1:10]
-                        if not list(detail_columns):
-                            st.info(f"No additional columns (B-J) are available for this {category_label} sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader(f"{category_label} Details")
-                            st.table(details_df)
-                        if normalized_category == "eht":
-                            status_columns = list(working_df.columns[10:14])
-                            date_columns = []
-                            if len(status_columns) > 1:
-                                date_columns.append(status_columns[1])
-                            if len(status_columns) > 3:
-                                date_columns.append(status_columns[3])
-                            signoff_column = working_df.columns[14] if len(working_df.columns) > 14 else None
-                        elif normalized_category == "eht rtds":
-                            status_columns = [working_df.columns[10]] if len(working_df.columns) > 10 else []
-                            date_columns = status_columns.copy()
-                            signoff_column = working_df.columns[11] if len(working_df.columns) > 11 else None
-                        elif normalized_category == "instruments":
-                            status_columns = list(working_df.columns[7:9])
-                            date_columns = [working_df.columns[7]] if len(working_df.columns) > 7 else []
-                            signoff_column = working_df.columns[9] if len(working_df.columns) > 9 else None
-                        elif normalized_category == "tubing":
-                            status_columns = list(working_df.columns[6:11])
-                            date_columns = []
-                            if len(status_columns) > 1:
-                                date_columns.append(status_columns[1])
-                            if len(status_columns) > 3:
-                                date_columns.append(status_columns[3])
-                            signoff_column = working_df.columns[11] if len(working_df.columns) > 11 else None
-                        else:
-                            status_columns = list(working_df.columns[10:14])
-                            date_columns = []
-                            if len(status_columns) > 1:
-                                date_columns.append(status_columns[1])
-                            if len(status_columns) > 3:
-                                date_columns.append(status_columns[3])
-                            signoff_column = working_df.columns[14] if len(working_df.columns) > 14 else None
-                        if not list(status_columns):
-                            st.info(f"No status columns are available for this {category_label} sheet.")
-                        else:
-                            status_data = []
-                            for col in status_columns:
-                                raw_value = row.get(col, "")
-                                if pd.isna(raw_value):
-                                    value = ""
-                                elif col in date_columns:
-                                    parsed = pd.to_datetime(raw_value, errors="coerce")
-                                    value = parsed.strftime("%Y-%m-%d") if pd.notna(parsed) else str(raw_value).strip()
-                                else:
-                                    value = str(raw_value).strip()
-                                status_data.append((col, value))
-
-                            st.write("")
-                            st.subheader(f"Update {category_label} Status")
-                            updated_values = {}
-                            tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                            key_prefix = normalized_category.replace(' ', '_') + '_update'
-                            for col, current_value in status_data:
-                                label = col if col else "Field"
-                                input_key = f"{key_prefix}_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                if col in date_columns:
-                                    default_date = None
-                                    if current_value:
-                                        parsed_date = pd.to_datetime(current_value, errors="coerce")
-                                        if pd.notna(parsed_date):
-                                            default_date = parsed_date.date()
-                                    date_value = st.date_input(
-                                        label,
-                                        value=default_date,
-                                        key=input_key,
-                                        format="YYYY-MM-DD"
-                                    )
-                                    updated_values[col] = date_value if date_value else None
-                                else:
-                                    updated_values[col] = st.text_input(
-                                        label,
-                                        value=current_value,
-                                        key=input_key
-                                    )
-
-                            if st.button(f"Submit {category_label} Status", type="primary"):
-                                try:
-                                    updates_to_apply = {}
-                                    for col, value in updated_values.items():
-                                        if isinstance(value, pd.Timestamp):
-                                            updates_to_apply[col] = value.strftime("%Y-%m-%d")
-                                        elif hasattr(value, "strftime") and not isinstance(value, str):
-                                            updates_to_apply[col] = value.strftime("%Y-%m-%d")
-                                        else:
-                                            updates_to_apply[col] = value
-                                    for col, val in list(updates_to_apply.items()):
-                                        if val is None:
-                                            updates_to_apply[col] = ""
-                                    if updates_to_apply and signoff_column and status_columns:
-                                        user_identifier = _current_user_display_name()
-
-                                        has_value = False
-                                        for date_col in date_columns:
-                                            val = updates_to_apply.get(date_col)
-                                            if val is None or (isinstance(val, str) and not val.strip()):
-                                                continue
-                                            has_value = True
-                                            break
-                                        updates_to_apply[signoff_column] = user_identifier if has_value else ""
-                                    if not updates_to_apply:
-                                        st.warning(f"Nothing to update for this {category_label} tag.")
-                                    else:
-                                        if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                            st.success(f"{category_label} details updated successfully.")
-                                            st.rerun()
-                                        else:
-                                            st.error(f"Failed to update {category_label} details.")
-                                except Exception as exc:
-                                    st.error(f"Unexpected error while submitting {category_label} updates: {exc}")
-        elif normalized_category == "equipment":
-            if sheet_df.empty:
-                st.warning("No equipment data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning("Equipment sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning("Unable to locate details for the selected equipment tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        # Equipment Details now reference columns B–H (indices 1–7)
-                        detail_columns = working_df.columns[1:8]
-                        if not list(detail_columns):
-                            st.info("No additional columns (B-H) are available for this equipment sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader("Equipment Details")
-                            st.table(details_df)
-                            # Username signoff for equipment is column K (index 10)
-                            signoff_column = working_df.columns[10] if len(working_df.columns) > 10 else None
-                            # Update Equipment Status references columns I–J (indices 8–9)
-                            status_columns = list(working_df.columns[8:10])
-                            # Track column I explicitly for signoff logic
-                            i_col = working_df.columns[8] if len(working_df.columns) > 8 else None
-                            if not list(status_columns):
-                                st.info("No status columns (I-J) are available for this equipment sheet.")
-                            else:
-                                status_data = []
-                                for col in status_columns:
-                                    raw_value = row.get(col, "")
-                                    if pd.isna(raw_value):
-                                        value = ""
-                                    elif col and 'date' in col.lower():
-                                        parsed = pd.to_datetime(raw_value, errors='coerce')
-                                        value = parsed.strftime('%Y-%m-%d') if pd.notna(parsed) else str(raw_value).strip()
-                                    else:
-                                        value = str(raw_value).strip()
-                                    status_data.append((col, value))
-                                st.write("")
-                                st.subheader("Update Equipment Status")
-                                updated_values = {}
-                                tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                                for col, current_value in status_data:
-                                    label = col if col else "Field"
-                                    input_key = f"equipment_update_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                    if label and 'date' in label.lower():
-                                        default_date = None
-                                        if current_value:
-                                            parsed_date = pd.to_datetime(current_value, errors='coerce')
-                                            if pd.notna(parsed_date):
-                                                default_date = parsed_date.date()
-                                        date_value = st.date_input(
-                                            label,
-                                            value=default_date,
-                                            key=input_key,
-                                            format="YYYY-MM-DD"
-                                        )
-                                        updated_values[col] = date_value if date_value else None
-                                    else:
-                                        updated_values[col] = st.text_input(
-                                            label,
-                                            value=current_value,
-                                            key=input_key
-                                        )
-                                if st.button("Submit Equipment Status", type="primary"):
-                                    try:
-                                        updates_to_apply = {}
-                                        for col, value in updated_values.items():
-                                            if isinstance(value, pd.Timestamp):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            elif hasattr(value, 'strftime') and not isinstance(value, str):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            else:
-                                                updates_to_apply[col] = value
-                                        # Normalize None to empty strings to avoid writing Python None
-                                        for col_key, val in list(updates_to_apply.items()):
-                                            if val is None:
-                                                updates_to_apply[col_key] = ""
-                                        # Auto-clear/set signoff K based on column I value
-                                        if updates_to_apply and signoff_column and i_col:
-                                            if i_col in updates_to_apply:
-                                                user_identifier = _current_user_display_name()
-                                                i_value = updates_to_apply[i_col]
-                                                if isinstance(i_value, str):
-                                                    i_value_stripped = i_value.strip()
-                                                else:
-                                                    i_value_stripped = str(i_value).strip() if i_value is not None else ""
-                                                updates_to_apply[signoff_column] = user_identifier if i_value_stripped else ""
-                                        if not updates_to_apply:
-                                            st.warning("Nothing to update for this equipment tag.")
-                                        else:
-                                            if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                                st.success("Equipment details updated successfully.")
-                                                st.rerun()
-                                            else:
-                                                st.error("Failed to update equipment details.")
-                                    except Exception as exc:
-                                        st.error(f"Unexpected error while submitting equipment updates: {exc}")
-        elif normalized_category == "terminations":
-            if sheet_df.empty:
-                st.warning("No termination data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning("Terminations sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning("Unable to locate details for the selected termination tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        detail_columns = working_df.columns[1:8]
-                        if not list(detail_columns):
-                            st.info("No additional columns (B-H) are available for this terminations sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader("Termination Details")
-                            st.table(details_df)
-
-                        status_columns = []
-                        first_date_column = working_df.columns[8] if len(working_df.columns) > 8 else None
-                        second_date_column = working_df.columns[9] if len(working_df.columns) > 9 else None
-                        third_status_column = working_df.columns[10] if len(working_df.columns) > 10 else None
-                        if first_date_column:
-                            status_columns.append(first_date_column)
-                        if second_date_column:
-                            status_columns.append(second_date_column)
-                        if third_status_column:
-                            status_columns.append(third_status_column)
-                        date_only_columns = {col for col in [first_date_column, second_date_column] if col}
-                        first_signoff_column = working_df.columns[11] if len(working_df.columns) > 11 else None
-                        second_signoff_column = working_df.columns[12] if len(working_df.columns) > 12 else None
-                        if not status_columns:
-                            st.info("No status columns (I-K) are available for this terminations sheet.")
-                        else:
-                            status_data = []
-                            for col in status_columns:
-                                raw_value = row.get(col, "")
-                                if pd.isna(raw_value):
-                                    value = ""
-                                elif col in date_only_columns:
-                                    parsed_value = pd.to_datetime(raw_value, errors="coerce")
-                                    value = parsed_value.strftime("%Y-%m-%d") if pd.notna(parsed_value) else str(raw_value).strip()
-                                else:
-                                    parsed_value = pd.to_datetime(raw_value, errors="coerce")
-                                    value = parsed_value.strftime("%Y-%m-%d") if pd.notna(parsed_value) else str(raw_value).strip()
-                                status_data.append((col, value))
-
-                            st.write("")
-                            st.subheader("Update Termination Status")
-                            updated_values = {}
-                            tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                            for col, current_value in status_data:
-                                label = col if col else "Field"
-                                input_key = f"termination_update_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                if col in date_only_columns:
-                                    default_date = None
-                                    if current_value:
-                                        parsed_date = pd.to_datetime(current_value, errors="coerce")
-                                        if pd.notna(parsed_date):
-                                            default_date = parsed_date.date()
-                                    date_value = st.date_input(
-                                        label,
-                                        value=default_date,
-                                        key=input_key,
-                                        format="YYYY-MM-DD"
-                                    )
-                                    updated_values[col] = date_value if date_value else None
-                                else:
-                                    updated_values[col] = st.text_input(
-                                        label,
-                                        value=current_value,
-                                        key=input_key
-                                    )
-
-                            if st.button("Submit Termination Status", type="primary"):
-                                try:
-                                    updates_to_apply = {}
-                                    for col, value in updated_values.items():
-                                        if isinstance(value, pd.Timestamp):
-                                            updates_to_apply[col] = value.strftime("%Y-%m-%d")
-                                        elif hasattr(value, "strftime") and not isinstance(value, str):
-                                            updates_to_apply[col] = value.strftime("%Y-%m-%d")
-                                        else:
-                                            updates_to_apply[col] = value
-
-                                    if updates_to_apply:
-                                        user_identifier = _current_user_display_name()
-
-                                        if first_date_column and first_signoff_column and first_date_column in updates_to_apply:
-                                            value = updates_to_apply[first_date_column]
-                                            if value is None or (isinstance(value, str) and not value.strip()):
-                                                updates_to_apply[first_signoff_column] = ""
-                                            else:
-                                                updates_to_apply[first_signoff_column] = user_identifier
-                                        if second_date_column and second_signoff_column and second_date_column in updates_to_apply:
-                                            value = updates_to_apply[second_date_column]
-                                            if value is None or (isinstance(value, str) and not value.strip()):
-                                                updates_to_apply[second_signoff_column] = ""
-                                            else:
-                                                updates_to_apply[second_signoff_column] = user_identifier
-
-                                    if not updates_to_apply:
-                                        st.warning("Nothing to update for this termination tag.")
-                                    else:
-                                        if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                            st.success("Termination details updated successfully.")
-                                            st.rerun()
-                                        else:
-                                            st.error("Failed to update termination details.")
-                                except Exception as exc:
-                                    st.error(f"Unexpected error while submitting termination updates: {exc}")
-
-        elif normalized_category == "glands":
-            if sheet_df.empty:
-                st.warning("No gland data is available to display.")
-            else:
-                working_df = sheet_df.copy()
-                working_df.columns = [str(col).strip() for col in working_df.columns]
-                if not list(working_df.columns):
-                    st.warning("Glands sheet is missing header information.")
-                else:
-                    tag_column = working_df.columns[0]
-                    matched_rows = working_df[working_df[tag_column].astype(str).str.strip() == detail_choice.strip()]
-                    if matched_rows.empty:
-                        st.warning("Unable to locate details for the selected gland tag.")
-                    else:
-                        row = matched_rows.iloc[0]
-                        detail_columns = working_df.columns[1:6]
-                        if not list(detail_columns):
-                            st.info("No additional columns (B-F) are available for this glands sheet.")
-                        else:
-                            detail_records = []
-                            for col in detail_columns:
-                                raw_value = row.get(col, "")
-                                value = "" if pd.isna(raw_value) else str(raw_value).strip()
-                                detail_records.append({"Field": col, "Value": value})
-                            details_df = pd.DataFrame(detail_records)
-                            st.subheader("Gland Details")
-                            st.table(details_df)
-                            status_columns = []
-                            first_date_column = working_df.columns[6] if len(working_df.columns) > 6 else None
-                            second_date_column = working_df.columns[7] if len(working_df.columns) > 7 else None
-                            third_status_column = working_df.columns[8] if len(working_df.columns) > 8 else None
-                            if first_date_column:
-                                status_columns.append(first_date_column)
-                            if second_date_column:
-                                status_columns.append(second_date_column)
-                            if third_status_column:
-                                status_columns.append(third_status_column)
-                            date_only_columns = {col for col in [first_date_column, second_date_column] if col}
-                            first_signoff_column = working_df.columns[9] if len(working_df.columns) > 9 else None
-                            second_signoff_column = working_df.columns[10] if len(working_df.columns) > 10 else None
-                            if not status_columns:
-                                st.info("No status columns (G-I) are available for this glands sheet.")
-                            else:
-                                status_data = []
-                                for col in status_columns:
-                                    raw_value = row.get(col, "")
-                                    if pd.isna(raw_value):
-                                        value = ""
-                                    elif col in date_only_columns:
-                                        parsed = pd.to_datetime(raw_value, errors='coerce')
-                                        value = parsed.strftime('%Y-%m-%d') if pd.notna(parsed) else str(raw_value).strip()
-                                    else:
-                                        value = str(raw_value).strip()
-                                    status_data.append((col, value))
-
-                                st.write("")
-                                st.subheader("Update Gland Status")
-                                updated_values = {}
-                                tag_slug = ''.join(ch.lower() if ch.isalnum() else '_' for ch in detail_choice).strip('_') or 'tag'
-                                for col, current_value in status_data:
-                                    label = col if col else "Field"
-                                    input_key = f"gland_update_{tag_slug}_{''.join(ch.lower() if ch.isalnum() else '_' for ch in (col or 'field')).strip('_')}"
-                                    if col in date_only_columns:
-                                        default_date = None
-                                        if current_value:
-                                            parsed_date = pd.to_datetime(current_value, errors='coerce')
-                                            if pd.notna(parsed_date):
-                                                default_date = parsed_date.date()
-                                        date_value = st.date_input(
-                                            label,
-                                            value=default_date,
-                                            key=input_key,
-                                            format="YYYY-MM-DD"
-                                        )
-                                        updated_values[col] = date_value if date_value else None
-                                    else:
-                                        updated_values[col] = st.text_input(
-                                            label,
-                                            value=current_value,
-                                            key=input_key
-                                        )
-
-                                if st.button("Submit Gland Status", type="primary"):
-                                    try:
-                                        updates_to_apply = {}
-                                        for col, value in updated_values.items():
-                                            if isinstance(value, pd.Timestamp):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            elif hasattr(value, 'strftime') and not isinstance(value, str):
-                                                updates_to_apply[col] = value.strftime('%Y-%m-%d')
-                                            else:
-                                                updates_to_apply[col] = value
-
-                                        if updates_to_apply:
-                                            user_identifier = _current_user_display_name()
-
-                                            if first_date_column and first_signoff_column and first_date_column in updates_to_apply:
-                                                first_value = updates_to_apply[first_date_column]
-                                                if first_value is None or (isinstance(first_value, str) and not first_value.strip()):
-                                                    updates_to_apply[first_signoff_column] = ""
-                                                else:
-                                                    updates_to_apply[first_signoff_column] = user_identifier
-                                            if second_date_column and second_signoff_column and second_date_column in updates_to_apply:
-                                                second_value = updates_to_apply[second_date_column]
-                                                if second_value is None or (isinstance(second_value, str) and not second_value.strip()):
-                                                    updates_to_apply[second_signoff_column] = ""
-                                                else:
-                                                    updates_to_apply[second_signoff_column] = user_identifier
-                                        if not updates_to_apply:
-                                            st.warning("Nothing to update for this gland tag.")
-                                        else:
-                                            if _update_cable_row(category, detail_choice.strip(), updates_to_apply):
-                                                st.success("Gland details updated successfully.")
-                                                st.rerun()
-                                            else:
-                                                st.error("Failed to update gland details.")
-                                    except Exception as exc:
-                                        st.error(f"Unexpected error while submitting gland updates: {exc}")
-
-        else:
-            st.info(f"'{detail_choice}' details coming soon.")
-
-
-
-
-
+        st.info(f"'{detail_choice}' details coming soon.")
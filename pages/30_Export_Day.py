@@ -3,7 +3,9 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
-from app.features.export_daily_time import export_daily_time
+from app.exports.export_cache import frame_digest
+from app.exports.jobs import DONE, FAILED, QUEUED, RUNNING, get_export_jobs, job_id_for
+from app.features.export_daily_time import export_daily_time, export_date_range, pay_period_bounds, read_employee_list
 from app.style_utils import apply_app_theme, apply_watermark
 
 st.set_page_config(page_title="Export Day", page_icon=":outbox_tray:", layout="wide")
@@ -171,5 +173,75 @@ if st.button("Export Daily Time", type="primary"):
 
     except FileNotFoundError as e:
         st.error(str(e))
+    except ValueError as e:
+        st.warning(str(e))
     except Exception as e:
         st.exception(e)
+
+st.divider()
+st.subheader("Date Range Export")
+st.caption("Exports every day in the range into one ZIP with a folder per date. Defaults to the pay period of the export date. The export runs in the background; you can leave this page and download it here later.")
+range_val = st.date_input("Date range", value=pay_period_bounds(date_val), key="export_range")
+if st.button("Export Date Range"):
+    if not isinstance(range_val, (list, tuple)) or len(range_val) != 2:
+        st.warning("Select both a start and an end date.")
+    else:
+        range_start, range_end = range_val
+        range_name = f"{range_start.strftime('%m-%d-%Y')} to {range_end.strftime('%m-%d-%Y')} - Exports.zip"
+        range_rows = hours_df.copy()
+        employees = read_employee_list()
+        job_id = get_export_jobs().submit(
+            job_id_for("range", range_start, range_end, frame_digest(range_rows), frame_digest(employees)),
+            f"{range_start:%Y-%m-%d} to {range_end:%Y-%m-%d}",
+            range_name,
+            lambda progress: export_date_range(range_start, range_end, range_rows, employees, progress=progress),
+        )
+        session_jobs = st.session_state.setdefault("range_export_jobs", [])
+        if job_id in session_jobs:
+            session_jobs.remove(job_id)
+        session_jobs.insert(0, job_id)
+
+
+@st.fragment(run_every=2)
+def _export_job_progress(job_ids: list) -> None:
+    """Poll this session's running exports and rerun the page once they have all finished."""
+    jobs = get_export_jobs()
+    running = [job for job in map(jobs.get, job_ids) if job and job["status"] in (QUEUED, RUNNING)]
+    if not running:
+        st.rerun()
+    for job in running:
+        st.progress(job.get("progress", 0.0), text=f"{job['label']}: {job.get('message', '')}")
+
+
+def _export_job_status():
+    """This session's background exports; the page itself never waits on one."""
+    jobs = get_export_jobs()
+    session_jobs = [job for job in map(jobs.get, st.session_state.get("range_export_jobs", [])[:5]) if job]
+    running = [job["id"] for job in session_jobs if job["status"] in (QUEUED, RUNNING)]
+    if running:
+        _export_job_progress(running)
+    for job in session_jobs:
+        if job["status"] == FAILED:
+            st.warning(f"Export {job['label']} failed: {job.get('error', '')}")
+
+    finished = [job for job in session_jobs if job["status"] == DONE]
+    if finished:
+        st.caption("Ready for download")
+        for done_job in finished:
+            # The archive is only read when asked for, not on every rerun.
+            if not st.button(f"Prepare {done_job['file_name']}", key=f"prepare_job_{done_job['id']}"):
+                continue
+            content = jobs.result(done_job["id"])
+            if content is None:
+                st.warning(f"{done_job['file_name']} is no longer available; please run the export again.")
+                continue
+            st.download_button(
+                f"Download {done_job['file_name']}",
+                data=content,
+                file_name=done_job["file_name"],
+                mime="application/zip",
+                key=f"dl_job_{done_job['id']}",
+            )
+
+
+_export_job_status()
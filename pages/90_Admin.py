@@ -5,6 +5,7 @@ from typing import Optional
 import pandas as pd
 import streamlit as st
 
+from app.data.time_schema import compact_memory_report
 from app.style_utils import apply_app_theme, apply_watermark
 
 try:
@@ -399,6 +400,22 @@ with core_tab:
     selected_candidates = next(candidates for label, candidates in CORE_SHEETS if label == selected_label)
     _render_sheet_editor(selected_label, selected_candidates, f"core_{selected_label.lower().replace(' ', '_')}")
 
+    if selected_label == "Time Data":
+        with st.expander("In-memory footprint"):
+            time_df, _, time_error = _read_sheet(selected_candidates, force_refresh=False)
+            if time_error:
+                st.info(time_error)
+            elif time_df.empty:
+                st.caption("Time Data is empty.")
+            else:
+                report = compact_memory_report(time_df)
+                total = report.iloc[-1]
+                st.caption(
+                    f"{len(time_df)} rows: {total['Sheet Bytes'] / 1024:,.0f} KB as sheet text, "
+                    f"{total['Compact Bytes'] / 1024:,.0f} KB in the compact schema ({total['Saved %']}% saved)."
+                )
+                st.dataframe(report, hide_index=True, use_container_width=True)
+
 with construction_tab:
     category = st.selectbox(
         "Construction worksheet",
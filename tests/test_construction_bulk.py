@@ -0,0 +1,60 @@
+import io
+
+import pandas as pd
+import pytest
+
+from app.construction.bulk_updates import bulk_payload, read_bulk_csv, updates_for_tags, validate_bulk_updates
+
+
+def _tray():
+    headers = ["Tray Tag"] + [f"Col {i}" for i in range(1, 17)]
+    headers[11], headers[13], headers[15], headers[16] = "Date Installed", "Date Inspected", "Installed By", "Inspected By"
+    rows = [[f"TR-{i}"] + [""] * 16 for i in range(1, 5)]
+    return pd.DataFrame(rows, columns=headers)
+
+
+def test_csv_rows_are_validated_against_the_sheet():
+    csv = io.StringIO(
+        "tag,COLUMN,Value\n"
+        "TR-1,date installed,2026-10-18\n"
+        "TR-9,Date Installed,2026-10-18\n"
+        "TR-2,Nope,x\n"
+        "TR-2,Tray Tag,x\n"
+        ",Date Installed,x\n"
+        "TR-3,Date Inspected,2026-10-01\n"
+        "TR-3,Date Inspected,2026-10-02\n"
+    )
+    valid, problems = validate_bulk_updates(_tray(), read_bulk_csv(csv))
+
+    assert valid.values.tolist() == [
+        ["TR-1", "Date Installed", "2026-10-18"],
+        ["TR-3", "Date Inspected", "2026-10-02"],
+    ]
+    assert problems["Problem"].tolist() == [
+        "Tag not found in sheet",
+        "Column not found in sheet",
+        "Tag column cannot be updated",
+        "Missing tag",
+        "Superseded by a later row",
+    ]
+
+
+def test_csv_without_the_expected_columns_is_rejected():
+    with pytest.raises(ValueError, match="Column, Value"):
+        read_bulk_csv(io.StringIO("Tag,Status\nTR-1,done\n"))
+
+
+def test_payload_stamps_and_clears_signoffs():
+    sheet = _tray()
+    updates = pd.concat([
+        updates_for_tags(["TR-1", "TR-2"], "Date Installed", "2026-10-18"),
+        updates_for_tags(["TR-2"], "Date Inspected", ""),
+    ])
+    valid, _ = validate_bulk_updates(sheet, updates)
+
+    payload = bulk_payload(valid, list(sheet.columns), "Tray", user="Pat Lee")
+
+    assert payload == {
+        "TR-1": {"Date Installed": "2026-10-18", "Installed By": "Pat Lee"},
+        "TR-2": {"Date Installed": "2026-10-18", "Date Inspected": "", "Installed By": "Pat Lee", "Inspected By": ""},
+    }
@@ -0,0 +1,54 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from app.construction.burnup import area_column, build_category_series, burnup_report, burnup_workbook, category_series
+
+
+def _glands():
+    # Glands progress columns are positions 5 and 6; a row is complete on the later of the two.
+    columns = ["Tag", "Work Area", "C2", "C3", "C4", "C5", "C6", "C7"]
+    rows = [
+        ["G-1", "North", "", "", "", "2026-10-01", "2026-10-02", ""],
+        ["G-2", "North", "", "", "", "2026-10-03", "2026-10-01", ""],
+        ["G-3", "South", "", "", "", "2026-10-01", "", ""],
+        ["G-4", "", "", "", "", "2026-10-01", "2026-10-01", ""],
+        ["", "South", "", "", "", "2026-10-01", "2026-10-01", ""],
+        ["G-6", np.nan, "", "", "", "2026-10-05", "2026-10-05", ""],
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_series_counts_each_row_once_on_its_last_progress_date_per_area():
+    assert area_column(["Area Tag", "Work Area", "Zone"]) == "Work Area"
+    series = build_category_series(_glands(), "Glands").series
+
+    assert series[["Area", "Date", "Completed", "Cumulative"]].astype({"Date": str}).values.tolist() == [
+        ["North", "2026-10-02", 1, 1],
+        ["North", "2026-10-03", 1, 2],
+        ["Unassigned", "2026-10-01", 1, 1],
+        ["Unassigned", "2026-10-05", 1, 2],
+    ]
+
+
+def test_summary_fills_every_day_and_sheets_without_areas_use_all():
+    df = _glands().rename(columns={"Work Area": "Zone"})
+    report = burnup_report({"Glands": (df, ""), "Cable": (df, "")})
+
+    assert report.totals == {"Glands": 5, "Cable": 5}
+    assert report.series["Area"].unique().tolist() == ["All"]
+    assert report.summary["Glands"].tolist() == [1, 2, 3, 3, 4]
+    assert report.summary["Cable"].tolist() == [0, 0, 0, 0, 0]
+
+    workbook = load_workbook(BytesIO(burnup_workbook(report)))
+    assert workbook.sheetnames == ["Burn-up", "By Area", "Totals"]
+    assert [cell.value for cell in workbook["Totals"]["C"]] == ["Completed", 4, 0]
+
+
+def test_series_are_reused_until_the_generation_changes():
+    df = _glands()
+    first = category_series(df, "Glands", "gen-1")
+    assert category_series(df.iloc[:1], "Glands", "gen-1") is first
+    assert category_series(df.iloc[:1], "Glands", "gen-2").total == 1
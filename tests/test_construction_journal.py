@@ -0,0 +1,121 @@
+import pandas as pd
+
+from app.construction import journal as journal_module
+from app.construction.journal import FAILED, PENDING, UpdateJournal
+from app.integrations.google_sheets import GENERATION_ATTR, frame_generation
+
+
+class _Writer:
+    def __init__(self, fail=None):
+        self.calls = []
+        self.fail = fail
+
+    def __call__(self, sheet, key_column, updates, spreadsheet_id):
+        self.calls.append((sheet, key_column, updates, spreadsheet_id))
+        error = self.fail(updates) if self.fail else None
+        if error:
+            raise error
+
+
+def test_pending_updates_overlay_the_sheet_frame(tmp_path):
+    journal = UpdateJournal(tmp_path / "journal.sqlite3")
+    df = pd.DataFrame({"Tag": ["T-1", "T-2", "T-1"], "Status": ["", "", ""], "Date": ["", "", ""]})
+    df.attrs[GENERATION_ATTR] = "gen-1"
+
+    assert journal.overlay("Tray", df) is df
+    journal.record("Tray", "Tag", " T-1 ", {"Status": "Pulled"}, "sheet")
+    journal.record("Tray", "Tag", "T-1", {"Date": "2026-10-03", "Missing": "x"}, "sheet")
+    journal.record("Glands", "Tag", "T-2", {"Status": "Done"}, "sheet")
+
+    shown = journal.overlay("Tray", df)
+    assert shown["Status"].tolist() == ["Pulled", "", ""]
+    assert shown["Date"].tolist() == ["2026-10-03", "", ""]
+    assert frame_generation(shown).startswith("gen-1+")
+    assert df["Status"].tolist() == ["", "", ""]
+    assert journal.counts() == {PENDING: 3, FAILED: 0}
+
+
+def test_drain_batches_per_sheet_and_backs_off_on_errors(tmp_path, monkeypatch):
+    writer = _Writer(fail=lambda updates: ConnectionError("offline"))
+    journal = UpdateJournal(tmp_path / "journal.sqlite3", writer)
+    journal.record("Tray", "Tag", "T-1", {"Status": "Pulled"}, "sheet")
+    journal.record("Tray", "Tag", "T-1", {"Status": "Checked", "Date": "2026-10-03"}, "sheet")
+    journal.record("Tray", "Tag", "T-2", {"Status": "Pulled"}, "sheet")
+
+    assert journal.drain(now=1e12) == 0
+    entry = journal.entries(PENDING)[0]
+    assert entry["attempts"] == 1 and entry["error"] == "offline"
+    assert journal.drain(now=1e12) == 0  # not due again until the backoff passes
+    assert len(writer.calls) == 1
+
+    monkeypatch.setattr(journal_module, "MAX_ATTEMPTS", 2)
+    journal.drain(now=2e12)
+    assert journal.counts() == {PENDING: 0, FAILED: 3}
+
+    writer.fail = None
+    journal.retry_failed()
+    assert journal.drain(now=3e12) == 3
+    assert writer.calls[-1] == (
+        "Tray", "Tag", {"T-1": {"Status": "Checked", "Date": "2026-10-03"}, "T-2": {"Status": "Pulled"}}, "sheet"
+    )
+    assert journal.counts() == {PENDING: 0, FAILED: 0}
+
+
+def test_unknown_tags_fail_alone_and_can_be_discarded(tmp_path):
+    def fail_for_missing(updates):
+        return LookupError("Some rows to update were not found in 'Tray'.") if "T-9" in updates else None
+
+    writer = _Writer(fail=fail_for_missing)
+    journal = UpdateJournal(tmp_path / "journal.sqlite3", writer)
+    journal.record("Tray", "Tag", "T-1", {"Status": "Pulled"}, "sheet")
+    journal.record("Tray", "Tag", "T-9", {"Status": "Pulled"}, "sheet")
+
+    assert journal.drain() == 1
+    # The combined request fails, so each tag is retried on its own.
+    assert [sorted(call[2]) for call in writer.calls] == [["T-1", "T-9"], ["T-1"], ["T-9"]]
+    failed = journal.entries(FAILED)
+    assert [entry["tag"] for entry in failed] == ["T-9"] and "not found" in failed[0]["error"]
+    assert journal.discard_failed() == 1
+    assert journal.counts() == {PENDING: 0, FAILED: 0}
+
+
+def test_newer_entries_wait_behind_a_backing_off_entry_for_the_same_tag(tmp_path):
+    sheet = {}
+
+    def write(updates):
+        if writer.offline:
+            return ConnectionError("offline")
+        for tag, changes in updates.items():
+            sheet.setdefault(tag, {}).update(changes)
+        return None
+
+    writer = _Writer(fail=write)
+    writer.offline = True
+    journal = UpdateJournal(tmp_path / "journal.sqlite3", writer)
+    journal.record("Tray", "Tag", "T1", {"Pulled": "2026-05-01"}, "sheet")
+    assert journal.drain(now=1e12) == 0  # A backs off
+
+    writer.offline = False
+    journal.record("Tray", "Tag", "T1", {"Pulled": "2026-05-02"}, "sheet")
+    journal.record("Tray", "Tag", "T2", {"Pulled": "2026-05-03"}, "sheet")
+    assert journal.drain(now=1e12) == 1  # B is held behind A; T2 is unaffected
+    assert sheet == {"T2": {"Pulled": "2026-05-03"}}
+
+    assert journal.drain(now=2e12) == 2
+    assert sheet["T1"] == {"Pulled": "2026-05-02"}
+    assert journal.counts() == {PENDING: 0, FAILED: 0}
+
+
+def test_a_written_value_supersedes_older_failed_entries(tmp_path):
+    writer = _Writer(fail=lambda updates: LookupError("no such column") if "Bad" in updates.get("T1", {}) else None)
+    journal = UpdateJournal(tmp_path / "journal.sqlite3", writer)
+    journal.record("Tray", "Tag", "T1", {"Pulled": "2026-05-01", "Bad": "x"}, "sheet")
+    journal.drain()
+    journal.record("Tray", "Tag", "T1", {"Pulled": "2026-05-02"}, "sheet")
+    assert journal.drain() == 1
+
+    assert [entry["payload"] for entry in journal.entries(FAILED)] == [{"Bad": "x"}]
+    journal.record("Tray", "Tag", "T1", {"Bad": "y"}, "sheet")
+    writer.fail = None
+    assert journal.drain() == 1
+    assert journal.counts() == {PENDING: 0, FAILED: 0}
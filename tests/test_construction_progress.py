@@ -0,0 +1,44 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from app.construction.progress import build_progress_index, completion_counts, progress_index
+
+
+def _glands():
+    # Glands progress columns are positions 5 and 6.
+    columns = [f"Col {i}" for i in range(8)]
+    rows = [
+        ["G-1"] + [""] * 4 + ["2026-10-01", "2026-10-02", ""],
+        ["G-2"] + [""] * 4 + ["2026-10-02", "2026-10-02 14:30", ""],
+        ["G-3"] + [""] * 4 + ["", "not a date", ""],
+        ["G-4"] + [""] * 4 + [np.nan, "2026-10-05", ""],
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_rows_and_counts_by_day_and_range():
+    index = build_progress_index(_glands(), "Glands")
+
+    assert index.rows_on(date(2026, 10, 2)).tolist() == [0, 1]
+    assert index.count_on(date(2026, 10, 2)) == 2
+    assert index.rows_on(date(2026, 10, 3)).tolist() == []
+    assert index.rows_between(date(2026, 10, 1), date(2026, 10, 5)).tolist() == [0, 1, 3]
+    assert index.count_between(date(2026, 10, 3), date(2026, 10, 9)) == 1
+    assert index.daily_counts().tolist() == [1, 2, 1]
+
+
+def test_unknown_categories_and_narrow_sheets_have_no_completions():
+    assert build_progress_index(_glands(), "Scaffolding").count_between(date(2000, 1, 1), date(2100, 1, 1)) == 0
+    assert build_progress_index(_glands().iloc[:, :5], "Glands").rows_on(date(2026, 10, 1)).tolist() == []
+
+
+def test_index_is_reused_per_generation_and_rolled_up_across_categories():
+    df = _glands()
+    first = progress_index(df, "Glands", "gen-1")
+    assert progress_index(df.iloc[:1], "Glands", "gen-1") is first
+    assert progress_index(df.iloc[:1], "Glands", "gen-2").count_on(date(2026, 10, 2)) == 1
+
+    counts = completion_counts({"Glands": first, "Cable": build_progress_index(df, "Cable")}, date(2026, 10, 2))
+    assert counts.to_dict("records") == [{"Category": "Glands", "Completed": 2}, {"Category": "Cable", "Completed": 0}]
@@ -0,0 +1,33 @@
+from app.construction.registry import CATEGORIES, CATEGORY_OPTIONS, column_span, resolve
+
+
+def test_schema_resolves_to_the_sheet_headers():
+    headers = [f" H{i} " for i in range(15)]
+
+    view = resolve("EHT", headers)
+
+    assert view.tag == "H0"
+    assert view.detail == tuple(f"H{i}" for i in range(1, 10))
+    assert view.fields == ("H10", "H11", "H12", "H13")
+    assert view.signoffs == (("H14", ("H11", "H13")),)
+    assert view.progress == ("H11", "H13")
+    assert view.is_date_field("H11") and not view.is_date_field("H12")
+    assert resolve("EHT", headers) is view
+
+
+def test_narrow_sheets_drop_missing_columns():
+    view = resolve("Tray", ["Tag", "A", "B", "Install Date", "Z"] + [f"C{i}" for i in range(7)])
+
+    assert view.fields == ("C5", "C6")
+    assert view.signoffs == ()
+    # Tray treats any header mentioning a date as a date field.
+    assert view.is_date_field("Install Date")
+
+
+def test_registry_covers_every_category():
+    assert CATEGORY_OPTIONS == [
+        "Cable", "Glands", "Terminations", "Tray", "Equipment",
+        "Junction Boxes", "Instruments", "Tubing", "EHT", "EHT RTDs",
+    ]
+    assert CATEGORIES["Junction Boxes"].toggle_key == "junction_boxes_only_incomplete_toggle"
+    assert column_span(*CATEGORIES["Cable"].detail) == "B-M"
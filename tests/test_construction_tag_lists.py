@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from app.construction.tag_lists import build_tag_lists, tag_lists
+
+
+def _junction_boxes():
+    columns = [f"Col {i}" for i in range(10)]
+    rows = [
+        ["JB-1"] + [""] * 6 + ["2026-10-01", "", ""],
+        ["JB-2"] + [""] * 6 + ["", "", ""],
+        [" JB-2 "] + [""] * 6 + [np.nan, "", ""],
+        [""] + [""] * 6 + ["", "", ""],
+        ["JB-3"] + [""] * 6 + ["  ", "", ""],
+        ["JB-1"] + [""] * 6 + ["", "", ""],
+    ]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_tag_lists_follow_the_status_columns():
+    lists = build_tag_lists(_junction_boxes(), "Junction Boxes")
+
+    assert lists.all_tags == ["JB-1", "JB-2", "JB-3"]
+    # JB-1 has a later incomplete row, so it still needs work.
+    assert lists.incomplete_tags == ["JB-2", "JB-3", "JB-1"]
+    assert lists.complete.tolist() == [True, False, False, False, False, False]
+
+
+def test_narrow_sheets_and_unknown_categories_filter_nothing():
+    narrow = _junction_boxes().iloc[:, :5]
+    assert build_tag_lists(narrow, "Junction Boxes").incomplete_tags == ["JB-1", "JB-2", "JB-3"]
+    assert build_tag_lists(_junction_boxes(), "Scaffolding").incomplete_tags == ["JB-1", "JB-2", "JB-3"]
+
+
+def test_tag_lists_are_reused_until_the_generation_changes():
+    df = _junction_boxes()
+    first = tag_lists(df, "Junction Boxes", "gen-1")
+    assert tag_lists(df.iloc[:1], "Junction Boxes", "gen-1") is first
+    assert tag_lists(df.iloc[:1], "Junction Boxes", "gen-2").all_tags == ["JB-1"]
+    assert tag_lists(df, "Junction Boxes", "") is not tag_lists(df, "Junction Boxes", "")
@@ -0,0 +1,26 @@
+from app.construction.tag_search import TagSearchIndex, tokens
+
+
+def test_whole_tag_prefix_ranks_before_token_and_substring_matches():
+    index = TagSearchIndex(["JB-TRA-01", "XTRA-5", "TRA-0007", "TRAY-2"])
+
+    assert index.search("tra") == ["TRA-0007", "TRAY-2", "JB-TRA-01", "XTRA-5"]
+    assert index.search("tr") == ["TRA-0007", "TRAY-2", "JB-TRA-01"]
+    assert index.search("TRA-00") == ["TRA-0007"]
+
+
+def test_numbers_match_without_leading_zeros_and_inside_tags():
+    index = TagSearchIndex(["CAB-0007", "CAB-0070", "CAB-1700"])
+
+    assert "7" in tokens("CAB-0007")
+    assert index.search("7") == ["CAB-0007", "CAB-0070"]
+    assert index.search("700") == ["CAB-1700"]
+    assert index.search("b-00") == ["CAB-0007", "CAB-0070"]
+
+
+def test_results_are_capped_and_blank_query_lists_first_tags():
+    index = TagSearchIndex([f"T-{n:04d}" for n in range(100)])
+
+    assert index.search("", limit=3) == ["T-0000", "T-0001", "T-0002"]
+    assert len(index.search("t", limit=5)) == 5
+    assert index.search("zzz") == []
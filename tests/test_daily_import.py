@@ -0,0 +1,100 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from copy import copy
+from datetime import datetime, timedelta
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from app.exports.daily_import import render_daily_imports
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "TimeEntries.xlsx"
+MODIFIED = datetime(2026, 5, 19)
+
+
+def _jobs(count):
+    jobs = []
+    for job_idx in range(count):
+        rows = [
+            ["2026-05-19", "", f"{1000 + n}", f"EMPLOYEE {n}", "JOURNEYMAN", "Y", "9999", "002", "", code, hours, "", "", "", ""]
+            for n in range(5)
+            for code, hours in (("211", 8.0), ("212", 2.5))
+        ]
+        jobs.append((f"05-19-2026 - {2624138000 + job_idx} - Daily Import.xlsx", rows))
+    return jobs
+
+
+def test_parallel_rendering_matches_serial_bytes_and_order():
+    jobs = _jobs(4)
+
+    serial = list(render_daily_imports(str(TEMPLATE), jobs, MODIFIED, workers=1))
+    parallel = list(render_daily_imports(str(TEMPLATE), jobs, MODIFIED, workers=2))
+
+    assert [name for name, _ in parallel] == [name for name, _ in jobs]
+    assert serial == parallel
+
+
+def test_exports_of_different_sizes_share_one_pool():
+    from app.exports import daily_import
+
+    list(render_daily_imports(str(TEMPLATE), _jobs(2), MODIFIED, workers=2))
+    pool = daily_import._pool
+    list(render_daily_imports(str(TEMPLATE), _jobs(3), MODIFIED, workers=3))
+
+    assert pool is not None and daily_import._pool is pool
+
+
+def test_broken_pool_finishes_dated_jobs_serially(monkeypatch):
+    from app.exports import daily_import
+
+    class DyingPool:
+        """Renders the first task, then behaves like a pool whose worker process died."""
+
+        def __init__(self):
+            self.submitted = 0
+
+        def submit(self, fn, task):
+            future = Future()
+            if self.submitted == 0:
+                future.set_result(fn(task))
+            else:
+                future.set_exception(BrokenProcessPool("worker died"))
+            self.submitted += 1
+            return future
+
+    jobs = [(name, rows, MODIFIED + timedelta(days=idx)) for idx, (name, rows) in enumerate(_jobs(3))]
+    monkeypatch.setattr(daily_import, "_get_pool", lambda: DyingPool())
+
+    recovered = list(render_daily_imports(str(TEMPLATE), jobs, MODIFIED, workers=2))
+
+    assert recovered == list(render_daily_imports(str(TEMPLATE), jobs, MODIFIED, workers=1))
+
+
+def test_rendered_rows_start_below_template_headers():
+    (_, content), = render_daily_imports(str(TEMPLATE), _jobs(1), MODIFIED, workers=1)
+
+    ws = load_workbook(BytesIO(content)).active
+    assert ws.cell(row=4, column=4).value == "EMPLOYEE 0"
+    assert ws.cell(row=5, column=10).value == "212"
+    assert ws.cell(row=5, column=11).value == 2.5
+
+
+def test_streaming_writer_matches_template_fill(monkeypatch):
+    from app.exports import daily_import
+
+    rows = _jobs(1)[0][1] * 3
+    rows[0][3] = "O'BRIEN & <SONS>"
+    monkeypatch.setattr(daily_import, "STREAMING_MIN_ROWS", 1)
+    streamed = load_workbook(BytesIO(daily_import.render_daily_import(str(TEMPLATE), rows, MODIFIED))).active
+    monkeypatch.setattr(daily_import, "STREAMING_MIN_ROWS", 10 ** 6)
+    filled = load_workbook(BytesIO(daily_import.render_daily_import(str(TEMPLATE), rows, MODIFIED))).active
+
+    assert streamed.max_row == filled.max_row
+    for streamed_row, filled_row in zip(streamed.iter_rows(), filled.iter_rows()):
+        for streamed_cell, filled_cell in zip(streamed_row, filled_row):
+            assert streamed_cell.value == filled_cell.value
+            assert streamed_cell.number_format == filled_cell.number_format
+            assert copy(streamed_cell.font) == copy(filled_cell.font)
+            assert copy(streamed_cell.border) == copy(filled_cell.border)
+    assert streamed.column_dimensions["B"].width == filled.column_dimensions["B"].width
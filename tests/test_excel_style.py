@@ -0,0 +1,79 @@
+from copy import copy
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+from app.utils.excel_style import (
+    apply_named_style,
+    clone_row_block,
+    clone_row_styles,
+    named_style_from_cell,
+    restyle_block,
+)
+
+
+def _template():
+    wb = Workbook()
+    ws = wb.active
+    ws.row_dimensions[2].height = 21
+    ws.cell(row=2, column=1).font = Font(bold=True)
+    ws.cell(row=2, column=2).number_format = "0.00"
+    ws.cell(row=2, column=3).border = Border(bottom=Side(style="thin"))
+    return wb, ws
+
+
+def test_block_clone_matches_single_row_clone():
+    wb, ws = _template()
+    clone_row_block(ws, ws, 2, 3, 50, 4)
+    _, single = _template()
+    for row in range(3, 51):
+        clone_row_styles(single, single, 2, row, 4)
+
+    for row in (3, 27, 50):
+        assert ws.row_dimensions[row].height == 21
+        for col in range(1, 5):
+            ours, theirs = ws.cell(row=row, column=col), single.cell(row=row, column=col)
+            assert copy(ours.font) == copy(theirs.font)
+            assert copy(ours.border) == copy(theirs.border)
+            assert ours.number_format == theirs.number_format
+    assert ws.cell(row=40, column=2).number_format == "0.00"
+
+
+def test_cloned_cells_do_not_share_style_state():
+    wb, ws = _template()
+    clone_row_block(ws, ws, 2, 3, 4, 3)
+
+    ws.cell(row=3, column=1).fill = PatternFill("solid", fgColor="FFFF00")
+
+    assert ws.cell(row=4, column=1).fill.fill_type is None
+    assert ws.cell(row=2, column=1).fill.fill_type is None
+
+
+def test_named_style_applies_to_a_block():
+    wb, ws = _template()
+    name = named_style_from_cell(wb, "Data Row", ws.cell(row=2, column=1))
+    assert named_style_from_cell(wb, "Data Row", ws.cell(row=2, column=2)) == name
+
+    apply_named_style(ws, name, range(5, 9), range(1, 4), row_height=18)
+
+    assert ws.cell(row=8, column=3).style == "Data Row"
+    assert ws.cell(row=8, column=3).font.bold
+    assert ws.row_dimensions[6].height == 18
+
+
+def test_restyle_block_keeps_existing_formats_and_unshares_styles():
+    wb, ws = _template()
+    for row in range(3, 6):
+        ws.cell(row=row, column=1, value="x")
+        ws.cell(row=row, column=2, value=1.5).number_format = "0.00"
+    ws.cell(row=9, column=9, value="outside")
+
+    restyle_block(ws, 2, 5, 1, 3, alignment=Alignment(horizontal="center"))
+
+    assert ws.cell(row=4, column=1).alignment.horizontal == "center"
+    assert ws.cell(row=5, column=2).alignment.horizontal == "center"
+    assert ws.cell(row=5, column=2).number_format == "0.00"
+    assert ws.cell(row=2, column=1).font.bold
+    assert ws.cell(row=9, column=9).alignment.horizontal is None
+    ws.cell(row=3, column=1).font = Font(italic=True)
+    assert not ws.cell(row=4, column=1).font.italic
@@ -0,0 +1,36 @@
+import zipfile
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from app.exports.archive import ExportArchive
+from app.exports.template_cache import load_template
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "TimeEntries.xlsx"
+
+
+def test_workbooks_stream_into_archive_entries():
+    wb = load_template(TEMPLATE)
+    wb.active["D4"] = "ADAM MILLER"
+
+    with ExportArchive() as archive:
+        archive.add_workbook("05-19-2026 - Daily Time.xlsx", wb, datetime(2026, 5, 19))
+        archive.add_bytes("notes.txt", b"ok")
+        data = archive.getvalue()
+
+    with zipfile.ZipFile(BytesIO(data)) as zf:
+        assert zf.namelist() == ["05-19-2026 - Daily Time.xlsx", "notes.txt"]
+        restored = load_workbook(BytesIO(zf.read("05-19-2026 - Daily Time.xlsx")))
+    assert restored.active["D4"].value == "ADAM MILLER"
+
+
+def test_large_archives_spill_to_disk():
+    wb = load_template(TEMPLATE)
+
+    archive = ExportArchive(max_memory=1024)
+    archive.add_workbook("big.xlsx", wb, datetime(2026, 5, 19))
+
+    assert archive.spilled_to_disk
+    assert zipfile.ZipFile(BytesIO(archive.getvalue())).testzip() is None
@@ -0,0 +1,64 @@
+import os
+from datetime import date
+
+import pandas as pd
+
+from app.exports.export_cache import ExportCache, export_key
+
+EXPORT_DATE = date(2026, 5, 19)
+
+
+def test_key_tracks_rows_reference_frames_and_templates(tmp_path):
+    template = tmp_path / "TimeEntries.xlsx"
+    template.write_bytes(b"v1")
+    day = pd.DataFrame({"Name": ["ANN"], "RT Hours": ["8"]})
+    employees = pd.DataFrame({"Employee Name": ["ANN"], "Subsistence Rate": ["50"]})
+
+    key = export_key("package", EXPORT_DATE, [day, employees], [template])
+
+    assert key == export_key("package", EXPORT_DATE, [day.copy(), employees.copy()], [template])
+    assert key == export_key("package", EXPORT_DATE, [pd.DataFrame({"Name": ["ANN"], "RT Hours": [8]}), employees], [template])
+    assert key != export_key("package", EXPORT_DATE, [day.assign(**{"RT Hours": ["9"]}), employees], [template])
+    assert key != export_key("package", EXPORT_DATE, [day, employees.assign(**{"Subsistence Rate": ["0"]})], [template])
+    assert key != export_key("package", date(2026, 5, 20), [day, employees], [template])
+    template.write_bytes(b"v22")
+    assert key != export_key("package", EXPORT_DATE, [day, employees], [template])
+
+
+def test_entries_round_trip_in_order(tmp_path):
+    cache = ExportCache(tmp_path, budget_bytes=1024)
+
+    assert cache.get("k1") is None
+    paths = cache.put("k1", [("b.xlsx", b"bb"), ("a.xlsx", b"a")])
+
+    assert [p.name for p in cache.get("k1")] == ["b.xlsx", "a.xlsx"]
+    assert [p.read_bytes() for p in paths] == [b"bb", b"a"]
+
+
+def test_least_recently_used_entries_are_evicted_over_budget(tmp_path):
+    cache = ExportCache(tmp_path, budget_bytes=250)
+    for age, key in enumerate(["old", "used", "new"]):
+        cache.put(key, [("f.bin", b"x" * 60)])
+        manifest = tmp_path / key / "manifest.json"
+        os.utime(manifest, (1000 + age, 1000 + age))
+    cache.get("used")
+
+    cache.put("newest", [("f.bin", b"x" * 60)])
+
+    assert cache.get("old") is None
+    assert cache.get("used") is not None
+    assert cache.get("new") is not None
+    assert cache.get("newest") is not None
+
+
+def test_pinned_entries_survive_eviction_until_released(tmp_path):
+    cache = ExportCache(tmp_path, budget_bytes=100)
+    with cache.pinned(["a", "b"]):
+        cache.put("a", [("f.bin", b"x" * 60)])
+        cache.put("b", [("f.bin", b"x" * 60)])
+        assert cache.get("a") is not None and cache.get("b") is not None
+        for age, key in enumerate(["a", "b"]):
+            os.utime(tmp_path / key / "manifest.json", (1000 + age, 1000 + age))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
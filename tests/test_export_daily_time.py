@@ -0,0 +1,120 @@
+from datetime import date
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from app.exports.export_cache import ExportCache
+from app.features import export_daily_time as service
+
+EXPORT_DATE = date(2026, 5, 19)
+
+
+def _time_data():
+    return pd.DataFrame(
+        [
+            {"Job Number": "2624138065", "Job Area": "002", "Date": "2026-05-19", "Name": "ANN",
+             "Employee Number": "11", "Trade Class": "JM", "Cost Code": "9999", "RT Hours": "8",
+             "OT Hours": "2", "Comments": "Pipe rack"},
+            {"Job Number": "2624138070", "Job Area": "001", "Date": "2026-05-19", "Name": "BOB",
+             "Employee Number": "12", "Trade Class": "AP", "Cost Code": "1000", "RT Hours": "10",
+             "OT Hours": "0", "Comments": ""},
+            {"Job Number": "2624138065", "Job Area": "002", "Date": "2026-05-20", "Name": "ANN",
+             "Employee Number": "11", "Trade Class": "JM", "Cost Code": "9999", "RT Hours": "8",
+             "OT Hours": "0", "Comments": ""},
+        ]
+    )
+
+
+def _prepare(monkeypatch, tmp_path):
+    cache = ExportCache(tmp_path)
+    monkeypatch.setattr(service, "get_export_cache", lambda: cache)
+    renders = []
+    original = service.render_daily_imports
+
+    def counting(template, jobs, modified, workers=None):
+        jobs = list(jobs)
+        renders.append(len(jobs))
+        return original(template, jobs, modified, workers=1)
+
+    monkeypatch.setattr(service, "render_daily_imports", counting)
+    return renders
+
+
+def test_export_writes_daily_time_and_one_import_per_job(monkeypatch, tmp_path):
+    _prepare(monkeypatch, tmp_path)
+    employees = pd.DataFrame([{"Employee Name": "ANN", "Post To Payroll": "Y", "Time Record Type": "T"}])
+
+    daily_path, job_paths = service.export_daily_time(EXPORT_DATE, _time_data(), employees)
+
+    assert daily_path.name == "05-19-2026 - Daily Time.xlsx"
+    assert [p.name for p in job_paths] == [
+        "05-19-2026 - 2624138065 - Daily Import.xlsx",
+        "05-19-2026 - 2624138070 - Daily Import.xlsx",
+    ]
+    ws = load_workbook(BytesIO(job_paths[0].read_bytes())).active
+    assert [ws.cell(row=4, column=c).value for c in (2, 4, 6, 10, 11)] == ["T", "ANN", "Y", "211", 8]
+    assert ws.cell(row=5, column=10).value == "212"
+
+
+def test_unchanged_day_is_served_from_the_export_cache(monkeypatch, tmp_path):
+    renders = _prepare(monkeypatch, tmp_path)
+    data = _time_data()
+
+    first = service.export_daily_time(EXPORT_DATE, data, pd.DataFrame())
+    # Rows for other dates do not affect the day's export.
+    data.loc[2, "RT Hours"] = "4"
+    second = service.export_daily_time(EXPORT_DATE, data, pd.DataFrame())
+    data.loc[0, "RT Hours"] = "6"
+    third = service.export_daily_time(EXPORT_DATE, data, pd.DataFrame())
+
+    employees = pd.DataFrame([{"Employee Name": "ANN", "Post To Payroll": "Y"}])
+    fourth = service.export_daily_time(EXPORT_DATE, data, employees)
+
+    assert first == second
+    assert third[0].parent != first[0].parent
+    assert fourth[0].parent != third[0].parent
+    assert renders == [2, 2, 2]
+
+
+def test_missing_day_raises_value_error(monkeypatch, tmp_path):
+    _prepare(monkeypatch, tmp_path)
+    with pytest.raises(ValueError, match="2026-05-21"):
+        service.export_daily_time(date(2026, 5, 21), _time_data(), pd.DataFrame())
+
+
+def test_date_range_archive_has_a_folder_per_day_and_reuses_cached_days(monkeypatch, tmp_path):
+    renders = _prepare(monkeypatch, tmp_path)
+    data = _time_data()
+    service.export_daily_time(EXPORT_DATE, data, pd.DataFrame())
+
+    content = service.export_date_range(date(2026, 5, 18), date(2026, 5, 22), data, pd.DataFrame())
+
+    names = sorted(zipfile.ZipFile(BytesIO(content)).namelist())
+    assert names == [
+        "2026-05-19/05-19-2026 - 2624138065 - Daily Import.xlsx",
+        "2026-05-19/05-19-2026 - 2624138070 - Daily Import.xlsx",
+        "2026-05-19/05-19-2026 - Daily Time.xlsx",
+        "2026-05-20/05-20-2026 - 2624138065 - Daily Import.xlsx",
+        "2026-05-20/05-20-2026 - Daily Time.xlsx",
+    ]
+    # 2026-05-19 was already exported; only 2026-05-20 is rendered.
+    assert renders == [2, 1]
+
+
+def test_range_export_keeps_its_days_cached_until_they_are_archived(monkeypatch, tmp_path):
+    _prepare(monkeypatch, tmp_path)
+    cache = ExportCache(tmp_path / "tiny", budget_bytes=1)  # every store is over budget
+    monkeypatch.setattr(service, "get_export_cache", lambda: cache)
+
+    content = service.export_date_range(date(2026, 5, 19), date(2026, 5, 20), _time_data(), pd.DataFrame())
+
+    assert len(zipfile.ZipFile(BytesIO(content)).namelist()) == 5
+    assert not any((tmp_path / "tiny").iterdir())  # evicted once the build let go
+
+
+def test_pay_period_bounds():
+    assert service.pay_period_bounds(date(2026, 5, 19), anchor=date(2026, 5, 4)) == (date(2026, 5, 18), date(2026, 5, 31))
+    assert service.pay_period_bounds(date(2026, 5, 3), anchor=date(2026, 5, 4)) == (date(2026, 4, 20), date(2026, 5, 3))
@@ -0,0 +1,112 @@
+from datetime import date
+
+import pandas as pd
+
+from app.exports.engine import (
+    PAY_CODE_RULES, employees_from_list, expand_import_rows, import_rows_by_job, resolve_employees,
+)
+
+EXPORT_DATE = date(2026, 5, 19)
+
+
+def _clean(val):
+    if pd.isna(val) or str(val).lower() in ["nan", "none", ""]:
+        return ""
+    return str(val)
+
+
+def _reference_rows(entries, employee_info):
+    """Row-at-a-time expansion the Timesheet Entry export used before the engine."""
+    rows = []
+    for _, row in entries.iterrows():
+        emp_info = employee_info.get(str(row.get("Name", "")), {})
+        premium_rate = _clean(emp_info.get("premium_rate", "")) or _clean(row.get("Premium Rate", ""))
+        subsistence_rate = _clean(emp_info.get("subsistence", "")) or _clean(row.get("Subsistence Rate", ""))
+        travel_rate = _clean(emp_info.get("travel_rate", "")) or _clean(row.get("Travel Rate", ""))
+        night_shift = _clean(emp_info.get("night_shift", "")) or _clean(row.get("Night Shift", ""))
+        rate_cell = "NS" if night_shift else (subsistence_rate or premium_rate or travel_rate)
+        base = [
+            EXPORT_DATE.strftime("%Y-%m-%d"), _clean(emp_info.get("time_record_type", "")),
+            _clean(row.get("Employee Number", "")), _clean(row.get("Name", "")),
+            _clean(row.get("Trade Class", "")), _clean(emp_info.get("post_to_payroll", "")),
+            _clean(row.get("Cost Code", "")), str(row.get("Job Area", "")).strip(), "", "211", 0.0,
+            night_shift, rate_cell, "",
+        ]
+        for code, hours in (("211", float(row.get("RT Hours", 0) or 0)), ("212", float(row.get("OT Hours", 0) or 0))):
+            if hours > 0:
+                rows.append(base[:9] + [code, hours] + base[11:])
+        try:
+            if subsistence_rate and float(subsistence_rate) > 0:
+                rows.append(base[:9] + ["261", 1.0] + base[11:])
+        except ValueError:
+            pass
+    return rows
+
+
+def _entries():
+    return pd.DataFrame(
+        [
+            {"Job Number": "J1", "Job Area": "002", "Name": "ANN", "Employee Number": "11", "Trade Class": "JM",
+             "Cost Code": "9999", "RT Hours": "8", "OT Hours": "2", "Night Shift": "", "Premium Rate": "",
+             "Subsistence Rate": "", "Travel Rate": ""},
+            {"Job Number": "J2", "Job Area": "", "Name": "BOB", "Employee Number": "12", "Trade Class": "AP",
+             "Cost Code": "1000", "RT Hours": 10.0, "OT Hours": 0, "Night Shift": "Y", "Premium Rate": "3",
+             "Subsistence Rate": "50", "Travel Rate": ""},
+            {"Job Number": "J1 ", "Job Area": "001", "Name": "CAL", "Employee Number": None, "Trade Class": "JM",
+             "Cost Code": "9999", "RT Hours": "", "OT Hours": "4.5", "Night Shift": None, "Premium Rate": "",
+             "Subsistence Rate": "n/a", "Travel Rate": "7"},
+            {"Job Number": "J3", "Job Area": "003", "Name": "DEE", "Employee Number": "14", "Trade Class": "JM",
+             "Cost Code": "9999", "RT Hours": 0, "OT Hours": 0, "Night Shift": "", "Premium Rate": "",
+             "Subsistence Rate": "", "Travel Rate": ""},
+        ]
+    )
+
+
+EMPLOYEE_INFO = {
+    "ANN": {"premium_rate": "", "subsistence": "40", "travel_rate": "", "night_shift": "",
+            "time_record_type": "T", "post_to_payroll": "Y"},
+    "BOB": {"premium_rate": "", "subsistence": "", "travel_rate": "", "night_shift": "",
+            "time_record_type": "", "post_to_payroll": "N"},
+}
+
+
+def test_expansion_matches_row_at_a_time_reference():
+    entries = _entries()
+    employees = resolve_employees(entries["Name"], lambda name: EMPLOYEE_INFO.get(name, {}))
+
+    expanded = expand_import_rows(entries, EXPORT_DATE, employees)
+
+    assert expanded.drop(columns="Job Number").values.tolist() == _reference_rows(entries, EMPLOYEE_INFO)
+    assert expanded["Job Number"].tolist() == ["J1", "J1", "J1", "J2", "J2", "J1"]
+
+
+def test_rows_group_by_stripped_job_and_keep_empty_jobs():
+    entries = _entries()
+    jobs = import_rows_by_job(entries, EXPORT_DATE)
+
+    assert [job for job, _ in jobs] == ["J1", "J2", "J3"]
+    assert [row[9] for row in jobs[0][1]] == ["211", "212", "212"]
+    assert jobs[2][1] == []
+
+
+def test_rules_without_a_source_column_are_skipped():
+    entries = _entries().drop(columns=["Subsistence Rate"])
+    rules = PAY_CODE_RULES[PAY_CODE_RULES["Pay Type"] != "SUBSISTENCE"]
+
+    expanded = expand_import_rows(entries, EXPORT_DATE, rules=rules)
+
+    assert set(expanded["Pay Code"]) == {"211", "212"}
+
+
+def test_timeentries_export_rows_come_from_the_engine():
+    from app.exports.timeentries_export import _build_rows
+
+    entries = _entries()
+    employees = employees_from_list(pd.DataFrame({"Employee Name": ["ANN"], "Post To Payroll": ["N"], "Subsistence Rate": ["40"]}))
+
+    rows = _build_rows(entries[entries["Job Number"] == "J1"], EXPORT_DATE, employees)
+
+    assert rows.values.tolist() == import_rows_by_job(entries.iloc[:1], EXPORT_DATE, employees)[0][1]
+    assert rows["Pay Code"].tolist() == ["211", "212", "261"]
+    assert rows["Cost Code / Phase"].tolist() == ["9999"] * 3
+    assert set(rows["Post To Payroll"]) == {"N"}
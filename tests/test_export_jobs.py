@@ -0,0 +1,58 @@
+import json
+import threading
+
+from app.exports.jobs import DONE, FAILED, ExportJobs, job_id_for
+
+
+def test_job_reports_progress_and_persists_its_archive(tmp_path):
+    jobs = ExportJobs(tmp_path)
+    job_id = job_id_for("range", "2026-05-18")
+    seen = []
+
+    def build(progress):
+        progress(0.5, "half way")
+        seen.append(jobs.get(job_id)["message"])
+        return b"zip-bytes"
+
+    assert jobs.submit(job_id, "May 18", "range.zip", build) == job_id
+    job = jobs.wait(job_id)
+
+    assert job["status"] == DONE and job["progress"] == 1.0
+    assert seen == ["half way"]
+    assert jobs.result(job_id) == b"zip-bytes"
+    # A new process (or store instance) still finds the finished archive.
+    assert ExportJobs(tmp_path).result(job_id) == b"zip-bytes"
+
+
+def test_resubmitting_a_live_or_finished_job_does_not_restart_it(tmp_path):
+    jobs = ExportJobs(tmp_path)
+    release = threading.Event()
+    calls = []
+
+    def build(progress):
+        calls.append(1)
+        release.wait(5)
+        return b"data"
+
+    job_id = jobs.submit("same", "label", "out.zip", build)
+    assert jobs.submit("same", "label", "out.zip", build) == job_id
+    release.set()
+    jobs.wait(job_id)
+    jobs.submit("same", "label", "out.zip", build)
+
+    assert calls == [1]
+
+
+def test_failures_and_interrupted_jobs_are_reported(tmp_path):
+    jobs = ExportJobs(tmp_path)
+
+    def build(progress):
+        raise ValueError("No time entries found from 2026-05-01 to 2026-05-14.")
+
+    failed = jobs.wait(jobs.submit("bad", "label", "out.zip", build))
+    assert failed["status"] == FAILED
+    assert "No time entries" in failed["error"]
+    assert jobs.result("bad") is None
+
+    (tmp_path / "stale.json").write_text(json.dumps({"id": "stale", "status": "running", "created": 1}))
+    assert ExportJobs(tmp_path).get("stale")["status"] == FAILED
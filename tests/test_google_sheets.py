@@ -1,4 +1,8 @@
-from app.integrations.google_sheets import _values_to_dataframe
+import re
+import threading
+import time
+
+from app.integrations.google_sheets import GoogleSheetsManager, _values_to_dataframe, frame_generation
 
 
 def test_values_to_dataframe_preserves_formatted_job_area_text():
@@ -12,3 +16,257 @@ def test_values_to_dataframe_preserves_formatted_job_area_text():
 
     assert df.loc[0, "Job Area"] == "900"
     assert df.loc[1, "Job Area"] == "003"
+
+
+class _FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+
+    def batch_update(self, body):
+        for request in body["requests"]:
+            index = request["deleteDimension"]["range"]["startIndex"]
+            del self.worksheet.grid[index]
+
+
+class _FakeWorksheet:
+    """Minimal in-memory stand-in for the gspread calls used by keyed row operations."""
+
+    id = 0
+    title = "Time Data"
+
+    def __init__(self, grid):
+        self.grid = [list(row) for row in grid]
+        self.spreadsheet = _FakeSpreadsheet(self)
+        self.reads = []
+        self.updates = []
+        self.writes = []
+        self.hold = None
+
+    @staticmethod
+    def _cell(ref):
+        letters, digits = re.fullmatch(r"([A-Z]+)(\d*)", ref).groups()
+        col = 0
+        for ch in letters:
+            col = col * 26 + ord(ch) - 64
+        return col - 1, int(digits) - 1 if digits else None
+
+    def get_all_records(self):
+        raise NotImplementedError
+
+    def get_all_values(self, **_):
+        snapshot = [list(row) for row in self.grid]
+        if self.hold is not None:
+            self.hold.wait(5)
+        return snapshot
+
+    def batch_get(self, ranges, **_):
+        self.reads.append(list(ranges))
+        blocks = []
+        for ref in ranges:
+            whole_row = re.fullmatch(r"(\d+):\1", ref)
+            if whole_row:
+                index = int(whole_row.group(1)) - 1
+                blocks.append([self.grid[index]] if index < len(self.grid) else [])
+                continue
+            start, _, end = ref.partition(":")
+            col, row = self._cell(start)
+            if end:
+                blocks.append([[r[col]] for r in self.grid[row:]])
+            elif row < len(self.grid):
+                blocks.append([[self.grid[row][col]]])
+            else:
+                blocks.append([])
+        return blocks
+
+    def batch_update(self, data, value_input_option=None):
+        self.writes.append([item["range"] for item in data])
+        for item in data:
+            col, row = self._cell(item["range"])
+            self.grid[row][col] = item["values"][0][0]
+
+    def update(self, values, range_name=None, value_input_option=None):
+        self.updates.append(range_name)
+        start, _, _ = range_name.partition(":")
+        col, row = self._cell(start)
+        for offset, value in enumerate(values[0]):
+            self.grid[row][col + offset] = value
+
+    def append_rows(self, rows, value_input_option=None):
+        first = len(self.grid) + 1
+        self.grid.extend(list(row) for row in rows)
+        return {"updates": {"updatedRange": f"'Time Data'!A{first}:C{len(self.grid)}"}}
+
+
+def _manager(worksheet):
+    manager = GoogleSheetsManager()
+    manager.find_worksheet = lambda names, spreadsheet_id=None: (worksheet, worksheet.title)
+    return manager
+
+
+def _sheet():
+    return _FakeWorksheet([
+        ["Name", "RT Hours", "Entry ID"],
+        ["ADAM MILLER", "8", "A1"],
+        ["TRAVIS TYCHKOWSKY", "7", "B2"],
+        ["ADAM MILLER", "4", "C3"],
+    ])
+
+
+def test_row_index_tracks_appends_and_deletes():
+    sheet = _sheet()
+    manager = _manager(sheet)
+
+    assert manager.get_row_index("Time Data", "Entry ID", "sheet") == {"A1": 2, "B2": 3, "C3": 4}
+
+    assert manager.append_rows("Time Data", [["NEW PERSON", "2", "D4"]], "sheet")
+    assert manager.get_row_index("Time Data", "Entry ID", "sheet")["D4"] == 5
+
+    assert manager.delete_rows_by_key("Time Data", "Entry ID", ["B2"], "sheet")
+    assert [row[2] for row in sheet.grid] == ["Entry ID", "A1", "C3", "D4"]
+    assert manager.get_row_index("Time Data", "Entry ID", "sheet") == {"A1": 2, "C3": 3, "D4": 4}
+
+
+def test_update_rows_by_key_writes_only_target_cells_and_reindexes_stale_rows():
+    sheet = _sheet()
+    manager = _manager(sheet)
+    manager.get_row_index("Time Data", "Entry ID", "sheet")
+
+    # Another user deletes the first data row; the cached row numbers are now stale.
+    del sheet.grid[1]
+
+    assert manager.update_rows_by_key("Time Data", "Entry ID", {"C3": {"RT Hours": 6}}, "sheet")
+    assert sheet.grid[2] == ["ADAM MILLER", 6, "C3"]
+    assert sheet.grid[1] == ["TRAVIS TYCHKOWSKY", "7", "B2"]
+
+
+def test_update_row_by_key_sends_one_batch_update():
+    sheet = _sheet()
+    manager = _manager(sheet)
+
+    written = manager.update_row_by_key(
+        "Time Data", "Entry ID", "B2", {"RT Hours": "7.5"}, expected={"RT Hours": "7.00"}, spreadsheet_id="sheet"
+    )
+
+    assert sheet.writes == [["B3"]]
+    assert written == {"Name": "TRAVIS TYCHKOWSKY", "RT Hours": "7.5", "Entry ID": "B2"}
+
+
+def test_update_row_by_key_leaves_unedited_cells_between_edits_alone():
+    sheet = _sheet()
+    manager = _manager(sheet)
+    read_row = sheet.batch_get
+
+    def read_then_concurrent_edit(ranges, **kwargs):
+        blocks = read_row(ranges, **kwargs)
+        if ranges == ["3:3"]:
+            sheet.grid[2][1] = "9"  # someone else edits RT Hours after the row was read
+        return blocks
+
+    sheet.batch_get = read_then_concurrent_edit
+    written = manager.update_row_by_key(
+        "Time Data", "Entry ID", "B2", {"Name": "TRAVIS T", "Entry ID": "B2"}, spreadsheet_id="sheet"
+    )
+
+    assert sheet.writes == [["A3", "C3"]]
+    assert sheet.grid[2] == ["TRAVIS T", "9", "B2"]
+    assert written["Name"] == "TRAVIS T"
+
+
+def test_update_row_by_key_refuses_when_row_changed():
+    sheet = _sheet()
+    manager = _manager(sheet)
+
+    written = manager.update_row_by_key(
+        "Time Data", "Entry ID", "B2", {"RT Hours": "7.5"}, expected={"RT Hours": "6"}, spreadsheet_id="sheet"
+    )
+
+    assert written is None
+    assert sheet.updates == []
+    assert sheet.grid[2][1] == "7"
+
+
+def test_update_rows_by_key_uses_cached_frame_for_the_row_index():
+    sheet = _sheet()
+    manager = _manager(sheet)
+    manager._data_cache["Time Data"] = (time.time(), _values_to_dataframe(sheet.grid))
+
+    assert manager.update_rows_by_key("Time Data", "Entry ID", {"B2": {"RT Hours": "7.5", "Name": "T. TYCHKOWSKY"}}, "sheet")
+
+    # One read (header plus the key cell) and one write covering both columns.
+    assert sheet.reads == [["1:1", "C3"]]
+    assert sheet.writes == [["B3", "A3"]]
+    assert sheet.grid[2] == ["T. TYCHKOWSKY", "7.5", "B2"]
+    assert "Time Data" not in manager._data_cache
+
+
+def test_stale_cached_frame_falls_back_to_reindexing():
+    sheet = _sheet()
+    manager = _manager(sheet)
+    manager._data_cache["Time Data"] = (time.time(), _values_to_dataframe(sheet.grid))
+    del sheet.grid[1]
+
+    assert manager.update_rows_by_key("Time Data", "Entry ID", {"C3": {"RT Hours": "5"}}, "sheet")
+
+    assert sheet.grid[2] == ["ADAM MILLER", "5", "C3"]
+    assert sheet.grid[1][1] == "7"
+
+
+def test_duplicate_keys_resolve_to_the_first_row_on_both_index_paths():
+    def duplicated():
+        sheet = _sheet()
+        sheet.grid[3][2] = "A1"
+        return sheet
+
+    from_sheet = duplicated()
+    assert _manager(from_sheet).update_rows_by_key("Time Data", "Entry ID", {"A1": {"RT Hours": "1"}}, "sheet")
+
+    from_frame = duplicated()
+    manager = _manager(from_frame)
+    manager._data_cache["Time Data"] = (time.time(), _values_to_dataframe(from_frame.grid))
+    assert manager.update_rows_by_key("Time Data", "Entry ID", {"A1": {"RT Hours": "1"}}, "sheet")
+
+    for sheet in (from_sheet, from_frame):
+        assert [row[1] for row in sheet.grid[1:]] == ["1", "7", "4"]
+
+
+def _settle(manager, name="Time Data"):
+    deadline = time.time() + 5
+    while manager.is_refreshing(name) and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_stale_reads_serve_the_cache_and_refresh_in_the_background():
+    sheet = _sheet()
+    manager = _manager(sheet)
+    first = manager.read_worksheet_swr("Time Data", "sheet")
+    generation = frame_generation(first)
+    assert generation and manager.data_generation("Time Data") == generation
+
+    sheet.grid[1][1] = "9"
+    assert manager.read_worksheet_swr("Time Data", "sheet").loc[0, "RT Hours"] == "8"
+    assert not manager.is_refreshing("Time Data")
+
+    assert manager.read_worksheet_swr("Time Data", "sheet", stale_after=0).loc[0, "RT Hours"] == "8"
+    _settle(manager)
+    refreshed = manager.read_worksheet_swr("Time Data", "sheet")
+    assert refreshed.loc[0, "RT Hours"] == "9"
+    assert frame_generation(refreshed) == manager.data_generation("Time Data") != generation
+
+
+def test_unchanged_refresh_keeps_the_generation_and_writes_win_over_refreshes():
+    sheet = _sheet()
+    manager = _manager(sheet)
+    generation = frame_generation(manager.read_worksheet_swr("Time Data", "sheet"))
+    manager.read_worksheet_swr("Time Data", "sheet", stale_after=0)
+    _settle(manager)
+    assert manager.data_generation("Time Data") == generation
+
+    sheet.hold = threading.Event()
+    manager.read_worksheet_swr("Time Data", "sheet", stale_after=0)
+    assert manager.update_rows_by_key("Time Data", "Entry ID", {"A1": {"RT Hours": "10"}}, "sheet")
+    sheet.hold.set()
+    _settle(manager)
+    sheet.hold = None
+
+    # The refresh started before the write and is discarded; the next read fetches the written row.
+    assert manager.read_worksheet_swr("Time Data", "sheet").loc[0, "RT Hours"] == "10"
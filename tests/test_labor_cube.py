@@ -0,0 +1,56 @@
+import pandas as pd
+
+from app.data.labor_cube import LaborCube
+
+
+def _time_data():
+    return pd.DataFrame(
+        {
+            "Date": ["2026-05-18", "2026-05-18", "2026-05-19", "2026-05-25"],
+            "Job Number": ["2624138043", "2624138043", "2624138040", "2624138043"],
+            "Job Area": ["002", "002", "900", "002"],
+            "Cost Code": ["00002-170-53", "00002-170-53", "00002-170-10", "00002-170-53"],
+            "Name": ["ADAM MILLER", "TRAVIS TYCHKOWSKY", "ADAM MILLER", "ADAM MILLER"],
+            "Indirect": ["FALSE", "TRUE", "FALSE", "FALSE"],
+            "RT Hours": ["8", "10", "7.5", "8"],
+            "OT Hours": ["2", "", "", "1"],
+        }
+    )
+
+
+def test_daily_and_weekly_summaries():
+    cube = LaborCube.from_time_data(_time_data())
+
+    daily = cube.daily_summary("2026-05-18", by=["Name"]).set_index("Name")
+    weekly = cube.weekly_summary("2026-05-18", by=["Job Number"]).set_index("Job Number")
+
+    assert daily.loc["ADAM MILLER", "RT Hours"] == 8.0
+    assert daily.loc["ADAM MILLER", "OT Hours"] == 2.0
+    assert weekly.loc["2624138043", "Rows"] == 2
+    assert weekly.loc["2624138040", "RT Hours"] == 7.5
+
+
+def test_query_filters_any_dimension_combination():
+    cube = LaborCube.from_time_data(_time_data())
+
+    result = cube.query(by=["Date"], Name="ADAM MILLER", Job_Area="002")
+    totals = cube.query(Indirect=True)
+
+    assert result["Date"].tolist() == ["2026-05-18", "2026-05-25"]
+    assert totals.loc[0, "RT Hours"] == 10.0
+    assert totals.loc[0, "Rows"] == 1
+
+
+def test_incremental_append_and_remove_match_full_rebuild():
+    df = _time_data()
+    cube = LaborCube.from_time_data(df.iloc[:2])
+
+    cube.append(df.iloc[2:])
+    cube.remove(df.iloc[[1]])
+
+    expected = LaborCube.from_time_data(df.drop(index=1))
+    by = ["Date", "Name", "Job Number"]
+    assert cube.query(by=by).sort_values(by).reset_index(drop=True).equals(
+        expected.query(by=by).sort_values(by).reset_index(drop=True)
+    )
+    assert len(cube) == 3
@@ -0,0 +1,38 @@
+import os
+import shutil
+
+from app.exports import template_cache
+from app.exports.template_cache import load_template, template_bytes
+
+
+def test_template_is_read_once_per_file_version(tmp_path, monkeypatch):
+    template = tmp_path / "TimeEntries.xlsx"
+    shutil.copyfile(os.path.join(os.path.dirname(__file__), "..", "TimeEntries.xlsx"), template)
+    template_cache.clear_template_cache()
+    reads = []
+    real_open = open
+
+    def counting_open(path, mode="r", *args, **kwargs):
+        if str(path) == str(template.resolve()):
+            reads.append(mode)
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    first = template_bytes(template)
+    assert template_bytes(template) is first
+    assert len(reads) == 1
+
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    template_bytes(template)
+    assert len(reads) == 2
+
+
+def test_loaded_templates_are_independent():
+    path = os.path.join(os.path.dirname(__file__), "..", "TimeEntries.xlsx")
+
+    first = load_template(path)
+    first.active["D4"] = "EDITED"
+    second = load_template(path)
+
+    assert second.active["D4"].value != "EDITED"
@@ -1,6 +1,8 @@
 import pandas as pd
 
 from app.data.time_data import (
+    ensure_entry_ids,
+    new_entry_id,
     normalize_job_area_value,
     normalize_sheet_value,
     prepare_time_data_dataframe,
@@ -34,3 +36,21 @@ def test_prepare_time_data_keeps_job_area_text_exact():
     prepared = prepare_time_data_dataframe(df)
 
     assert prepared.loc[0, "Job Area"] == "002"
+
+
+def test_entry_ids_are_time_ordered_ulids():
+    earlier = new_entry_id(timestamp_ms=1_700_000_000_000)
+    later = new_entry_id(timestamp_ms=1_700_000_000_001)
+
+    assert len(earlier) == 26
+    assert earlier < later
+
+
+def test_ensure_entry_ids_fills_only_blank_ids():
+    df = pd.DataFrame({"Name": ["ADAM MILLER", "TRAVIS TYCHKOWSKY"], "Entry ID": ["01KEEP", ""]})
+
+    filled = ensure_entry_ids(df)
+
+    assert filled.loc[0, "Entry ID"] == "01KEEP"
+    assert len(filled.loc[1, "Entry ID"]) == 26
+    assert df.loc[1, "Entry ID"] == ""
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from app.data.time_data import prepare_time_data_dataframe
+from app.data.time_schema import (
+    compact_memory_report,
+    to_compact_time_data,
+    to_sheet_time_data,
+)
+
+
+def _sample_time_data():
+    return pd.DataFrame(
+        {
+            "Job Number": ["2624138043", "2624138043", "2624138043"],
+            "Job Area": ["002", "900", "002"],
+            "Date": ["2026-05-19", "2026-05-19", ""],
+            "Name": ["ADAM MILLER", "TRAVIS TYCHKOWSKY", "ADAM MILLER"],
+            "RT Hours": [8, 7.33, ""],
+            "OT Hours": [2.25, 0, 1],
+            "Comments": ["PULLED CABLE", "PULLED CABLE", ""],
+        }
+    )
+
+
+def test_compact_schema_uses_compact_dtypes():
+    compact = to_compact_time_data(_sample_time_data())
+
+    assert isinstance(compact["Name"].dtype, pd.CategoricalDtype)
+    assert isinstance(compact["Job Area"].dtype, pd.CategoricalDtype)
+    assert compact["RT Hours"].dtype == "float32"
+    assert pd.api.types.is_datetime64_any_dtype(compact["Date"].dtype)
+    assert compact["Comments"].iloc[0] is compact["Comments"].iloc[1]
+
+
+def test_compact_schema_round_trips_to_sheet_values():
+    df = _sample_time_data()
+
+    restored = to_sheet_time_data(to_compact_time_data(df))
+    expected = prepare_time_data_dataframe(df)
+
+    assert restored.astype(object).values.tolist() == expected.astype(object).values.tolist()
+    assert restored.loc[0, "Job Area"] == "002"
+    assert restored.loc[1, "RT Hours"] == "7.33"
+
+
+def test_unparseable_hours_fall_back_to_categorical_without_loss():
+    df = pd.DataFrame({"RT Hours": ["8", "eight"], "Date": ["2026-05-19", "2026-05-19"]})
+
+    compact = to_compact_time_data(df)
+
+    assert isinstance(compact["RT Hours"].dtype, pd.CategoricalDtype)
+    assert to_sheet_time_data(compact)["RT Hours"].tolist() == ["8", "eight"]
+
+
+def test_memory_report_includes_total_row():
+    report = compact_memory_report(_sample_time_data())
+
+    assert report.iloc[-1]["Column"] == "Total"
+    assert report.iloc[-1]["Sheet Bytes"] == report.iloc[:-1]["Sheet Bytes"].sum()
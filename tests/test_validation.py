@@ -0,0 +1,55 @@
+import pandas as pd
+
+from app.data.validation import validate_time_entries
+
+
+def _line(name, rt, ot=0, job="2624138043", area="002", code="00002-170-53", date="2026-05-19"):
+    return {
+        "Name": name,
+        "Date": date,
+        "Job Number": job,
+        "Job Area": area,
+        "Cost Code": code,
+        "RT Hours": rt,
+        "OT Hours": ot,
+    }
+
+
+def test_daily_total_includes_existing_rows():
+    existing = pd.DataFrame([_line("ADAM MILLER", "10", "", code="00002-170-10")])
+    batch = pd.DataFrame([_line("Adam Miller", 8, 7), _line("TRAVIS TYCHKOWSKY", 8)])
+
+    result = validate_time_entries(batch, existing)
+
+    assert result.loc[0, "Daily Total"] == 25.0
+    assert bool(result.loc[0, "Over Daily Limit"])
+    assert not bool(result.loc[1, "Over Daily Limit"])
+    assert result["Valid"].tolist() == [False, True]
+
+
+def test_quarter_hours_and_unparseable_hours_are_flagged():
+    batch = pd.DataFrame([_line("A", 8.1), _line("B", "eight"), _line("C", 7.75)])
+
+    result = validate_time_entries(batch)
+
+    assert result["Quarter Hour"].tolist() == [False, True, True]
+    assert result["Hours Valid"].tolist() == [True, False, True]
+    assert "0.25 increments" in result.loc[0, "Issues"]
+
+
+def test_duplicate_keys_within_batch_and_against_existing():
+    existing = pd.DataFrame([_line("A", 8, area="2")])
+    batch = pd.DataFrame([_line("A", 2, area="2"), _line("B", 4), _line("B", 4), _line("C", 4)])
+
+    result = validate_time_entries(batch, existing)
+
+    assert result["Duplicate"].tolist() == [True, True, True, False]
+
+
+def test_unknown_job_and_cost_codes():
+    batch = pd.DataFrame([_line("A", 8, job="999"), _line("B", 8, code="BAD")])
+
+    result = validate_time_entries(batch, known_jobs=["2624138043"], known_cost_codes=["00002-170-53"])
+
+    assert result["Unknown Job"].tolist() == [True, False]
+    assert result["Unknown Cost Code"].tolist() == [False, True]